@@ -2,8 +2,6 @@ import math
 import os
 import time
 
-import shapely
-
 from pyedb.generic.constants import CSS4_COLORS
 
 
@@ -127,6 +125,7 @@ class CommonNets:
 
         fig = plt.figure(figsize=figsize)
         ax = fig.add_subplot(1, 1, 1)
+        import shapely
         from shapely import affinity
         from shapely.geometry import (
             LinearRing,
@@ -39,6 +39,7 @@ from typing import Union
 import warnings
 from zipfile import ZipFile as zpf
 
+import numpy as np
 import rtree
 
 from pyedb.configuration.configuration import Configuration
@@ -46,6 +47,7 @@ from pyedb.dotnet.application.Variables import decompose_variable_value
 from pyedb.dotnet.edb_core.cell.layout import Layout
 from pyedb.dotnet.edb_core.cell.terminal.terminal import Terminal
 from pyedb.dotnet.edb_core.components import Components
+from pyedb.dotnet.edb_core.cutout_plan import CutoutPlan
 from pyedb.dotnet.edb_core.dotnet.database import Database
 from pyedb.dotnet.edb_core.edb_data.control_file import (
     ControlFile,
@@ -69,6 +71,7 @@ from pyedb.dotnet.edb_core.edb_data.simulation_configuration import (
 )
 from pyedb.dotnet.edb_core.edb_data.sources import SourceType
 from pyedb.dotnet.edb_core.edb_data.variables import Variable
+from pyedb.dotnet.edb_core.extent_cache import ExtentCache
 from pyedb.dotnet.edb_core.general import (
     LayoutObjType,
     Primitives,
@@ -104,6 +107,7 @@ from pyedb.generic.general_methods import (
 )
 from pyedb.generic.process import SiwaveSolve
 from pyedb.generic.settings import settings
+from pyedb.generic.value_parser import parse_value
 from pyedb.ipc2581.ipc2581 import Ipc2581
 from pyedb.modeler.geometry_operators import GeometryOperators
 from pyedb.workflow import Workflow
@@ -362,8 +366,11 @@ class Edb(Database):
         self._active_cell = None
         self._layout = None
         self._configuration = None
+        self._extent_cache = None
+        self._extent_builder = None
 
     def _init_objects(self):
+        self._layout = Layout(self, self._active_cell.GetLayout())
         self._components = Components(self)
         self._stackup = Stackup(self, self.layout.layer_collection)
         self._padstack = EdbPadstacks(self)
@@ -373,6 +380,8 @@ class Edb(Database):
         self._core_primitives = Modeler(self)
         self._stackup2 = self._stackup
         self._materials = Materials(self)
+        self._extent_cache = ExtentCache(self)
+        self._extent_builder = None
 
     @property
     def cell_names(self):
@@ -1029,6 +1038,47 @@ class Edb(Database):
             self._nets = EdbNets(self)
         return self._nets
 
+    @property
+    def extent_cache(self):
+        """Cache of the cutout extents, saved next to the ``.aedb`` folder.
+
+        Returns
+        -------
+        :class:`pyedb.dotnet.edb_core.extent_cache.ExtentCache`
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myproject.aedb")
+        >>> edbapp.cutout(["DDR4_DQ0"], ["GND"], use_extent_cache=True)
+        >>> edbapp.cutout(["DDR4_DQ0"], ["GND", "VDD"], use_extent_cache=True, output_aedb_path="cutout_2.aedb")
+        """
+        if self._extent_cache is None:
+            self._extent_cache = ExtentCache(self)
+        return self._extent_cache
+
+    @property
+    def extent_builder(self):
+        """Builder of the shapely cutout extents, caching the footprint of each net.
+
+        Returns
+        -------
+        :class:`pyedb.dotnet.edb_core.extent_builder.ExtentBuilder`
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myproject.aedb")
+        >>> edbapp.cutout(["DDR4_DQ0"], ["GND"], cutout_backend="shapely", plan=True)
+        >>> edbapp.cutout(["DDR4_DQ0", "DDR4_DQ1"], ["GND"], cutout_backend="shapely", plan=True)
+        """
+        # Shapely is an optional dependency, imported only when the builder is first used.
+        from pyedb.dotnet.edb_core.extent_builder import ExtentBuilder
+
+        if self._extent_builder is None:
+            self._extent_builder = ExtentBuilder(self)
+        return self._extent_builder
+
     @property
     def net_classes(self):
         """Get all net classes.
@@ -1130,7 +1180,9 @@ class Edb(Database):
         -------
         :class:`legacy.edb_core.dotnet.layout.Layout`
         """
-        return Layout(self, self._active_cell.GetLayout())
+        if self._layout is None:
+            self._layout = Layout(self, self._active_cell.GetLayout())
+        return self._layout
 
     @property
     def active_layout(self):
@@ -1253,6 +1305,33 @@ class Edb(Database):
         """
         return self.edb_api.utility.value(val)
 
+    def value_to_float(self, val):
+        """Convert a value to a float in SI units.
+
+        Numbers and value strings with units, like ``"0.1mm"`` or ``"10nH"``, are parsed in Python and the
+        results are cached. Only expressions and variables are evaluated with EDB.
+
+        Parameters
+        ----------
+        val : str, float, int
+
+
+        Returns
+        -------
+        float
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb()
+        >>> edbapp.value_to_float("10mil")
+        0.000254
+        """
+        value = parse_value(val)
+        if value is None:
+            value = self.edb_value(val).ToDouble()
+        return value
+
     def point_3d(self, x, y, z=0.0):
         """Compute the Edb 3d Point Data.
 
@@ -1709,17 +1788,20 @@ class Edb(Database):
             areas = [i.Area() for i in _poly_unite]
             return _poly_unite[areas.index(max(areas))]
 
-    def _smart_cut(self, reference_list=[], expansion_size=1e-12):
-        from pyedb.dotnet.clr_module import Tuple
-
-        _polys = []
+    def _smart_cut_locations(self, reference_list=[]):
         terms = [term for term in self.layout.terminals if int(term._edb_object.GetBoundaryType()) in [0, 3, 4, 7, 8]]
         locations = []
         for term in terms:
             if term._edb_object.GetTerminalType().ToString() == "PointTerminal" and term.net.name in reference_list:
                 pd = term._edb_object.GetParameters()[1]
                 locations.append([pd.X.ToDouble(), pd.Y.ToDouble()])
-        for point in locations:
+        return locations
+
+    def _smart_cut(self, reference_list=[], expansion_size=1e-12):
+        from pyedb.dotnet.clr_module import Tuple
+
+        _polys = []
+        for point in self._smart_cut_locations(reference_list):
             pointA = self.edb_api.geometry.point_data(
                 self.edb_value(point[0] - expansion_size),
                 self.edb_value(point[1] - expansion_size),
@@ -1770,6 +1852,35 @@ class Edb(Database):
         _poly = _poly.Expand(expansion_size, tolerance, round_corner, round_extension)[0]
         return _poly
 
+    def _create_shapely_extent(
+        self,
+        signal_list,
+        extent_type,
+        expansion_size,
+        use_round_corner,
+        extent_defeature=0.0,
+        smart_cut=False,
+        reference_list=[],
+        pins_to_preserve=None,
+    ):
+        import shapely
+
+        points = []
+        if pins_to_preserve:
+            insts = self.padstacks.instances
+            points.extend(insts[i].position for i in pins_to_preserve)
+        if smart_cut:
+            points.extend(self._smart_cut_locations(reference_list))
+        geometry = self.extent_builder.extent(
+            signal_list,
+            extent_type,
+            expansion_size,
+            use_round_corner,
+            extent_defeature,
+            geometries=list(shapely.points(points)) if points else None,
+        )
+        return self.extent_builder.to_polygon_data(geometry)
+
     def cutout(
         self,
         signal_list=None,
@@ -1796,6 +1907,9 @@ class Edb(Database):
         simple_pad_check=True,
         keep_lines_as_path=False,
         include_voids_in_extents=False,
+        cutout_backend="dotnet",
+        plan=False,
+        use_extent_cache=False,
     ):
         """Create a cutout using an approach entirely based on PyAEDT.
         This method replaces all legacy cutout methods in PyAEDT.
@@ -1865,7 +1979,9 @@ class Edb(Database):
             This parameter is applicable only for a PyAEDT cutout (except point list).
         simple_pad_check : bool, optional
             Whether to use the center of the pad to find the intersection with extent or use the bounding box.
-            Second method is much slower and requires to disable multithread on padstack removal.
+            Second method is much slower and requires to disable multithread on padstack removal. With
+            ``cutout_backend="shapely"``, the pad bounding box is read once per padstack definition, layer range,
+            component and rotation, and all the instances are classified in one vectorized call.
             Default is `True`.
         keep_lines_as_path : bool, optional
             Whether to keep the lines as Path after they are cutout or convert them to PolygonData.
@@ -1876,13 +1992,33 @@ class Edb(Database):
             Whether to compute and include voids in pyaedt extent before the cutout. Cutout time can be affected.
             It works only with Conforming cutout.
             Default is ``False`` to generate extent without voids.
+        cutout_backend : str, optional
+            Engine classifying and clipping the padstack instances and primitives against the extent.
+            Options are ``"dotnet"`` to use the EDB geometry API and ``"shapely"`` to use the vectorized
+            shapely engine, which reads only the primitives crossing the extent boundary from EDB and clips
+            them in parallel. Arcs of clipped primitives are discretized with the ``"shapely"`` engine.
+            With ``"shapely"`` and ``use_pyaedt_extent_computing=True``, the extent is also computed with shapely
+            by the :attr:`extent_builder`, which caches the expanded footprint of each net, unless voids are
+            included in the extent.
+            This parameter is applicable only for a PyAEDT cutout. The default is ``"dotnet"``.
+        plan : bool or :class:`pyedb.dotnet.edb_core.cutout_plan.CutoutPlan`, optional
+            Whether to compute the cutout without modifying the database. If ``True``, the extent and the objects
+            to delete and clip are returned as a cutout plan with the duration of each stage.
+            Passing a cutout plan applies it without computing it again, as long as the layout was not modified.
+            The expansion factor iterations are skipped when computing a plan.
+            This parameter is applicable only for a PyAEDT cutout. The default is ``False``.
+        use_extent_cache : bool, optional
+            Whether to reuse the extent computed by a previous cutout with the same signal nets, extent type,
+            expansion size, round corner flag and defeature tolerance on the same layout. Computed extents are
+            saved in the :attr:`extent_cache` file next to the ``.aedb`` folder, for later sessions.
+            This parameter is applicable only for a PyAEDT cutout. The default is ``False``.
 
 
         Returns
         -------
-        List
+        List or :class:`pyedb.dotnet.edb_core.cutout_plan.CutoutPlan`
             List of coordinate points defining the extent used for clipping the design. If it failed return an empty
-            list.
+            list. Cutout plan if ``plan=True``.
 
         Examples
         --------
@@ -1914,6 +2050,9 @@ class Edb(Database):
             reference_list = [reference_list]
         elif reference_list is None:
             reference_list = []
+        if plan is not False and not use_pyaedt_cutout:
+            self.logger.error("Cutout plans are only available for PyAEDT cutouts.")
+            return False
         if not use_pyaedt_cutout and custom_extent:
             return self._create_cutout_on_point_list(
                 custom_extent,
@@ -1940,7 +2079,35 @@ class Edb(Database):
             )
         else:
             legacy_path = self.edbpath
-            if expansion_factor > 0 and not custom_extent:
+            if plan is True:
+                return self._plan_cutout(
+                    signal_list=signal_list,
+                    reference_list=reference_list,
+                    extent_type=extent_type,
+                    expansion_size=expansion_size,
+                    use_round_corner=use_round_corner,
+                    number_of_threads=number_of_threads,
+                    custom_extent=custom_extent,
+                    use_pyaedt_extent_computing=use_pyaedt_extent_computing,
+                    extent_defeature=extent_defeature,
+                    custom_extent_units=custom_extent_units,
+                    check_terminals=check_terminals,
+                    include_pingroups=include_pingroups,
+                    preserve_components_with_model=preserve_components_with_model,
+                    include_partial=include_partial_instances,
+                    simple_pad_check=simple_pad_check,
+                    keep_lines_as_path=keep_lines_as_path,
+                    inlcude_voids_in_extents=include_voids_in_extents,
+                    cutout_backend=cutout_backend,
+                    use_extent_cache=use_extent_cache,
+                )
+            elif isinstance(plan, CutoutPlan):
+                result = self._apply_cutout_plan(
+                    plan,
+                    output_aedb_path=output_aedb_path,
+                    remove_single_pin_components=remove_single_pin_components,
+                )
+            elif expansion_factor > 0 and not custom_extent:
                 start = time.time()
                 self.save_edb()
                 dummy_path = self.edbpath.replace(".aedb", "_smart_cutout_temp.aedb")
@@ -1971,6 +2138,8 @@ class Edb(Database):
                         simple_pad_check=simple_pad_check,
                         keep_lines_as_path=keep_lines_as_path,
                         inlcude_voids_in_extents=include_voids_in_extents,
+                        cutout_backend=cutout_backend,
+                        use_extent_cache=use_extent_cache,
                     )
                     if self.are_port_reference_terminals_connected():
                         if output_aedb_path:
@@ -2012,6 +2181,8 @@ class Edb(Database):
                     simple_pad_check=simple_pad_check,
                     keep_lines_as_path=keep_lines_as_path,
                     inlcude_voids_in_extents=include_voids_in_extents,
+                    cutout_backend=cutout_backend,
+                    use_extent_cache=use_extent_cache,
                 )
             if result and not open_cutout_at_end and self.edbpath != legacy_path:
                 self.save_edb()
@@ -2020,6 +2191,44 @@ class Edb(Database):
                 self.open_edb()
             return result
 
+    def batch_cutout(self, jobs, workers=None):
+        """Generate several cutouts of the design in parallel, each one in its own process and EDB session.
+
+        The design is saved and copied to the output path of each job, which is then cut out by a worker
+        process. The active design is not modified.
+
+        Parameters
+        ----------
+        jobs : list[dict]
+            Cutout jobs. Each job is a dictionary with the ``output_aedb_path`` key, an optional ``name`` key
+            and the arguments of :func:`cutout`.
+        workers : int, optional
+            Number of worker processes. The default is ``None``, in which case one process per job is used,
+            up to the number of CPUs.
+
+        Returns
+        -------
+        list[dict]
+            Job results, in the order of the jobs. Each result has the ``name``, ``output_aedb_path``,
+            ``extent`` points, ``timings`` in seconds and ``error`` keys. ``error`` is ``None`` for successful
+            jobs and the traceback of the failure otherwise.
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myaedbfolder", edbversion="2024.1")
+        >>> jobs = [
+        ...     {"output_aedb_path": "lane_{}.aedb".format(i), "signal_list": nets, "reference_list": ["GND"]}
+        ...     for i, nets in enumerate([["TX0_P", "TX0_N"], ["TX1_P", "TX1_N"]])
+        ... ]
+        >>> results = edbapp.batch_cutout(jobs, workers=8)
+        >>> failed = [result["name"] for result in results if result["error"]]
+        """
+        from pyedb.dotnet.edb_core.batch_cutout import batch_cutout
+
+        self.save_edb()
+        return batch_cutout(self.edbpath, jobs, workers=workers, edbversion=self.edbversion, logger=self.logger)
+
     def _create_cutout_legacy(
         self,
         signal_list=[],
@@ -2035,7 +2244,7 @@ class Edb(Database):
         include_pingroups=True,
         inlcude_voids_in_extents=False,
     ):
-        expansion_size = self.edb_value(expansion_size).ToDouble()
+        expansion_size = self.value_to_float(expansion_size)
 
         # validate nets in layout
         net_signals = [net for net in self.layout.nets if net.name in signal_list]
@@ -2223,15 +2432,72 @@ class Edb(Database):
         simple_pad_check=True,
         keep_lines_as_path=False,
         inlcude_voids_in_extents=False,
+        cutout_backend="dotnet",
+        use_extent_cache=False,
+    ):
+        plan = self._plan_cutout(
+            signal_list=signal_list,
+            reference_list=reference_list,
+            extent_type=extent_type,
+            expansion_size=expansion_size,
+            use_round_corner=use_round_corner,
+            number_of_threads=number_of_threads,
+            custom_extent=custom_extent,
+            use_pyaedt_extent_computing=use_pyaedt_extent_computing,
+            extent_defeature=extent_defeature,
+            custom_extent_units=custom_extent_units,
+            check_terminals=check_terminals,
+            include_pingroups=include_pingroups,
+            preserve_components_with_model=preserve_components_with_model,
+            include_partial=include_partial,
+            simple_pad_check=simple_pad_check,
+            keep_lines_as_path=keep_lines_as_path,
+            inlcude_voids_in_extents=inlcude_voids_in_extents,
+            cutout_backend=cutout_backend,
+            use_extent_cache=use_extent_cache,
+        )
+        if not plan:
+            return []
+        return self._apply_cutout_plan(
+            plan, output_aedb_path=output_aedb_path, remove_single_pin_components=remove_single_pin_components
+        )
+
+    def _plan_cutout(
+        self,
+        signal_list=[],
+        reference_list=["GND"],
+        extent_type="Conforming",
+        expansion_size=0.002,
+        use_round_corner=False,
+        number_of_threads=4,
+        custom_extent=None,
+        use_pyaedt_extent_computing=False,
+        extent_defeature=0.0,
+        custom_extent_units="mm",
+        check_terminals=False,
+        include_pingroups=True,
+        preserve_components_with_model=False,
+        include_partial=False,
+        simple_pad_check=True,
+        keep_lines_as_path=False,
+        inlcude_voids_in_extents=False,
+        cutout_backend="dotnet",
+        use_extent_cache=False,
     ):
+        """Compute the objects kept, deleted and clipped by a cutout without modifying the database.
+
+        Returns
+        -------
+        :class:`pyedb.dotnet.edb_core.cutout_plan.CutoutPlan`
+            Cutout plan, ``None`` if the extent creation failed.
+        """
         from concurrent.futures import ThreadPoolExecutor
 
-        if output_aedb_path:
-            self.save_edb_as(output_aedb_path)
         self.logger.info("Cutout Multithread started.")
-        expansion_size = self.edb_value(expansion_size).ToDouble()
+        expansion_size = self.value_to_float(expansion_size)
 
-        timer_start = self.logger.reset_timer()
+        self.logger.reset_timer()
+        start = time.time()
         if custom_extent:
             if not reference_list and not signal_list:
                 reference_list = self.nets.netlist[::]
@@ -2266,10 +2532,9 @@ class Edb(Database):
                     if term._edb_object.GetParameters()[1].GetNet().GetName() in reference_list:
                         pins_to_preserve.append(term._edb_object.GetParameters()[1].GetId())
 
-        for i in self.nets.nets.values():
-            name = i.name
-            if name not in all_list and name not in nets_to_preserve:
-                i.net_object.Delete()
+        nets_to_delete = [
+            i for i in self.nets.nets.values() if i.name not in all_list and i.name not in nets_to_preserve
+        ]
         reference_pinsts = []
         reference_prims = []
         reference_paths = []
@@ -2286,9 +2551,6 @@ class Edb(Database):
         with ThreadPoolExecutor(number_of_threads) as pool:
             pool.map(lambda item: check_instances(item), self.layout.padstack_instances)
 
-        for i in pins_to_delete:
-            i.delete()
-
         prim_to_delete = []
 
         def check_prims(item):
@@ -2305,11 +2567,10 @@ class Edb(Database):
         with ThreadPoolExecutor(number_of_threads) as pool:
             pool.map(lambda item: check_prims(item), self.modeler.primitives)
 
-        for i in prim_to_delete:
-            i.delete()
-
         self.logger.info_timer("Net clean up")
         self.logger.reset_timer()
+        timings = {"nets": time.time() - start}
+        start = time.time()
 
         if custom_extent and isinstance(custom_extent, list):
             if custom_extent[0] != custom_extent[-1]:
@@ -2326,6 +2587,42 @@ class Edb(Database):
         elif custom_extent:
             _poly = custom_extent
         else:
+            _poly = None
+            extent_key = None
+            if use_extent_cache:
+                extent_key = self.extent_cache.extent_key(
+                    signal_list,
+                    extent_type,
+                    expansion_size,
+                    use_round_corner,
+                    extent_defeature,
+                    use_pyaedt_extent_computing=use_pyaedt_extent_computing,
+                    reference_list=sorted(reference_list) if check_terminals else [],
+                    pins_to_preserve=sorted(int(i) for i in pins_to_preserve),
+                    include_voids_in_extents=inlcude_voids_in_extents,
+                )
+                _poly = self.extent_cache.get(extent_key)
+                if _poly:
+                    self.logger.info("Extent loaded from cache.")
+        # The shapely extent builder reuses the footprints of the nets of previous cutouts.
+        use_extent_builder = (
+            cutout_backend == "shapely" and use_pyaedt_extent_computing and not inlcude_voids_in_extents
+        )
+        if not custom_extent and not _poly and use_extent_builder:
+            _poly = self._create_shapely_extent(
+                signal_list,
+                extent_type,
+                expansion_size,
+                use_round_corner,
+                extent_defeature,
+                smart_cut=check_terminals,
+                reference_list=reference_list,
+                pins_to_preserve=pins_to_preserve,
+            )
+            if extent_key and _poly and not _poly.IsNull():
+                self.extent_cache.set(extent_key, _poly)
+                self.extent_cache.save()
+        elif not custom_extent and not _poly:
             net_signals = [net for net in self.layout.nets if net.name in signal_list]
             _poly = self._create_extent(
                 net_signals,
@@ -2349,15 +2646,102 @@ class Edb(Database):
                             _poly1.AddHole(hole)
                     self.logger.info(f"Number of voids included:{len(list(_poly1.Holes))}")
                 _poly = _poly1
+            if extent_key and _poly and not _poly.IsNull():
+                self.extent_cache.set(extent_key, _poly)
+                self.extent_cache.save()
         if not _poly or _poly.IsNull():
             self._logger.error("Failed to create Extent.")
-            return []
+            return None
         self.logger.info_timer("Extent Creation")
         self.logger.reset_timer()
-        _poly_list = convert_py_list_to_net_list([_poly])
-        prims_to_delete = []
-        poly_to_create = []
-        pins_to_delete = []
+        plan = CutoutPlan(self, _poly, signal_list, reference_list)
+        plan.cutout_backend = cutout_backend
+        plan.include_voids_in_extents = inlcude_voids_in_extents
+        plan.nets_to_delete = nets_to_delete
+        plan.padstack_instances_to_delete = pins_to_delete
+        plan.primitives_to_delete = prim_to_delete
+        plan.timings = timings
+        timings["extent"] = time.time() - start
+        start = time.time()
+
+        def clip_path(path):
+            pdata = path.polygon_data._edb_object
+            int_data = _poly.GetIntersectionType(pdata)
+            if int_data == 0:
+                plan.primitives_to_delete.append(path)
+            else:
+                plan.paths_to_clip.append(path)
+
+        def clean_prim(prim_1):  # pragma: no cover
+            action, polygons = self._plan_primitive_clip(prim_1, _poly, inlcude_voids_in_extents)
+            if action == "delete":
+                plan.primitives_to_delete.append(prim_1)
+            elif action == "clip":
+                plan.primitives_to_clip.append(prim_1)
+                plan.polygons_to_create.extend(polygons)
+
+        def pins_clean(pinst):
+            if not pinst.in_polygon(_poly, include_partial=include_partial, simple_check=simple_pad_check):
+                plan.padstack_instances_to_delete.append(pinst)
+
+        if cutout_backend == "shapely":
+            from pyedb.dotnet.edb_core.shapely_cutout import ShapelyCutout
+
+            # Padstack instances are classified in bulk, pad bounding boxes included.
+            shapely_cutout = ShapelyCutout(self, _poly, number_of_threads)
+            plan.padstack_instances_to_delete.extend(
+                shapely_cutout.padstack_instances_to_delete(
+                    reference_pinsts, include_partial=include_partial, simple_check=simple_pad_check
+                )
+            )
+        else:
+            if not simple_pad_check:
+                pad_cores = 1
+            else:
+                pad_cores = number_of_threads
+            with ThreadPoolExecutor(pad_cores) as pool:
+                pool.map(lambda item: pins_clean(item), reference_pinsts)
+        timings["padstack_instances"] = time.time() - start
+        start = time.time()
+
+        if cutout_backend == "shapely":
+            to_delete, to_clip, polygons, paths_to_clip = shapely_cutout.plan_primitives(
+                reference_prims, reference_paths
+            )
+            plan.primitives_to_delete.extend(to_delete)
+            plan.primitives_to_clip.extend(to_clip)
+            plan.paths_to_clip.extend(paths_to_clip)
+            for outline, holes, layer_name, net_name in polygons:
+                plan.polygons_to_create.append([outline, layer_name, net_name, holes])
+        else:
+            with ThreadPoolExecutor(number_of_threads) as pool:
+                pool.map(lambda item: clip_path(item), reference_paths)
+            with ThreadPoolExecutor(number_of_threads) as pool:
+                pool.map(lambda item: clean_prim(item), reference_prims)
+        timings["primitives"] = time.time() - start
+        start = time.time()
+
+        deleted_ids = [pin.id for pin in plan.padstack_instances_to_delete]
+        snapshot = self.layout.snapshot
+        kept_pins = snapshot.is_padstack_instance & (snapshot.component_index >= 0)
+        kept_pins &= ~np.isin(snapshot.ids, deleted_ids)
+        component_names = np.array(snapshot.component_names, dtype=object)
+        kept_components = set(component_names[np.unique(snapshot.component_index[kept_pins])])
+        plan.components_to_delete = [
+            comp for name, comp in self.components.instances.items() if name not in kept_components
+        ]
+        timings["components"] = time.time() - start
+        self.logger.info("Cutout plan: {}".format(plan))
+        return plan
+
+    def _plan_primitive_clip(self, primitive, extent, inlcude_voids_in_extents=False):  # pragma: no cover
+        """Compute how a primitive is clipped by an extent.
+
+        Returns
+        -------
+        tuple
+            Action among ``"keep"``, ``"delete"`` and ``"clip"`` and list of polygons replacing the primitive.
+        """
 
         def intersect(poly1, poly2):
             if not isinstance(poly2, list):
@@ -2372,97 +2756,94 @@ class Edb(Database):
         def subtract(poly, voids):
             return poly.Subtract(convert_py_list_to_net_list(poly), convert_py_list_to_net_list(voids))
 
-        def clip_path(path):
-            pdata = path.polygon_data._edb_object
-            int_data = _poly.GetIntersectionType(pdata)
-            if int_data == 0:
-                prims_to_delete.append(path)
-                return
-            result = path._edb_object.SetClipInfo(_poly, True)
-            if not result:
-                self.logger.info("Failed to clip path {}. Clipping as polygon.".format(path.id))
-                reference_prims.append(path)
-
-        def clean_prim(prim_1):  # pragma: no cover
-            pdata = prim_1.polygon_data._edb_object
-            int_data = _poly.GetIntersectionType(pdata)
-            if int_data == 2:
-                if not inlcude_voids_in_extents:
-                    return
-                skip = False
-                for hole in list(_poly.Holes):
-                    if hole.GetIntersectionType(pdata) == 0:
-                        prims_to_delete.append(prim_1)
-                        return
-                    elif hole.GetIntersectionType(pdata) == 1:
-                        skip = True
-                if skip:
-                    return
-            elif int_data == 0:
-                prims_to_delete.append(prim_1)
-                return
-            list_poly = intersect(_poly, pdata)
-            if list_poly:
-                net = prim_1.net_name
-                voids = prim_1.voids
-                for p in list_poly:
-                    if p.IsNull():
-                        continue
-                    # points = list(p.Points)
-                    list_void = []
-                    if voids:
-                        voids_data = [void.polygon_data._edb_object for void in voids]
-                        list_prims = subtract(p, voids_data)
-                        for prim in list_prims:
-                            if not prim.IsNull():
-                                poly_to_create.append([prim, prim_1.layer.name, net, list_void])
-                    else:
-                        poly_to_create.append([p, prim_1.layer.name, net, list_void])
-
-            prims_to_delete.append(prim_1)
-
-        def pins_clean(pinst):
-            if not pinst.in_polygon(_poly, include_partial=include_partial, simple_check=simple_pad_check):
-                pins_to_delete.append(pinst)
+        pdata = primitive.polygon_data._edb_object
+        int_data = extent.GetIntersectionType(pdata)
+        if int_data == 2:
+            if not inlcude_voids_in_extents:
+                return "keep", []
+            skip = False
+            for hole in list(extent.Holes):
+                if hole.GetIntersectionType(pdata) == 0:
+                    return "delete", []
+                elif hole.GetIntersectionType(pdata) == 1:
+                    skip = True
+            if skip:
+                return "keep", []
+        elif int_data == 0:
+            return "delete", []
+        polygons = []
+        list_poly = intersect(extent, pdata)
+        if list_poly:
+            net = primitive.net_name
+            voids = primitive.voids
+            for p in list_poly:
+                if p.IsNull():
+                    continue
+                list_void = []
+                if voids:
+                    voids_data = [void.polygon_data._edb_object for void in voids]
+                    list_prims = subtract(p, voids_data)
+                    for prim in list_prims:
+                        if not prim.IsNull():
+                            polygons.append([prim, primitive.layer.name, net, list_void])
+                else:
+                    polygons.append([p, primitive.layer.name, net, list_void])
+        return "clip", polygons
 
-        if not simple_pad_check:
-            pad_cores = 1
-        else:
-            pad_cores = number_of_threads
-        with ThreadPoolExecutor(pad_cores) as pool:
-            pool.map(lambda item: pins_clean(item), reference_pinsts)
+    def _apply_cutout_plan(self, plan, output_aedb_path=None, remove_single_pin_components=False):
+        """Delete and clip the objects of a cutout plan.
 
-        for pin in pins_to_delete:
-            pin.delete()
+        Returns
+        -------
+        list
+            List of coordinate points defining the extent, an empty list if the layout was modified since the
+            plan was computed.
+        """
+        if not plan.is_valid:
+            self.logger.error("Layout was modified after the cutout plan was computed. Compute a new plan.")
+            return []
+        if output_aedb_path:
+            self.save_edb_as(output_aedb_path)
+        timer_start = self.logger.reset_timer()
+        start = time.time()
+        if plan.nets_to_delete:
+            self.nets.delete_many(plan.nets_to_delete, delete_objects=False)
+        self.padstacks.delete_many(plan.padstack_instances_to_delete)
 
-        self.logger.info_timer("{} Padstack Instances deleted.".format(len(pins_to_delete)))
+        self.logger.info_timer("{} Padstack Instances deleted.".format(len(plan.padstack_instances_to_delete)))
         self.logger.reset_timer()
 
-        with ThreadPoolExecutor(number_of_threads) as pool:
-            pool.map(lambda item: clip_path(item), reference_paths)
-        with ThreadPoolExecutor(number_of_threads) as pool:
-            pool.map(lambda item: clean_prim(item), reference_prims)
-        # for item in reference_paths:
-        #     clip_path(item)
-        # for prim in reference_prims:  # removing multithreading as failing with new layer from primitive
-        #     clean_prim(prim)
+        prims_to_delete = plan.primitives_to_delete + plan.primitives_to_clip
+        poly_to_create = list(plan.polygons_to_create)
+        failed_paths = [path for path in plan.paths_to_clip if not path._edb_object.SetClipInfo(plan.extent, True)]
+        if failed_paths:
+            self.logger.info("Failed to clip {} paths. Clipping as polygons.".format(len(failed_paths)))
+            if plan.cutout_backend == "shapely":
+                from pyedb.dotnet.edb_core.shapely_cutout import ShapelyCutout
+
+                to_delete, to_clip, polygons, _ = ShapelyCutout(self, plan.extent).plan_primitives(failed_paths)
+                prims_to_delete.extend(to_delete + to_clip)
+                poly_to_create.extend([outline, layer, net, holes] for outline, holes, layer, net in polygons)
+            else:
+                for path in failed_paths:
+                    action, polygons = self._plan_primitive_clip(path, plan.extent, plan.include_voids_in_extents)
+                    if action != "keep":
+                        prims_to_delete.append(path)
+                        poly_to_create.extend(polygons)
 
         for el in poly_to_create:
             self.modeler.create_polygon(el[0], el[1], net_name=el[2], voids=el[3])
 
-        for prim in prims_to_delete:
-            prim.delete()
+        self.modeler.delete_many(prims_to_delete)
 
         self.logger.info_timer("{} Primitives deleted.".format(len(prims_to_delete)))
         self.logger.reset_timer()
 
-        i = 0
-        for _, val in self.components.instances.items():
-            if val.numpins == 0:
-                val.edbcomponent.Delete()
-                i += 1
-                i += 1
-        self.logger.info("{} components deleted".format(i))
+        for component in plan.components_to_delete:
+            component.edbcomponent.Delete()
+        if plan.components_to_delete:
+            self.layout._notify_change()
+        self.logger.info("{} components deleted".format(len(plan.components_to_delete)))
         if remove_single_pin_components:
             self.components.delete_single_pin_rlc()
             self.logger.info_timer("Single Pins components deleted")
@@ -2470,9 +2851,10 @@ class Edb(Database):
         self.components.refresh_components()
         if output_aedb_path:
             self.save_edb()
+        plan.timings["apply"] = time.time() - start
         self.logger.info_timer("Cutout completed.", timer_start)
         self.logger.reset_timer()
-        return [[pt.X.ToDouble(), pt.Y.ToDouble()] for pt in list(_poly.GetPolygonWithoutArcs().Points)]
+        return plan.extent_points
 
     def create_cutout_multithread(
         self,
@@ -2771,6 +3153,9 @@ class Edb(Database):
                     void_circle.primitive_object.GetPolygonData(),
                 )
                 cloned_polygon.SetIsNegative(True)
+        if include_partial_instances or voids_to_add:
+            # Objects were created with raw EDB calls, so cached layout views are rebuilt on next access.
+            self.layout._notify_change()
         layers = [i for i in list(self.stackup.signal_layers.keys())]
         for layer in layers:
             layer_primitves = self.modeler.get_primitives(layer_name=layer)
@@ -4578,7 +4963,7 @@ class Edb(Database):
                         .parameters_values[0]
                     )
                 else:
-                    pad_diameter = self.edb_value(terminal_diameter).ToDouble()
+                    pad_diameter = self.value_to_float(terminal_diameter)
                 _temp_circle = cloned_edb.modeler.create_circle(
                     layer_name="ports",
                     x=inst.position[0],
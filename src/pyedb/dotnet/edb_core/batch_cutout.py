@@ -0,0 +1,156 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains the functions generating several cutouts of a design in parallel processes.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+import os
+import shutil
+import time
+import traceback
+
+
+def _job_name(job):
+    return job.get("name") or os.path.splitext(os.path.basename(os.path.normpath(job["output_aedb_path"])))[0]
+
+
+def run_cutout_job(edbpath, job, edbversion=None):
+    """Copy a design and cut it out in the current process.
+
+    Parameters
+    ----------
+    edbpath : str
+        Path to the source ``.aedb`` folder.
+    job : dict
+        Cutout job, with the ``output_aedb_path`` key and the arguments of :func:`pyedb.dotnet.edb.Edb.cutout`.
+    edbversion : str, optional
+        EDB version. The default is ``None``, in which case the latest installed version is used.
+
+    Returns
+    -------
+    dict
+        Job result with the ``name``, ``output_aedb_path``, ``extent``, ``timings`` and ``error`` keys.
+    """
+    from pyedb.dotnet.edb import Edb
+
+    start = time.time()
+    kwargs = dict(job)
+    name = _job_name(kwargs)
+    kwargs.pop("name", None)
+    output_aedb_path = kwargs.pop("output_aedb_path")
+    result = {"name": name, "output_aedb_path": output_aedb_path, "extent": None, "timings": {}, "error": None}
+    timings = result["timings"]
+    edb = None
+    try:
+        shutil.copytree(edbpath, output_aedb_path, dirs_exist_ok=True)
+        timings["copy"] = time.time() - start
+        step = time.time()
+        edb = Edb(edbpath=output_aedb_path, edbversion=edbversion)
+        if kwargs.get("use_extent_cache"):
+            edb.extent_cache.load(os.path.splitext(os.path.normpath(edbpath))[0] + "_extents.json")
+        timings["open"] = time.time() - step
+        step = time.time()
+        kwargs["open_cutout_at_end"] = True
+        extent = edb.cutout(**kwargs)
+        timings["cutout"] = time.time() - step
+        if not extent:
+            result["error"] = "Cutout failed."
+        else:
+            result["extent"] = extent
+            step = time.time()
+            edb.save_edb()
+            timings["save"] = time.time() - step
+    except Exception:
+        result["error"] = traceback.format_exc()
+    finally:
+        if edb is not None:
+            try:
+                edb.close_edb()
+            except Exception:
+                pass
+    timings["total"] = time.time() - start
+    return result
+
+
+def batch_cutout(edbpath, jobs, workers=None, edbversion=None, logger=None):
+    """Generate several cutouts of a design, each one in its own process and EDB session.
+
+    Parameters
+    ----------
+    edbpath : str
+        Path to the source ``.aedb`` folder, which is not modified.
+    jobs : list[dict]
+        Cutout jobs. Each job is a dictionary with the ``output_aedb_path`` key, an optional ``name`` key and
+        the arguments of :func:`pyedb.dotnet.edb.Edb.cutout`.
+    workers : int, optional
+        Number of worker processes. The default is ``None``, in which case one process per job is used,
+        up to the number of CPUs.
+    edbversion : str, optional
+        EDB version. The default is ``None``, in which case the latest installed version is used.
+    logger : optional
+        Logger reporting the jobs. The default is ``None``.
+
+    Returns
+    -------
+    list[dict]
+        Job results, in the order of the jobs. Each result has the ``name``, ``output_aedb_path``, ``extent``,
+        ``timings`` in seconds and ``error`` keys. ``error`` is ``None`` for successful jobs.
+    """
+    jobs = list(jobs)
+    for i, job in enumerate(jobs):
+        if not job.get("output_aedb_path"):
+            raise ValueError("Cutout job {} has no output_aedb_path.".format(i))
+        if os.path.normpath(job["output_aedb_path"]) == os.path.normpath(edbpath):
+            raise ValueError("Cutout job {} would overwrite the source design.".format(i))
+    outputs = [os.path.normpath(job["output_aedb_path"]) for job in jobs]
+    if len(set(outputs)) != len(outputs):
+        raise ValueError("Cutout jobs must have different output_aedb_path.")
+    if not jobs:
+        return []
+    workers = min(len(jobs), workers or os.cpu_count() or 1)
+    results = [None] * len(jobs)
+    # EDB sessions cannot be forked, each worker starts its own interpreter.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(run_cutout_job, edbpath, job, edbversion): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception:
+                results[i] = {
+                    "name": _job_name(jobs[i]),
+                    "output_aedb_path": jobs[i]["output_aedb_path"],
+                    "extent": None,
+                    "timings": {},
+                    "error": traceback.format_exc(),
+                }
+            if logger:
+                if results[i]["error"]:
+                    logger.error("Cutout {} failed.".format(results[i]["name"]))
+                else:
+                    logger.info(
+                        "Cutout {} completed in {:.1f}s.".format(results[i]["name"], results[i]["timings"]["total"])
+                    )
+    return results
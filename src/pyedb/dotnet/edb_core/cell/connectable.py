@@ -46,6 +46,7 @@ class Connectable(LayoutObj):
         """Set net."""
         net = self._pedb.nets[value]
         self._edb_object.SetNet(net.net_object)
+        self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
 
     @property
     def net_name(self):
@@ -65,6 +66,7 @@ class Connectable(LayoutObj):
         if name in self._pedb.nets.netlist:
             obj = self._pedb.nets.nets[name].net_object
             self._edb_object.SetNet(obj)
+            self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
         else:
             raise ValueError(f"Net {name} not found.")
 
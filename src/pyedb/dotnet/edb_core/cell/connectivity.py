@@ -0,0 +1,247 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains the ``LayoutConnectivity`` class, a union-find labelling of the layout connectivity.
+"""
+import numpy as np
+
+
+class UnionFind(object):
+    """Disjoint-set forest over the integers ``0`` to ``size - 1``.
+
+    Parameters
+    ----------
+    size : int
+        Number of items.
+    """
+
+    def __init__(self, size):
+        self.parent = list(range(size))
+        self.rank = [0] * size
+
+    def find(self, item):
+        """Find the root of an item.
+
+        Parameters
+        ----------
+        item : int
+
+        Returns
+        -------
+        int
+        """
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, item1, item2):
+        """Merge the sets of two items.
+
+        Parameters
+        ----------
+        item1 : int
+        item2 : int
+
+        Returns
+        -------
+        int
+            Root of the merged set.
+        """
+        root1 = self.find(item1)
+        root2 = self.find(item2)
+        if root1 == root2:
+            return root1
+        if self.rank[root1] < self.rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        if self.rank[root1] == self.rank[root2]:
+            self.rank[root1] += 1
+        return root1
+
+    def labels(self):
+        """Label each item with the index of its set.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Set indices from ``0`` to the number of sets minus one.
+        """
+        roots = np.array([self.find(i) for i in range(len(self.parent))], dtype=np.int64)
+        return np.unique(roots, return_inverse=True)[1].astype(np.int64).reshape(-1)
+
+
+class LayoutConnectivity(object):
+    """Connected components of the primitives and padstack instances of a layout.
+
+    ``LayoutInstance.GetConnectedObjects`` returns every object physically connected to a given object.
+    It is therefore queried once per connected component instead of once per object, and the results are
+    merged with a union-find. All the queries then run on the resulting labels.
+
+    Parameters
+    ----------
+    snapshot : :class:`pyedb.dotnet.edb_core.cell.layout_snapshot.LayoutSnapshot`
+        Snapshot of the layout objects.
+    layout_instance : Ansys.Ansoft.Edb.LayoutInstance.LayoutInstance
+        EDB layout instance used to query the connectivity.
+
+    Examples
+    --------
+    >>> from pyedb import Edb
+    >>> edbapp = Edb("myaedbfolder")
+    >>> connectivity = edbapp.layout.connectivity
+    >>> connectivity.shorted_nets("GND")
+    >>> connectivity.components_of_net("VCC")
+    """
+
+    def __init__(self, snapshot, layout_instance):
+        self.snapshot = snapshot
+        self.query_count = 0
+        self.labels = np.full(len(snapshot), -1, dtype=np.int64)
+        self.count = 0
+        self._extract(layout_instance)
+
+    def _extract(self, layout_instance):
+        snapshot = self.snapshot
+        conductors = ~snapshot.is_void
+        union_find = UnionFind(len(snapshot))
+        visited = ~conductors
+        for row in np.flatnonzero(conductors).tolist():
+            if visited[row]:
+                continue
+            visited[row] = True
+            layout_obj_instance = layout_instance.GetLayoutObjInstance(snapshot.edb_objects[row], None)
+            self.query_count += 1
+            for loi in layout_instance.GetConnectedObjects(layout_obj_instance).Items:
+                other = snapshot.row(loi.GetLayoutObj().GetId())
+                if other >= 0 and conductors[other]:
+                    union_find.union(row, other)
+                    visited[other] = True
+        labels = union_find.labels()
+        if conductors.any():
+            self.labels[conductors] = np.unique(labels[conductors], return_inverse=True)[1].reshape(-1)
+            self.count = int(self.labels.max()) + 1
+
+    def _group(self, rows):
+        """Group the IDs of rows by component, in component order."""
+        labels = self.labels[rows]
+        order = np.argsort(labels, kind="stable")
+        groups = np.split(self.snapshot.ids[rows][order], np.flatnonzero(np.diff(labels[order])) + 1)
+        return [group.tolist() for group in groups if len(group)]
+
+    def _net_rows(self, net):
+        return np.flatnonzero(self.snapshot.mask(nets=net) & (self.labels >= 0))
+
+    def component_of(self, obj_id):
+        """Get the IDs of the objects connected to an object, including itself.
+
+        Parameters
+        ----------
+        obj_id : int
+            EDB ID of the primitive or padstack instance.
+
+        Returns
+        -------
+        list of int
+        """
+        row = self.snapshot.row(obj_id)
+        if row < 0 or self.labels[row] < 0:
+            return []
+        return self.snapshot.ids[self.labels == self.labels[row]].tolist()
+
+    def components_of_net(self, net):
+        """Get the connected groups of objects of a net.
+
+        Objects of the net are grouped when they are connected, even through objects of other nets.
+
+        Parameters
+        ----------
+        net : str
+            Net name.
+
+        Returns
+        -------
+        list of list of int
+            IDs of the net objects for each group.
+        """
+        rows = self._net_rows(net)
+        return self._group(rows)
+
+    def shorted_nets(self, net):
+        """Get the nets connected to a net.
+
+        Parameters
+        ----------
+        net : str
+            Net name.
+
+        Returns
+        -------
+        list of str
+            Names of the other nets sharing a connected component with the net.
+        """
+        labels = np.unique(self.labels[self._net_rows(net)])
+        net_index = np.unique(self.snapshot.net_index[np.isin(self.labels, labels)])
+        return [self.snapshot.net_names[i] for i in net_index.tolist() if self.snapshot.net_names[i] != net]
+
+    def area(self, obj_ids):
+        """Get the total area of primitives.
+
+        Parameters
+        ----------
+        obj_ids : list of int
+            EDB IDs of the objects. Padstack instances have no area.
+
+        Returns
+        -------
+        float
+        """
+        rows = [self.snapshot.row(i) for i in obj_ids]
+        return float(self.snapshot.area[[row for row in rows if row >= 0]].sum())
+
+    def islands(self, smaller_than=None, nets=None):
+        """Get the connected components.
+
+        Parameters
+        ----------
+        smaller_than : float, optional
+            Area in square meters. Only components with a smaller copper area are kept. The default is ``None``,
+            in which case all components are kept.
+        nets : str or list, optional
+            Net names. Only components holding one of these nets are kept. The default is ``None``.
+
+        Returns
+        -------
+        list of list of int
+            IDs of the objects of each component.
+        """
+        conductors = self.labels >= 0
+        areas = np.bincount(self.labels[conductors], weights=self.snapshot.area[conductors], minlength=self.count)
+        keep = np.ones(self.count, dtype=bool)
+        if smaller_than is not None:
+            keep &= areas < smaller_than
+        if nets is not None:
+            keep &= np.isin(np.arange(self.count), self.labels[self.snapshot.mask(nets=nets) & conductors])
+        rows = np.flatnonzero(conductors & keep[np.maximum(self.labels, 0)])
+        return self._group(rows)
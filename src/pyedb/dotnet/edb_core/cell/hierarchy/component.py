@@ -100,6 +100,11 @@ class EDBComponent(Group):
     def component_property(self, value):
         if value:
             self.edbcomponent.SetComponentProperty(value)
+            self._notify_model_change()
+
+    def _notify_model_change(self):
+        """Invalidate the component types, models and values cached by the layout."""
+        self._pedb.layout._component_model_version += 1
 
     @property
     def _edb_model(self):  # pragma: no cover
@@ -132,6 +137,7 @@ class EDBComponent(Group):
         comp_prop = self.component_property
         comp_prop.SetModel(value._edb_object)
         self.edbcomponent.SetComponentProperty(comp_prop)
+        self._notify_model_change()
 
     @property
     def package_def(self):
@@ -209,6 +215,7 @@ class EDBComponent(Group):
         cmp_prop = self.component_property.Clone()
         cmp_prop.SetEnabled(value)
         self.edbcomponent.SetComponentProperty(cmp_prop)
+        self._notify_model_change()
 
     @property
     def spice_model(self):
@@ -367,6 +374,7 @@ class EDBComponent(Group):
             component_property = self.component_property
             component_property.SetEnabled(enabled)
             self.edbcomponent.SetComponentProperty(component_property)
+            self._notify_model_change()
 
     @property
     def model_type(self):
@@ -565,6 +573,7 @@ class EDBComponent(Group):
                     comp_prop = self.component_property
                     comp_prop.SetModel(pin_pair_model)
                     self.edbcomponent.SetComponentProperty(comp_prop)
+                    self._notify_model_change()
 
     @property
     def center(self):
@@ -698,6 +707,7 @@ class EDBComponent(Group):
         else:
             return
         self.edbcomponent.SetComponentType(type_id)
+        self._notify_model_change()
 
     @property
     def numpins(self):
@@ -816,6 +826,7 @@ class EDBComponent(Group):
         if not self.edbcomponent.SetComponentProperty(comp_prop):
             logging.error("Fail to assign model on {}.".format(self.refdes))
             return False
+        self._notify_model_change()
         return True
 
     def assign_spice_model(
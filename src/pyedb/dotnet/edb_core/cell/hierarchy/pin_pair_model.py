@@ -103,3 +103,4 @@ class PinPair(object):  # pragma: no cover
         self._edb_model.SetPinPairRlc(self._edb_pin_pair, self._pin_pair_rlc)
         self._edb_comp_prop.SetModel(self._edb_model)
         self._edb_comp.SetComponentProperty(self._edb_comp_prop)
+        self._pedb_comp._notify_model_change()
@@ -23,11 +23,15 @@
 """
 This module contains these classes: `EdbLayout` and `Shape`.
 """
+from numbers import Integral
 from typing import Union
 
+from pyedb.dotnet.edb_core.cell.connectivity import LayoutConnectivity
 from pyedb.dotnet.edb_core.cell.hierarchy.component import EDBComponent
+from pyedb.dotnet.edb_core.cell.layout_snapshot import LayoutSnapshot
 from pyedb.dotnet.edb_core.cell.primitive.bondwire import Bondwire
 from pyedb.dotnet.edb_core.cell.primitive.path import Path
+from pyedb.dotnet.edb_core.cell.spatial_index import LayoutSpatialIndex
 from pyedb.dotnet.edb_core.cell.terminal.bundle_terminal import BundleTerminal
 from pyedb.dotnet.edb_core.cell.terminal.edge_terminal import EdgeTerminal
 from pyedb.dotnet.edb_core.cell.terminal.padstack_instance_terminal import (
@@ -80,6 +84,112 @@ def primitive_cast(pedb, edb_object):
 class Layout(ObjBase):
     def __init__(self, pedb, edb_object):
         super().__init__(pedb, edb_object)
+        self._version = 0
+        self._layer_collection_version = 0
+        self._component_model_version = 0
+        self._snapshot = None
+        self._snapshot_version = None
+        self._spatial_index = None
+        self._spatial_index_version = None
+        self._id_index = None
+        self._id_index_version = None
+        self._connectivity = None
+        self._connectivity_version = None
+
+    @property
+    def version(self):
+        """Layout mutation counter.
+
+        The counter is incremented each time an object is created, deleted or edited through pyedb.
+        Cached dictionaries of the managers are keyed on this value.
+
+        Returns
+        -------
+        int
+        """
+        return self._version
+
+    def _notify_change(self, created=None, deleted=None):
+        """Increment the mutation counter, invalidating all the caches keyed on it.
+
+        Parameters
+        ----------
+        created : list, optional
+            Primitives and padstack instances created or edited by the change.
+        deleted : list, optional
+            IDs of the primitives and padstack instances deleted or edited by the change.
+
+        Notes
+        -----
+        When ``created`` and ``deleted`` are both ``None``, the change is unknown and the spatial and ID
+        indexes are rebuilt on next access. Otherwise they are updated in place. Empty lists therefore
+        describe a change that does not affect any primitive or padstack instance.
+        """
+        spatial_index_up_to_date = self._spatial_index is not None and self._spatial_index_version == self._version
+        id_index_up_to_date = self._id_index is not None and self._id_index_version == self._version
+        self._version += 1
+        if created is None and deleted is None:
+            return
+        created = [i._edb_object if isinstance(i, ObjBase) else i for i in created or []]
+        deleted = deleted or []
+        if spatial_index_up_to_date:
+            for obj_id in deleted:
+                self._spatial_index.delete(obj_id)
+            for obj in created:
+                self._spatial_index.insert(obj)
+            self._spatial_index_version = self._version
+        if id_index_up_to_date:
+            for obj_id in deleted:
+                self._id_index.pop(obj_id, None)
+            for obj in created:
+                self._id_index[obj.GetId()] = obj
+            self._id_index_version = self._version
+
+    def _delete_objects(self, objects, include_voids=False):
+        """Delete primitives or padstack instances, notifying the change once.
+
+        Parameters
+        ----------
+        objects : list
+            IDs, pyedb objects or EDB objects to delete. Duplicates, and voids listed after their primitive, are
+            deleted once.
+        include_voids : bool, optional
+            Whether the objects are primitives whose voids are deleted with them. The default is ``False``.
+
+        Returns
+        -------
+        tuple[list[int], list]
+            IDs of the deleted objects, without their voids, and the IDs not found in the layout.
+        """
+        deleted = []
+        not_found = []
+        notified = []
+        seen = set()
+        id_index = None
+        for obj in objects:
+            if isinstance(obj, Integral):
+                if id_index is None:
+                    id_index = self.id_index
+                edb_object = id_index.get(int(obj))
+                if edb_object is None:
+                    not_found.append(obj)
+                    continue
+            else:
+                edb_object = getattr(obj, "_edb_object", obj)
+            obj_id = edb_object.GetId()
+            if obj_id in seen:
+                continue
+            seen.add(obj_id)
+            deleted.append(obj_id)
+            notified.append(obj_id)
+            if include_voids:
+                void_ids = [void.GetId() for void in edb_object.Voids]
+                notified.extend(void_ids)
+                seen.update(void_ids)
+            edb_object.Delete()
+        if notified:
+            self._notify_change(deleted=notified)
+        return deleted, not_found
 
     @property
     def cell(self):
@@ -98,6 +208,9 @@ class Layout(ObjBase):
     def layer_collection(self, layer_collection):
         """Set layer collection."""
         self._edb_object.SetLayerCollection(layer_collection)
+        self._layer_collection_version += 1
+        # Primitives are grouped and indexed by layer name, so layout caches are invalidated too.
+        self._notify_change()
 
     @property
     def _edb(self):
@@ -232,6 +345,76 @@ class Layout(ObjBase):
         """
         return [primitive_cast(self._pedb, p) for p in self._edb_object.Primitives]
 
+    @property
+    def snapshot(self):
+        """Columnar snapshot of the primitives and padstack instances.
+
+        Returns
+        -------
+        :class:`pyedb.dotnet.edb_core.cell.layout_snapshot.LayoutSnapshot`
+        """
+        if self._snapshot_version != self._version:
+            self._snapshot = LayoutSnapshot(self._pedb, self._edb_object)
+            self._snapshot_version = self._version
+        return self._snapshot
+
+    @property
+    def spatial_index(self):
+        """R-tree index of the primitives and padstack instances.
+
+        The index is bulk-loaded on first access and then maintained in place when objects are
+        created or deleted through pyedb.
+
+        Returns
+        -------
+        :class:`pyedb.dotnet.edb_core.cell.spatial_index.LayoutSpatialIndex`
+        """
+        if self._spatial_index is None or self._spatial_index_version != self._version:
+            layer_order = list(self._pedb.stackup.layers.keys())
+            self._spatial_index = LayoutSpatialIndex(self.snapshot, layer_order)
+            self._spatial_index_version = self._version
+        return self._spatial_index
+
+    @property
+    def id_index(self):
+        """Dictionary of the EDB primitives, voids and padstack instances by ID.
+
+        The index is built on first access and then maintained in place when objects are
+        created or deleted through pyedb.
+
+        Returns
+        -------
+        dict[int, EDB object]
+        """
+        if self._id_index is None or self._id_index_version != self._version:
+            snapshot = self.snapshot
+            self._id_index = dict(zip(snapshot.ids.tolist(), snapshot.edb_objects))
+            self._id_index_version = self._version
+        return self._id_index
+
+    @property
+    def connectivity(self):
+        """Connected components of the primitives and padstack instances.
+
+        The connectivity is extracted on first access with one EDB query per connected component and kept
+        until the layout changes.
+
+        Returns
+        -------
+        :class:`pyedb.dotnet.edb_core.cell.connectivity.LayoutConnectivity`
+        """
+        if self._connectivity is None or self._connectivity_version != self._version:
+            self._connectivity = LayoutConnectivity(self.snapshot, self._edb_object.GetLayoutInstance())
+            self._connectivity_version = self._version
+        return self._connectivity
+
+    def _cast(self, edb_object):
+        """Cast an EDB primitive or padstack instance to its pyedb object."""
+        if edb_object.GetObjType().ToString() == "PadstackInstance":
+            return EDBPadstackInstance(edb_object, self._pedb)
+        if edb_object.GetObjType().ToString() == "Primitive":
+            return primitive_cast(self._pedb, edb_object)
+
     @property
     def bondwires(self):
         """Bondwires.
@@ -268,6 +451,32 @@ class Layout(ObjBase):
         """Get all padstack instances in a list."""
         return [EDBPadstackInstance(i, self._pedb) for i in self._edb_object.PadstackInstances]
 
+    @property
+    def compact_padstack_instances(self):
+        """Padstack instances as compact proxies.
+
+        Proxies only hold a reference to the layout snapshot and their row in it. Net, layers, position,
+        rotation and definition are read from the snapshot arrays and other attributes are resolved lazily,
+        which keeps large layouts within memory.
+
+        Returns
+        -------
+        list of :class:`pyedb.dotnet.edb_core.cell.layout_proxy.PadstackInstanceProxy`
+        """
+        snapshot = self.snapshot
+        return snapshot.get_proxies(snapshot.is_padstack_instance)
+
+    @property
+    def compact_primitives(self):
+        """Primitives and voids as compact proxies.
+
+        Returns
+        -------
+        list of :class:`pyedb.dotnet.edb_core.cell.layout_proxy.PrimitiveProxy`
+        """
+        snapshot = self.snapshot
+        return snapshot.get_proxies(snapshot.is_primitive)
+
     @property
     def voltage_regulators(self):
         return [VoltageRegulator(self._pedb, i) for i in list(self._edb_object.VoltageRegulators)]
@@ -289,15 +498,12 @@ class Layout(ObjBase):
         value : int
             ID of the object.
         """
-        obj = self._pedb._edb.Cell.Connectable.FindById(self._edb_object, value)
+        obj = self.id_index.get(value)
+        if obj is None:
+            obj = self._pedb._edb.Cell.Connectable.FindById(self._edb_object, value)
         if obj is None:
             raise RuntimeError(f"Object Id {value} not found")
-
-        if obj.GetObjType().ToString() == "PadstackInstance":
-            return EDBPadstackInstance(obj, self._pedb)
-
-        if obj.GetObjType().ToString() == "Primitive":
-            return primitive_cast(self._pedb, obj)
+        return self._cast(obj)
 
     def find_net_by_name(self, value: str):
         """Find a net object by name
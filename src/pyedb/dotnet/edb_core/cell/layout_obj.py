@@ -72,8 +72,9 @@ class LayoutObj(ObjBase):
 
     def delete(self):
         """Delete this primitive."""
+        deleted = [self.id]
+        if self._obj_type == "Primitive":
+            deleted.extend(i.GetId() for i in self._edb_object.Voids)
         self._edb_object.Delete()
-        self._pedb.modeler._primitives = []
-        self._pedb.padstacks._instances = {}
-        self._pedb.padstacks._definitions = {}
+        self._pedb.layout._notify_change(deleted=deleted)
         return True
@@ -0,0 +1,244 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains compact proxies of the layout objects backed by the layout snapshot.
+"""
+import math
+
+
+class LayoutObjectProxy(object):
+    """Compact proxy of a primitive or padstack instance.
+
+    A proxy only stores its snapshot and row. Indexed attributes are read from the snapshot arrays, and any
+    other attribute is resolved on a full pyedb object which is created on demand and not kept, so that
+    large lists of proxies stay small in memory.
+
+    Attributes are written on the full pyedb object. The edit is then notified to the layout and the proxy
+    is moved to the current layout snapshot, so that indexed attributes read after a write are up to date.
+
+    Parameters
+    ----------
+    snapshot : :class:`pyedb.dotnet.edb_core.cell.layout_snapshot.LayoutSnapshot`
+        Snapshot holding the object.
+    row : int
+        Row of the object in the snapshot.
+    """
+
+    __slots__ = ("_snapshot", "_row")
+
+    def __init__(self, snapshot, row):
+        object.__setattr__(self, "_snapshot", snapshot)
+        object.__setattr__(self, "_row", row)
+
+    def __getattr__(self, name):
+        return getattr(self._snapshot.get_object(self._row), name)
+
+    def __setattr__(self, name, value):
+        obj_id = self.id
+        edb_object = self._edb_object
+        setattr(self._snapshot.get_object(self._row), name, value)
+        layout = self._snapshot._pedb.layout
+        layout._notify_change(created=[edb_object], deleted=[obj_id])
+        snapshot = layout.snapshot
+        row = snapshot.row(obj_id)
+        if row >= 0:
+            object.__setattr__(self, "_snapshot", snapshot)
+            object.__setattr__(self, "_row", row)
+
+    def __eq__(self, other):
+        return isinstance(other, LayoutObjectProxy) and self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, self.id)
+
+    @property
+    def _edb_object(self):
+        return self._snapshot.edb_objects[self._row]
+
+    @property
+    def id(self):
+        """EDB ID.
+
+        Returns
+        -------
+        int
+        """
+        return int(self._snapshot.ids[self._row])
+
+    @property
+    def net_name(self):
+        """Net name.
+
+        Returns
+        -------
+        str
+        """
+        return self._snapshot.net_names[self._snapshot.net_index[self._row]]
+
+    @property
+    def full_object(self):
+        """Full pyedb object of the proxy.
+
+        Returns
+        -------
+        :class:`pyedb.dotnet.edb_core.edb_data.padstacks_data.EDBPadstackInstance` or primitive object
+        """
+        return self._snapshot.get_object(self._row)
+
+
+class PrimitiveProxy(LayoutObjectProxy):
+    """Compact proxy of a primitive."""
+
+    __slots__ = ()
+
+    @property
+    def type(self):
+        """Primitive type, for example ``"Polygon"``.
+
+        Returns
+        -------
+        str
+        """
+        return self._snapshot.type_names[self._snapshot.type_index[self._row]]
+
+    @property
+    def primitive_type(self):
+        """Primitive type in lower case, for example ``"polygon"``.
+
+        Returns
+        -------
+        str
+        """
+        return self.type.lower()
+
+    @property
+    def layer_name(self):
+        """Layer name.
+
+        Returns
+        -------
+        str
+        """
+        return self._snapshot.layer_names[self._snapshot.layer_index[self._row]]
+
+    @property
+    def is_void(self):
+        """Whether the primitive is a void.
+
+        Returns
+        -------
+        bool
+        """
+        return bool(self._snapshot.is_void[self._row])
+
+    @property
+    def bbox(self):
+        """Bounding box ``[lower_left x, lower_left y, upper right x, upper right y]``.
+
+        Returns
+        -------
+        list
+        """
+        bbox = self._snapshot.bbox[self._row].tolist()
+        if any(math.isnan(i) for i in bbox):
+            return self.full_object.bbox
+        return bbox
+
+    def area(self, include_voids=True):
+        """Area of the primitive.
+
+        Parameters
+        ----------
+        include_voids : bool, optional
+            Whether to subtract the area of the voids. The default is ``True``.
+
+        Returns
+        -------
+        float
+        """
+        if include_voids:
+            return float(self._snapshot.area[self._row])
+        return self.full_object.area(include_voids)
+
+
+class PadstackInstanceProxy(LayoutObjectProxy):
+    """Compact proxy of a padstack instance."""
+
+    __slots__ = ()
+
+    @property
+    def start_layer(self):
+        """Starting layer name.
+
+        Returns
+        -------
+        str
+        """
+        return self._snapshot.layer_names[self._snapshot.layer_index[self._row]]
+
+    @property
+    def stop_layer(self):
+        """Stopping layer name.
+
+        Returns
+        -------
+        str
+        """
+        return self._snapshot.layer_names[self._snapshot.stop_layer_index[self._row]]
+
+    @property
+    def position(self):
+        """Position ``[x, y]`` in layout coordinates.
+
+        Returns
+        -------
+        list
+        """
+        position = self._snapshot.position[self._row].tolist()
+        if any(math.isnan(i) for i in position):
+            return []
+        return position
+
+    @property
+    def rotation(self):
+        """Rotation in radians.
+
+        Returns
+        -------
+        float
+        """
+        rotation = float(self._snapshot.rotation[self._row])
+        return None if math.isnan(rotation) else rotation
+
+    @property
+    def padstack_definition(self):
+        """Padstack definition name.
+
+        Returns
+        -------
+        str
+        """
+        return self._snapshot.definition_names[self._snapshot.definition_index[self._row]]
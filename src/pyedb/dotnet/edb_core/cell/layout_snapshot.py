@@ -0,0 +1,639 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains the ``LayoutSnapshot`` class, a columnar view of the layout.
+"""
+import numpy as np
+
+from pyedb.dotnet.edb_core.cell.layout_proxy import (
+    PadstackInstanceProxy,
+    PrimitiveProxy,
+)
+
+_POLYGON_TYPES = ("Rectangle", "Circle", "Polygon", "Path")
+PADSTACK_INSTANCE_TYPE = "PadstackInstance"
+_NAN_BBOX = (np.nan, np.nan, np.nan, np.nan)
+
+
+def read_primitive(prim):
+    """Read the indexed attributes of an EDB primitive.
+
+    Parameters
+    ----------
+    prim : Ansys.Ansoft.Edb.Cell.Primitive.Primitive
+        EDB primitive.
+
+    Returns
+    -------
+    tuple
+        ``(id, type, net, layer, stop_layer, is_void, bbox, area)``. The bounding box is made of NaN values and
+        the area is ``0.0`` for primitives without polygon data, like bondwires or texts.
+    """
+    prim_type = prim.GetPrimitiveType().ToString()
+    layer = prim.GetLayer().GetName()
+    if prim_type in _POLYGON_TYPES:
+        polygon_data = prim.GetPolygonData()
+        edb_bbox = polygon_data.GetBBox()
+        box = (
+            edb_bbox.Item1.X.ToDouble(),
+            edb_bbox.Item1.Y.ToDouble(),
+            edb_bbox.Item2.X.ToDouble(),
+            edb_bbox.Item2.Y.ToDouble(),
+        )
+        area = polygon_data.Area()
+    else:
+        box = _NAN_BBOX
+        area = 0.0
+    return prim.GetId(), prim_type, prim.GetNet().GetName(), layer, layer, bool(prim.IsVoid()), box, area
+
+
+def read_component_transform(pedb, component):
+    """Get the affine matrix of a component transform.
+
+    The matrix is computed from the transform of three points, so that it holds the rotation, mirror, scale
+    and offset of the component whatever the way EDB composes them.
+
+    Parameters
+    ----------
+    pedb : :class:`pyedb.dotnet.edb.Edb`
+        EDB object creating the points.
+    component : Ansys.Ansoft.Edb.Cell.Hierarchy.Component
+        EDB component.
+
+    Returns
+    -------
+    list
+        ``[[a, b, x0], [c, d, y0]]`` matrix mapping local points to layout points.
+    """
+    transform = component.GetTransform()
+    points = []
+    for x, y in ((0.0, 0.0), (1.0, 0.0), (0.0, 1.0)):
+        point = transform.TransformPoint(pedb.point_data(x, y))
+        points.append((point.X.ToDouble(), point.Y.ToDouble()))
+    (x0, y0), (x1, y1), (x2, y2) = points
+    return [[x1 - x0, x2 - x0, x0], [y1 - y0, y2 - y0, y0]]
+
+
+def transform_points(matrices, points):
+    """Apply component affine matrices to local points.
+
+    Parameters
+    ----------
+    matrices : :class:`numpy.ndarray`
+        Matrices from :func:`read_component_transform` with shape ``(n, 2, 3)``.
+    points : :class:`numpy.ndarray`
+        Local points with shape ``(n, 2)``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Layout points with shape ``(n, 2)``.
+    """
+    return np.einsum("nij,nj->ni", matrices[:, :, :2], points) + matrices[:, :, 2]
+
+
+def read_padstack_instance(pedb, inst, transforms):
+    """Read the indexed attributes of an EDB padstack instance, without transforming its position.
+
+    Parameters
+    ----------
+    pedb : :class:`pyedb.dotnet.edb.Edb`
+        EDB object creating the points of the component transforms.
+    inst : Ansys.Ansoft.Edb.Cell.Primitive.PadstackInstance
+        EDB padstack instance.
+    transforms : dict
+        Matrices from :func:`read_component_transform` by component name. The matrix of the instance
+        component is added when it is missing.
+
+    Returns
+    -------
+    tuple
+        ``(id, type, net, start_layer, stop_layer, is_void, bbox, area)`` record, with the point bounding box of
+        the position in the component coordinates for component pins, followed by the
+        ``(rotation, definition, component)`` placement.
+    """
+    valid, point, rotation = inst.GetPositionAndRotationValue()
+    component = inst.GetComponent()
+    if valid or component:
+        x, y = point.X.ToDouble(), point.Y.ToDouble()
+    else:
+        x = y = np.nan
+    component_name = None
+    if component:
+        component_name = component.GetName()
+        if component_name not in transforms:
+            transforms[component_name] = read_component_transform(pedb, component)
+    _, start_layer, stop_layer = inst.GetLayerRange()
+    record = (
+        inst.GetId(),
+        PADSTACK_INSTANCE_TYPE,
+        inst.GetNet().GetName(),
+        start_layer.GetName(),
+        stop_layer.GetName(),
+        False,
+        (x, y, x, y),
+        0.0,
+    )
+    placement = (rotation.ToDouble() if valid else np.nan, inst.GetPadstackDef().GetName(), component_name)
+    return record, placement
+
+
+def read_path_geometry(path):
+    """Read the width and the length of an EDB path.
+
+    Parameters
+    ----------
+    path : Ansys.Ansoft.Edb.Cell.Primitive.Path
+        EDB path.
+
+    Returns
+    -------
+    tuple
+        ``(width, length)``. The length is measured along the center line and includes the
+        extension of the end caps which are not flat.
+    """
+    width = path.GetWidth()
+    length = sum(arc.GetLength() for arc in list(path.GetCenterLine().GetArcData()))
+    end_cap_style = path.GetEndCapStyle()
+    if end_cap_style[0]:
+        if not end_cap_style[1].value__ == 1:
+            length += width / 2
+        if not end_cap_style[2].value__ == 1:
+            length += width / 2
+    return width, length
+
+
+def read_pad_bbox(inst):
+    """Read the bounding box of the pads of a padstack instance.
+
+    Parameters
+    ----------
+    inst : Ansys.Ansoft.Edb.Cell.Primitive.PadstackInstance
+        EDB padstack instance.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        ``[xmin, ymin, xmax, ymax]``, or ``None`` if the instance has no layout instance.
+    """
+    obj_instance = inst.GetLayout().GetLayoutInstance().GetLayoutObjInstance(inst, None)
+    if obj_instance is None or obj_instance.IsNull():
+        return None
+    bbox = obj_instance.GetBBox()
+    return np.array(
+        [bbox.Item1.X.ToDouble(), bbox.Item1.Y.ToDouble(), bbox.Item2.X.ToDouble(), bbox.Item2.Y.ToDouble()]
+    )
+
+
+def read_layout_object(pedb, edb_object):
+    """Read the indexed attributes of an EDB primitive or padstack instance.
+
+    Parameters
+    ----------
+    pedb : :class:`pyedb.dotnet.edb.Edb`
+        EDB object creating the points of the component transforms.
+    edb_object : Ansys.Ansoft.Edb.Cell.Primitive.Primitive or Ansys.Ansoft.Edb.Cell.Primitive.PadstackInstance
+        EDB object.
+
+    Returns
+    -------
+    tuple
+        ``(id, type, net, layer, stop_layer, is_void, bbox, area)``, with the positions of the padstack
+        instances in layout coordinates.
+    """
+    if edb_object.GetObjType().ToString() != PADSTACK_INSTANCE_TYPE:
+        return read_primitive(edb_object)
+    transforms = {}
+    record, (_, _, component) = read_padstack_instance(pedb, edb_object, transforms)
+    if component is None:
+        return record
+    matrix = np.array([transforms[component]], dtype=np.float64)
+    x, y = transform_points(matrix, np.array([record[6][:2]], dtype=np.float64))[0].tolist()
+    return record[:6] + ((x, y, x, y),) + record[7:]
+
+
+class LayoutSnapshot(object):
+    """Columnar snapshot of the primitives and padstack instances of a layout.
+
+    The snapshot is built with a single pass over the EDB layout. Each row describes one
+    primitive or padstack instance and every attribute is stored in a NumPy array, so that
+    filters and aggregations are vectorized instead of crossing the .NET boundary per object.
+    Net, layer and type names are interned in lookup tables and the arrays store indices
+    into those tables. Padstack instance rows also store the rotation, padstack definition
+    and component of the instance, and their positions are transformed to layout coordinates
+    with one affine transform per component.
+
+    Parameters
+    ----------
+    pedb : :class:`pyedb.dotnet.edb.Edb`
+        Inherited object.
+    edb_layout : Ansys.Ansoft.Edb.Cell.Layout, optional
+        EDB layout to extract. The default is ``None``, in which case an empty snapshot is created.
+
+    Examples
+    --------
+    >>> from pyedb import Edb
+    >>> edbapp = Edb("myaedbfolder")
+    >>> snapshot = edbapp.layout.snapshot
+    >>> gnd_ids = snapshot.ids[snapshot.mask(nets="GND", layers="1_Top")]
+    >>> snapshot.to_dataframe()
+    """
+
+    def __init__(self, pedb, edb_layout=None):
+        self._pedb = pedb
+        self.type_names = []
+        self.net_names = []
+        self.layer_names = []
+        self.definition_names = []
+        self.component_names = []
+        self._type_lookup = {}
+        self._net_lookup = {}
+        self._layer_lookup = {}
+        self._definition_lookup = {}
+        self._component_lookup = {}
+        self._row_by_id = {}
+        self._edb_objects = []
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.type_index = np.zeros(0, dtype=np.int32)
+        self.net_index = np.zeros(0, dtype=np.int32)
+        self.layer_index = np.zeros(0, dtype=np.int32)
+        self.stop_layer_index = np.zeros(0, dtype=np.int32)
+        self.is_void = np.zeros(0, dtype=bool)
+        self.bbox = np.zeros((0, 4), dtype=np.float64)
+        self.area = np.zeros(0, dtype=np.float64)
+        self.position = np.zeros((0, 2), dtype=np.float64)
+        self.rotation = np.zeros(0, dtype=np.float64)
+        self.definition_index = np.zeros(0, dtype=np.int32)
+        self.component_index = np.zeros(0, dtype=np.int32)
+        self._width = None
+        self._length = None
+        self._pad_bbox = None
+        if edb_layout is not None:
+            self._extract(edb_layout)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, obj_id):
+        return obj_id in self._row_by_id
+
+    @staticmethod
+    def _intern(table, lookup, name):
+        index = lookup.get(name)
+        if index is None:
+            index = len(table)
+            lookup[name] = index
+            table.append(name)
+        return index
+
+    def _extract(self, edb_layout):
+        ids = []
+        types = []
+        nets = []
+        layers = []
+        stop_layers = []
+        voids = []
+        bboxes = []
+        areas = []
+        rotations = []
+        definitions = []
+        components = []
+        void_ids = {}
+        transforms = {}
+
+        def add_row(edb_object, record, placement=None):
+            obj_id, obj_type, net, layer, stop_layer, is_void, box, area = record
+            self._row_by_id[obj_id] = len(ids)
+            self._edb_objects.append(edb_object)
+            ids.append(obj_id)
+            types.append(self._intern(self.type_names, self._type_lookup, obj_type))
+            nets.append(self._intern(self.net_names, self._net_lookup, net))
+            layers.append(self._intern(self.layer_names, self._layer_lookup, layer))
+            stop_layers.append(self._intern(self.layer_names, self._layer_lookup, stop_layer))
+            voids.append(is_void)
+            bboxes.append(box)
+            areas.append(area)
+            if placement is None:
+                rotations.append(np.nan)
+                definitions.append(-1)
+                components.append(-1)
+                return
+            rotation, definition, component = placement
+            rotations.append(rotation)
+            definitions.append(self._intern(self.definition_names, self._definition_lookup, definition))
+            if component is None:
+                components.append(-1)
+            else:
+                components.append(self._intern(self.component_names, self._component_lookup, component))
+
+        for prim in list(edb_layout.Primitives):
+            record = read_primitive(prim)
+            if record[1] in _POLYGON_TYPES and not record[5]:
+                prim_voids = list(prim.Voids)
+                if prim_voids:
+                    void_ids[len(ids)] = prim_voids
+            add_row(prim, record)
+        for inst in list(edb_layout.PadstackInstances):
+            add_row(inst, *read_padstack_instance(self._pedb, inst, transforms))
+        # Voids which are not listed with the layout primitives are added so that every void can be found by id.
+        for prim_voids in void_ids.values():
+            for void in prim_voids:
+                if void.GetId() not in self._row_by_id:
+                    add_row(void, read_primitive(void))
+
+        # Area is reported net of voids, consistently with ``Primitive.area()``.
+        for row, prim_voids in void_ids.items():
+            for void in prim_voids:
+                areas[row] -= areas[self._row_by_id[void.GetId()]]
+
+        self.ids = np.array(ids, dtype=np.int64)
+        self.type_index = np.array(types, dtype=np.int32)
+        self.net_index = np.array(nets, dtype=np.int32)
+        self.layer_index = np.array(layers, dtype=np.int32)
+        self.stop_layer_index = np.array(stop_layers, dtype=np.int32)
+        self.is_void = np.array(voids, dtype=bool)
+        self.bbox = np.array(bboxes, dtype=np.float64).reshape(-1, 4)
+        self.area = np.array(areas, dtype=np.float64)
+        self.rotation = np.array(rotations, dtype=np.float64)
+        self.definition_index = np.array(definitions, dtype=np.int32)
+        self.component_index = np.array(components, dtype=np.int32)
+
+        # Pin positions are transformed once per component with the matrix of its transform.
+        rows = np.flatnonzero(self.component_index >= 0)
+        if len(rows):
+            matrices = np.array([transforms[name] for name in self.component_names], dtype=np.float64)
+            matrices = matrices[self.component_index[rows]]
+            points = transform_points(matrices, self.bbox[rows, :2])
+            self.bbox[rows] = np.hstack([points, points])
+        self.position = (self.bbox[:, :2] + self.bbox[:, 2:]) / 2
+
+    @staticmethod
+    def _indices(lookup, names):
+        if isinstance(names, str):
+            names = [names]
+        return [lookup[name] for name in names if name in lookup]
+
+    @property
+    def edb_objects(self):
+        """EDB objects aligned with the snapshot rows.
+
+        Returns
+        -------
+        list
+        """
+        return self._edb_objects
+
+    @property
+    def width(self):
+        """Width of the paths, ``NaN`` for the other objects.
+
+        Path geometry is only read from EDB on first access of :attr:`width` or :attr:`length`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        if self._width is None:
+            self._read_paths()
+        return self._width
+
+    @property
+    def length(self):
+        """Length of the paths, including their end caps, ``NaN`` for the other objects.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        if self._length is None:
+            self._read_paths()
+        return self._length
+
+    def _read_paths(self):
+        width = np.full(len(self), np.nan)
+        length = np.full(len(self), np.nan)
+        for row in np.flatnonzero(self.type_index == self._type_lookup.get("Path", -1)).tolist():
+            width[row], length[row] = read_path_geometry(self._edb_objects[row])
+        self._width = width
+        self._length = length
+
+    @property
+    def pad_bbox(self):
+        """Bounding boxes of the pads of the padstack instances, ``NaN`` for the other objects.
+
+        Instances sharing a definition, a layer range, a component and a rotation only differ by their position.
+        The pad bounding box is therefore read from EDB on one instance of each such group, on first access.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Array with shape ``(n, 4)``.
+        """
+        if self._pad_bbox is None:
+            self._read_pad_bboxes()
+        return self._pad_bbox
+
+    def _read_pad_bboxes(self):
+        pad_bbox = np.full((len(self), 4), np.nan)
+        rows = np.flatnonzero(self.is_padstack_instance)
+        if len(rows):
+            keys = np.column_stack(
+                [
+                    self.definition_index[rows],
+                    self.layer_index[rows],
+                    self.stop_layer_index[rows],
+                    self.component_index[rows],
+                    np.round(np.nan_to_num(self.rotation[rows]), 9),
+                ]
+            )
+            _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+            offsets = np.empty((len(first), 4))
+            for group, row in enumerate(rows[first].tolist()):
+                bbox = read_pad_bbox(self._edb_objects[row])
+                offsets[group] = bbox - np.tile(self.position[row], 2) if bbox is not None else np.zeros(4)
+            pad_bbox[rows] = np.tile(self.position[rows], 2) + offsets[inverse.reshape(-1)]
+        self._pad_bbox = pad_bbox
+
+    @property
+    def is_padstack_instance(self):
+        """Mask of the rows describing padstack instances.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        return self.type_index == self._type_lookup.get(PADSTACK_INSTANCE_TYPE, -1)
+
+    @property
+    def is_primitive(self):
+        """Mask of the rows describing primitives.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        return ~self.is_padstack_instance
+
+    def mask(self, nets=None, layers=None, types=None, is_void=None):
+        """Compute a boolean row mask from the given filters.
+
+        Parameters
+        ----------
+        nets : str, list, optional
+            Net names to keep. The default is ``None``, in which case all nets are kept.
+        layers : str, list, optional
+            Layer names to keep. Padstack instances are kept if their start or stop layer matches.
+            The default is ``None``, in which case all layers are kept.
+        types : str, list, optional
+            Object types to keep, for example ``"Path"``, ``"Polygon"`` or ``"PadstackInstance"``.
+            The default is ``None``, in which case all types are kept.
+        is_void : bool, optional
+            Whether to keep only voids (``True``) or only non-void objects (``False``).
+            The default is ``None``, in which case both are kept.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Boolean array aligned with the snapshot rows.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if nets is not None:
+            mask &= np.isin(self.net_index, self._indices(self._net_lookup, nets))
+        if layers is not None:
+            layer_indices = self._indices(self._layer_lookup, layers)
+            mask &= np.isin(self.layer_index, layer_indices) | np.isin(self.stop_layer_index, layer_indices)
+        if types is not None:
+            mask &= np.isin(self.type_index, self._indices(self._type_lookup, types))
+        if is_void is not None:
+            mask &= self.is_void == bool(is_void)
+        return mask
+
+    def row(self, obj_id):
+        """Row index of an object.
+
+        Parameters
+        ----------
+        obj_id : int
+            EDB ID of the primitive or padstack instance.
+
+        Returns
+        -------
+        int
+            Row index, or ``-1`` if the object is not part of the snapshot.
+        """
+        return self._row_by_id.get(obj_id, -1)
+
+    def get_object(self, row):
+        """Get the pyedb object of a row.
+
+        Parameters
+        ----------
+        row : int
+            Row index.
+
+        Returns
+        -------
+        :class:`pyedb.dotnet.edb_core.edb_data.padstacks_data.EDBPadstackInstance` or primitive object
+        """
+        from pyedb.dotnet.edb_core.cell.layout import primitive_cast
+        from pyedb.dotnet.edb_core.edb_data.padstacks_data import EDBPadstackInstance
+
+        edb_object = self._edb_objects[row]
+        if self.type_index[row] == self._type_lookup.get(PADSTACK_INSTANCE_TYPE, -1):
+            return EDBPadstackInstance(edb_object, self._pedb)
+        return primitive_cast(self._pedb, edb_object)
+
+    def get_proxies(self, mask=None):
+        """Get compact proxies of the rows.
+
+        Parameters
+        ----------
+        mask : :class:`numpy.ndarray`, optional
+            Row mask. The default is ``None``, in which case all rows are returned.
+
+        Returns
+        -------
+        list of :class:`pyedb.dotnet.edb_core.cell.layout_proxy.PrimitiveProxy` and
+        :class:`pyedb.dotnet.edb_core.cell.layout_proxy.PadstackInstanceProxy`
+        """
+        rows = range(len(self)) if mask is None else np.flatnonzero(mask).tolist()
+        padstack_type = self._type_lookup.get(PADSTACK_INSTANCE_TYPE, -1)
+        type_index = self.type_index.tolist()
+        return [
+            PadstackInstanceProxy(self, row) if type_index[row] == padstack_type else PrimitiveProxy(self, row)
+            for row in rows
+        ]
+
+    def area_by_layer(self, mask=None):
+        """Sum the area per layer.
+
+        Parameters
+        ----------
+        mask : :class:`numpy.ndarray`, optional
+            Row mask to apply before the aggregation. The default is ``None``.
+
+        Returns
+        -------
+        dict
+            Dictionary of layer names with their total area.
+        """
+        layer_index = self.layer_index if mask is None else self.layer_index[mask]
+        area = self.area if mask is None else self.area[mask]
+        totals = np.bincount(layer_index, weights=area, minlength=len(self.layer_names))
+        return {name: float(totals[i]) for i, name in enumerate(self.layer_names)}
+
+    def to_dataframe(self):
+        """Export the snapshot to a pandas DataFrame.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+        """
+        import pandas as pd
+
+        type_names = np.array(self.type_names, dtype=object)
+        net_names = np.array(self.net_names, dtype=object)
+        layer_names = np.array(self.layer_names, dtype=object)
+        # The trailing ``None`` is picked by the ``-1`` index of rows without definition or component.
+        definition_names = np.array(self.definition_names + [None], dtype=object)
+        component_names = np.array(self.component_names + [None], dtype=object)
+        return pd.DataFrame(
+            {
+                "id": self.ids,
+                "type": type_names[self.type_index],
+                "net": net_names[self.net_index],
+                "layer": layer_names[self.layer_index],
+                "stop_layer": layer_names[self.stop_layer_index],
+                "is_void": self.is_void,
+                "xmin": self.bbox[:, 0],
+                "ymin": self.bbox[:, 1],
+                "xmax": self.bbox[:, 2],
+                "ymax": self.bbox[:, 3],
+                "area": self.area,
+                "x": self.position[:, 0],
+                "y": self.position[:, 1],
+                "rotation": self.rotation,
+                "definition": definition_names[self.definition_index],
+                "component": component_names[self.component_index],
+            }
+        )
@@ -0,0 +1,155 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains the ``PinLocator`` class, a nearest neighbor index of padstack instance positions.
+"""
+import numpy as np
+import rtree
+
+
+class PinLocator(object):
+    """Nearest neighbor index of padstack instance positions.
+
+    Positions are bulk-loaded in an R-tree, which is queried for the candidates of each query point.
+    Candidates are then ranked by their exact distance, ties being broken by EDB ID, so that results are
+    stable and no equidistant pin is dropped.
+
+    Parameters
+    ----------
+    ids : list, :class:`numpy.ndarray`
+        EDB IDs of the padstack instances.
+    positions : list, :class:`numpy.ndarray`
+        Positions of the padstack instances, with shape ``(n, 2)``.
+
+    Examples
+    --------
+    >>> from pyedb import Edb
+    >>> edbapp = Edb("myaedbfolder")
+    >>> locator = edbapp.padstacks.get_pin_locator("GND", component="U1")
+    >>> ids, distances = locator.query([[0.0, 0.0], [1e-3, 0.0]], k=2, radius=5e-3)
+    """
+
+    def __init__(self, ids, positions):
+        self.ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        self.positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        valid = ~np.isnan(self.positions).any(axis=1)
+        self.ids = self.ids[valid]
+        self.positions = self.positions[valid]
+        self._tree = rtree.index.Index()
+        if len(self.ids):
+            self._tree = rtree.index.Index(
+                (row, (x, y, x, y), None) for row, (x, y) in enumerate(self.positions.tolist())
+            )
+
+    @classmethod
+    def from_snapshot(cls, snapshot, nets, component=None):
+        """Create a locator on the padstack instances of a layout snapshot.
+
+        Parameters
+        ----------
+        snapshot : :class:`pyedb.dotnet.edb_core.cell.layout_snapshot.LayoutSnapshot`
+            Layout snapshot.
+        nets : str, list
+            Net names of the padstack instances.
+        component : str, optional
+            Name of the component of the padstack instances. The default is ``None``, in which case the
+            padstack instances of all the layout are used.
+
+        Returns
+        -------
+        :class:`PinLocator`
+        """
+        mask = snapshot.mask(nets=nets, types="PadstackInstance")
+        if component is not None:
+            if component not in snapshot.component_names:
+                mask[:] = False
+            else:
+                mask &= snapshot.component_index == snapshot.component_names.index(component)
+        return cls(snapshot.ids[mask], snapshot.position[mask])
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _rank(self, point, rows, k=None, radius=None):
+        rows = np.fromiter(rows, dtype=np.int64)
+        distances = np.hypot(*(self.positions[rows] - point).T)
+        if radius is not None:
+            keep = distances <= radius
+            rows, distances = rows[keep], distances[keep]
+        order = np.lexsort((self.ids[rows], distances))
+        if k:
+            order = order[:k]
+        return self.ids[rows[order]], distances[order]
+
+    def query(self, points, k=1, radius=None):
+        """Find the nearest padstack instances of several points.
+
+        Parameters
+        ----------
+        points : list, :class:`numpy.ndarray`
+            Query points, with shape ``(m, 2)``.
+        k : int, optional
+            Maximum number of padstack instances returned per point. The default is ``1``. When ``0`` or
+            ``None``, all the padstack instances within ``radius`` are returned.
+        radius : float, optional
+            Maximum distance to the query points. The default is ``None``, in which case the distance is not
+            limited.
+
+        Returns
+        -------
+        tuple[list[:class:`numpy.ndarray`], list[:class:`numpy.ndarray`]]
+            IDs and distances of the padstack instances found for each point, by increasing distance and ID.
+        """
+        if not k and radius is None:
+            raise ValueError("Either k or radius must be provided.")
+        ids, distances = [], []
+        for x, y in np.asarray(points, dtype=np.float64).reshape(-1, 2).tolist():
+            point = np.array([x, y])
+            if not len(self.ids):
+                rows = []
+            elif radius is not None:
+                rows = self._tree.intersection((x - radius, y - radius, x + radius, y + radius))
+            else:
+                # R-tree nearest queries return all the candidates tied with the k-th one.
+                rows = self._tree.nearest((x, y, x, y), k)
+            point_ids, point_distances = self._rank(point, rows, k, radius)
+            ids.append(point_ids)
+            distances.append(point_distances)
+        return ids, distances
+
+    def query_radius(self, points, radius):
+        """Find all the padstack instances within a distance of several points.
+
+        Parameters
+        ----------
+        points : list, :class:`numpy.ndarray`
+            Query points, with shape ``(m, 2)``.
+        radius : float
+            Maximum distance to the query points.
+
+        Returns
+        -------
+        tuple[list[:class:`numpy.ndarray`], list[:class:`numpy.ndarray`]]
+            IDs and distances of the padstack instances found for each point, by increasing distance and ID.
+        """
+        return self.query(points, k=None, radius=radius)
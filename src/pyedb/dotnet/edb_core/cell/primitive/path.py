@@ -21,6 +21,7 @@
 # SOFTWARE.
 import math
 
+from pyedb.dotnet.edb_core.cell.layout_snapshot import read_path_geometry
 from pyedb.dotnet.edb_core.cell.primitive.primitive import Primitive
 from pyedb.dotnet.edb_core.general import convert_py_list_to_net_list
 from pyedb.dotnet.edb_core.geometry.point_data import PointData
@@ -44,6 +45,7 @@ class Path(Primitive):
     @width.setter
     def width(self, value):
         self.primitive_object.SetWidth(self._pedb.edb_value(value))
+        self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
 
     def get_end_cap_style(self):
         """Get path end cap styles.
@@ -76,6 +78,7 @@ class Path(Primitive):
             End cap style of path end cap.
         """
         self._edb_object.SetEndCapStyle(end_cap1, end_cap2)
+        self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
 
     @property
     def length(self):
@@ -86,16 +89,7 @@ class Path(Primitive):
         float
             Path length in meters.
         """
-        center_line_arcs = list(self._edb_object.GetCenterLine().GetArcData())
-        path_length = 0.0
-        for arc in center_line_arcs:
-            path_length += arc.GetLength()
-        if self.get_end_cap_style()[0]:
-            if not self.get_end_cap_style()[1].value__ == 1:
-                path_length += self.width / 2
-            if not self.get_end_cap_style()[2].value__ == 1:
-                path_length += self.width / 2
-        return path_length
+        return read_path_geometry(self._edb_object)[1]
 
     def add_point(self, x, y, incremental=False):
         """Add a point at the end of the path.
@@ -123,7 +117,9 @@ class Path(Primitive):
             x = "({})+({})".format(x, last_point.X.ToString())
             y = "({})+({})".format(y, last_point.Y.ToString())
         center_line.AddPoint(PointData(self._pedb, x=x, y=y)._edb_object)
-        return self._edb_object.SetCenterLine(center_line)
+        result = self._edb_object.SetCenterLine(center_line)
+        self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
+        return result
 
     def get_center_line(self, to_string=False):
         """Get the center line of the trace.
@@ -321,8 +317,8 @@ class Path(Primitive):
             rightline.append(rightPt)
             return leftline, rightline
 
-        distance = self._pedb.edb_value(distance).ToDouble()
-        gap = self._pedb.edb_value(gap).ToDouble()
+        distance = self._pedb.value_to_float(distance)
+        gap = self._pedb.value_to_float(gap)
         center_line = self.get_center_line()
         leftline, rightline = getParalletLines(center_line, distance)
         for x, y in getLocations(rightline, gap) + getLocations(leftline, gap):
@@ -340,6 +336,7 @@ class Path(Primitive):
             points = [self._pedb.point_data(i[0], i[1]) for i in value]
             polygon_data = self._edb.geometry.polygon_data.dotnetobj(convert_py_list_to_net_list(points), False)
             self._edb_object.SetCenterLine(polygon_data)
+            self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
 
     @property
     def corner_style(self):
@@ -45,16 +45,21 @@ class Primitive(Connectable):
         self._app = self._pedb
         self.primitive_object = self._edb_object
 
+    @property
+    def _bondwire_type(self):
         bondwire_type = self._pedb._edb.Cell.Primitive.BondwireType
-        self._bondwire_type = {
+        return {
             "invalid": bondwire_type.Invalid,
             "apd": bondwire_type.ApdBondwire,
             "jedec_4": bondwire_type.Jedec4Bondwire,
             "jedec_5": bondwire_type.Jedec5Bondwire,
             "num_of_bondwire_type": bondwire_type.NumOfBondwireType,
         }
+
+    @property
+    def _bondwire_cross_section_type(self):
         bondwire_cross_section_type = self._pedb._edb.Cell.Primitive.BondwireCrossSectionType
-        self._bondwire_cross_section_type = {
+        return {
             "invalid": bondwire_cross_section_type.Invalid,
             "round": bondwire_cross_section_type.BondwireRound,
             "rectangle": bondwire_cross_section_type.BondwireRectangle,
@@ -124,6 +129,7 @@ class Primitive(Connectable):
             layer = self._core_stackup.layers[val]._edb_layer
             if layer:
                 self.primitive_object.SetLayer(layer)
+                self._app.layout._notify_change(created=[self._edb_object], deleted=[self.id])
             else:
                 raise AttributeError("Layer {} not found.".format(val))
         elif isinstance(val, type(self._core_stackup.layers[layer_list[0]])):
@@ -131,6 +137,7 @@ class Primitive(Connectable):
                 self.primitive_object.SetLayer(val._edb_layer)
             except:
                 raise AttributeError("Failed to assign new layer on primitive.")
+            self._app.layout._notify_change(created=[self._edb_object], deleted=[self.id])
         else:
             raise AttributeError("Invalid input value")
 
@@ -274,7 +281,7 @@ class Primitive(Connectable):
         if self.type == "Path":
             polygon_data = self._edb_object.GetPolygonData()
             polygon = self._app.modeler.create_polygon(polygon_data, self.layer_name, [], self.net_name)
-            self._edb_object.Delete()
+            self.delete()
             return polygon
         else:
             return False
@@ -389,14 +396,9 @@ class Primitive(Connectable):
                 self._app.modeler.create_polygon(p, self.layer_name, net_name=self.net_name, voids=[]),
             )
         self.delete()
-        for prim in primitives:
-            if isinstance(prim, Primitive):
-                prim.delete()
-            else:
-                try:
-                    prim.Delete()
-                except AttributeError:
-                    continue
+        self._pedb.layout._delete_objects(
+            [prim for prim in primitives if hasattr(getattr(prim, "_edb_object", prim), "Delete")], include_voids=True
+        )
         return new_polys
 
     def intersect(self, primitives):
@@ -460,14 +462,9 @@ class Primitive(Connectable):
                         self._app.modeler.create_polygon(p, self.layer_name, net_name=self.net_name, voids=list_void)
                     )
         self.delete()
-        for prim in primitives:
-            if isinstance(prim, Primitive):
-                prim.delete()
-            else:
-                try:
-                    prim.Delete()
-                except AttributeError:
-                    continue
+        self._pedb.layout._delete_objects(
+            [prim for prim in primitives if hasattr(getattr(prim, "_edb_object", prim), "Delete")], include_voids=True
+        )
         return new_polys
 
     def unite(self, primitives):
@@ -511,14 +508,9 @@ class Primitive(Connectable):
                     self._app.modeler.create_polygon(p, self.layer_name, net_name=self.net_name, voids=list_void),
                 )
         self.delete()
-        for prim in primitives:
-            if isinstance(prim, Primitive):
-                prim.delete()
-            else:
-                try:
-                    prim.Delete()
-                except AttributeError:
-                    continue
+        self._pedb.layout._delete_objects(
+            [prim for prim in primitives if hasattr(getattr(prim, "_edb_object", prim), "Delete")], include_voids=True
+        )
         return new_polys
 
     def get_closest_arc_midpoint(self, point):
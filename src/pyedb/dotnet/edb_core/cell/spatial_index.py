@@ -0,0 +1,214 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains the ``LayoutSpatialIndex`` class, an R-tree index of the layout objects.
+"""
+import math
+
+import rtree
+
+from pyedb.dotnet.edb_core.cell.layout_snapshot import (
+    PADSTACK_INSTANCE_TYPE,
+    read_layout_object,
+)
+from pyedb.dotnet.edb_core.utilities.obj_base import ObjBase
+
+
+class LayoutSpatialIndex(object):
+    """R-tree index of the primitives and padstack instances of a layout.
+
+    Primitives are indexed by their bounding box and padstack instances by their position. The index is
+    bulk-loaded from a :class:`LayoutSnapshot <pyedb.dotnet.edb_core.cell.layout_snapshot.LayoutSnapshot>`
+    with stream loading and is then updated in place by the layout when objects are created or deleted
+    through pyedb. Objects without a bounding box, like bondwires and texts, are not indexed.
+
+    Parameters
+    ----------
+    snapshot : :class:`pyedb.dotnet.edb_core.cell.layout_snapshot.LayoutSnapshot`, optional
+        Snapshot to load. The default is ``None``, in which case an empty index is created.
+    layer_order : list, optional
+        Stackup layer names ordered from top to bottom. It is used to match padstack instances on all the
+        layers they span. The default is ``None``, in which case only the start and stop layers are matched.
+    pedb : :class:`pyedb.dotnet.edb.Edb`, optional
+        EDB object reading the inserted component pins. The default is ``None``, in which case the EDB object
+        of the snapshot is used.
+
+    Examples
+    --------
+    >>> from pyedb import Edb
+    >>> edbapp = Edb("myaedbfolder")
+    >>> index = edbapp.layout.spatial_index
+    >>> ids = index.intersection([0, 0, 1e-3, 1e-3], nets=["GND"], layers=["1_Top"])
+    """
+
+    def __init__(self, snapshot=None, layer_order=None, pedb=None):
+        if pedb is None and snapshot is not None:
+            pedb = snapshot._pedb
+        self._pedb = pedb
+        self._layer_position = {name: i for i, name in enumerate(layer_order or [])}
+        self._layer_order = list(layer_order or [])
+        self._records = {}
+        stream = []
+        if snapshot is not None:
+            type_names = snapshot.type_names
+            net_names = snapshot.net_names
+            layer_names = snapshot.layer_names
+            for row, obj_id in enumerate(snapshot.ids.tolist()):
+                bbox = tuple(snapshot.bbox[row].tolist())
+                record = self._add_record(
+                    obj_id,
+                    type_names[snapshot.type_index[row]],
+                    net_names[snapshot.net_index[row]],
+                    layer_names[snapshot.layer_index[row]],
+                    layer_names[snapshot.stop_layer_index[row]],
+                    bbox,
+                )
+                if record:
+                    stream.append((obj_id, bbox, None))
+        if stream:
+            self._index = rtree.index.Index(iter(stream))
+        else:
+            self._index = rtree.index.Index()
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, obj_id):
+        return obj_id in self._records
+
+    def _layer_span(self, obj_type, layer, stop_layer):
+        if obj_type != PADSTACK_INSTANCE_TYPE or layer == stop_layer:
+            return frozenset([layer])
+        start = self._layer_position.get(layer)
+        stop = self._layer_position.get(stop_layer)
+        if start is None or stop is None:
+            return frozenset([layer, stop_layer])
+        if start > stop:
+            start, stop = stop, start
+        return frozenset(self._layer_order[start : stop + 1])
+
+    def _add_record(self, obj_id, obj_type, net, layer, stop_layer, bbox):
+        if any(math.isnan(i) for i in bbox):
+            return None
+        record = (obj_type, net, self._layer_span(obj_type, layer, stop_layer), bbox)
+        self._records[obj_id] = record
+        return record
+
+    def insert(self, edb_object):
+        """Add a primitive or a padstack instance to the index.
+
+        Parameters
+        ----------
+        edb_object : :class:`pyedb.dotnet.edb_core.cell.primitive.primitive.Primitive`, \
+        :class:`pyedb.dotnet.edb_core.edb_data.padstacks_data.EDBPadstackInstance` or EDB object
+            Object to add.
+
+        Returns
+        -------
+        bool
+            ``True`` when the object was indexed, ``False`` when it has no bounding box.
+        """
+        if isinstance(edb_object, ObjBase):
+            edb_object = edb_object._edb_object
+        obj_id, obj_type, net, layer, stop_layer, _, bbox, _ = read_layout_object(self._pedb, edb_object)
+        self.delete(obj_id)
+        if not self._add_record(obj_id, obj_type, net, layer, stop_layer, bbox):
+            return False
+        self._index.insert(obj_id, bbox)
+        return True
+
+    def delete(self, obj_id):
+        """Remove an object from the index.
+
+        Parameters
+        ----------
+        obj_id : int
+            EDB ID of the object.
+
+        Returns
+        -------
+        bool
+            ``True`` when the object was removed, ``False`` when it was not indexed.
+        """
+        record = self._records.pop(obj_id, None)
+        if record is None:
+            return False
+        self._index.delete(obj_id, record[3])
+        return True
+
+    def bounding_box(self, obj_id):
+        """Bounding box of an indexed object.
+
+        Parameters
+        ----------
+        obj_id : int
+            EDB ID of the object.
+
+        Returns
+        -------
+        list
+            ``[xmin, ymin, xmax, ymax]``, or ``None`` if the object is not indexed.
+        """
+        record = self._records.get(obj_id)
+        return list(record[3]) if record else None
+
+    def intersection(self, bounding_box, nets=None, layers=None, types=None):
+        """Find the objects intersecting a bounding box.
+
+        Parameters
+        ----------
+        bounding_box : list, tuple
+            Bounding box ``[xmin, ymin, xmax, ymax]``.
+        nets : str, list, optional
+            Net names to keep. The default is ``None``, in which case all nets are kept.
+        layers : str, list, optional
+            Layer names to keep. Padstack instances are kept if they span one of the layers.
+            The default is ``None``, in which case all layers are kept.
+        types : str, list, optional
+            Object types to keep, for example ``"Path"`` or ``"PadstackInstance"``.
+            The default is ``None``, in which case all types are kept.
+
+        Returns
+        -------
+        list
+            EDB IDs of the objects.
+        """
+        if not len(bounding_box) == 4:
+            raise ValueError("The bounding box length must be equal to 4")
+        nets = [nets] if isinstance(nets, str) else nets
+        layers = [layers] if isinstance(layers, str) else layers
+        types = [types] if isinstance(types, str) else types
+        nets = set(nets) if nets is not None else None
+        layers = set(layers) if layers is not None else None
+        types = set(types) if types is not None else None
+        ids = []
+        for obj_id in self._index.intersection(tuple(bounding_box)):
+            obj_type, net, span, _ = self._records[obj_id]
+            if nets is not None and net not in nets:
+                continue
+            if types is not None and obj_type not in types:
+                continue
+            if layers is not None and layers.isdisjoint(span):
+                continue
+            ids.append(obj_id)
+        return ids
@@ -37,6 +37,7 @@ from pyedb.component_libraries.ansys_components import (
 )
 from pyedb.dotnet.clr_module import String
 from pyedb.dotnet.edb_core.cell.hierarchy.component import EDBComponent
+from pyedb.dotnet.edb_core.cell.pin_locator import PinLocator
 from pyedb.dotnet.edb_core.definition.component_def import EDBComponentDef
 from pyedb.dotnet.edb_core.edb_data.padstacks_data import EDBPadstackInstance
 from pyedb.dotnet.edb_core.edb_data.sources import Source, SourceType
@@ -47,6 +48,7 @@ from pyedb.generic.general_methods import (
     generate_unique_name,
     get_filename_without_extension,
 )
+from pyedb.generic.value_parser import parse_value
 from pyedb.modeler.geometry_operators import GeometryOperators
 
 
@@ -64,6 +66,9 @@ def resistor_value_parser(RValue):
         Resistor value.
 
     """
+    value = parse_value(RValue)
+    if value is not None:
+        return value
     if isinstance(RValue, str):
         RValue = RValue.replace(" ", "")
         RValue = RValue.replace("meg", "m")
@@ -112,6 +117,7 @@ class Components(object):
     def __init__(self, p_edb):
         self._pedb = p_edb
         self._cmp = {}
+        self._cmp_version = None
         self._res = {}
         self._cap = {}
         self._ind = {}
@@ -205,7 +211,7 @@ class Components(object):
         >>> edbapp.components.instances
 
         """
-        if not self._cmp:
+        if self._cmp_version != self._pedb.layout.version:
             self.refresh_components()
         return self._cmp
 
@@ -311,9 +317,11 @@ class Components(object):
     def refresh_components(self):
         """Refresh the component dictionary."""
         # self._logger.info("Refreshing the Components dictionary.")
+        layout = self._pedb.layout
         self._cmp = {}
-        for i in self._pedb.layout.groups:
+        for i in layout.groups:
             self._cmp[i.name] = i
+        self._cmp_version = layout.version
         return True
 
     @property
@@ -507,15 +515,7 @@ class Components(object):
             List of components that belong to the signal nets.
 
         """
-        cmp_list = []
-        if isinstance(netlist, str):
-            netlist = [netlist]
-        components = list(self.instances.keys())
-        for refdes in components:
-            cmpnets = self._cmp[refdes].nets
-            if set(cmpnets).intersection(set(netlist)):
-                cmp_list.append(refdes)
-        return cmp_list
+        return self._pedb.nets.component_net_graph.components_on_nets(netlist or [])
 
     def _get_edb_pin_from_pin_name(self, cmp, pin):
         if not isinstance(cmp, self._pedb.edb_api.cell.hierarchy.component):
@@ -1042,7 +1042,7 @@ class Components(object):
             pad_params = self._padstack.get_pad_parameters(pin=cmp_pins[0], layername=pin_layers[0], pad_type=0)
             if not pad_params[0] == 7:
                 if not solder_balls_size:  # pragma no cover
-                    sball_diam = min([self._pedb.edb_value(val).ToDouble() for val in pad_params[1]])
+                    sball_diam = min([self._pedb.value_to_float(val) for val in pad_params[1]])
                     sball_mid_diam = sball_diam
                 else:  # pragma no cover
                     sball_diam = solder_balls_size
@@ -1198,21 +1198,20 @@ class Components(object):
         Edb pin.
 
         """
-        res, pin_position, pin_rot = pin.GetPositionAndRotation(
-            self._pedb.point_data(0.0, 0.0),
-            0.0,
-        )
-        distance = 1e3
+        snapshot = self._pedb.layout.snapshot
+
+        def position(edb_pin):
+            row = snapshot.row(edb_pin.GetId())
+            if row < 0:
+                return EDBPadstackInstance(edb_pin, self._pedb).position
+            return snapshot.position[row]
+
+        ref_ids = [ref_pin.GetId() for ref_pin in ref_pinlist]
+        locator = PinLocator(ref_ids, [position(ref_pin) for ref_pin in ref_pinlist])
+        ids, _ = locator.query([position(pin)], k=1)
         closest_pin = ref_pinlist[0]
-        for ref_pin in ref_pinlist:
-            res, ref_pin_position, ref_pin_rot = ref_pin.GetPositionAndRotation(
-                self._pedb.point_data(0.0, 0.0),
-                0.0,
-            )
-            temp_distance = pin_position.Distance(ref_pin_position)
-            if temp_distance < distance:
-                distance = temp_distance
-                closest_pin = ref_pin
+        if len(ids[0]):
+            closest_pin = ref_pinlist[ref_ids.index(int(ids[0][0]))]
         return closest_pin
 
     def replace_rlc_by_gap_boundaries(self, component=None):
@@ -1685,7 +1684,11 @@ class Components(object):
                 return False  # pragma no cover
         new_cmp.SetTransform(hosting_component_location)
         new_edb_comp = EDBComponent(self._pedb, new_cmp)
-        self._cmp[new_cmp.GetName()] = new_edb_comp
+        up_to_date = self._cmp_version == self._layout.version
+        self._layout._notify_change(created=[], deleted=[])
+        if up_to_date:
+            self._cmp[new_cmp.GetName()] = new_edb_comp
+            self._cmp_version = self._layout.version
         return new_edb_comp
 
     def create_component_from_pins(
@@ -1816,6 +1819,7 @@ class Components(object):
             if not edbComponent.SetComponentProperty(edbRlcComponentProperty):
                 self._logger.error("Error assigning the `Touchstone` model")
                 return False
+        self._layout._component_model_version += 1
         return True
 
     def create_pingroup_from_pins(self, pins, group_name=None):
@@ -1921,6 +1925,7 @@ class Components(object):
                     val.edbcomponent.Delete()
                     deleted_comps.append(comp)
         if not deactivate_only:
+            self._layout._notify_change(created=[], deleted=[])
             self.refresh_components()
         self._pedb._logger.info("Deleted {} components".format(len(deleted_comps)))
 
@@ -1977,8 +1982,11 @@ class Components(object):
         edb_cmp = self.get_component_by_name(component_name)._edb_object
         if edb_cmp is not None:
             edb_cmp.Delete()
-            if edb_cmp in list(self.instances.keys()):
-                del self.components[edb_cmp]
+            up_to_date = self._cmp_version == self._layout.version
+            self._layout._notify_change(created=[], deleted=[])
+            if up_to_date:
+                self._cmp.pop(component_name, None)
+                self._cmp_version = self._layout.version
             return True
         return False
 
@@ -2015,6 +2023,7 @@ class Components(object):
             pin_pair_model.SetPinPairRlc(list(pin_pair_model.PinPairs)[0], pprlc)
             rlc_property.SetModel(pin_pair_model)
             edb_cmp.SetComponentProperty(rlc_property)
+            self._layout._component_model_version += 1
             return True
         return False
 
@@ -2083,7 +2092,7 @@ class Components(object):
             pin1 = list(cmp.pins.values())[0].pin
             pin_layers = pin1.GetPadstackDef().GetData().GetLayerNames()
             pad_params = self._padstack.get_pad_parameters(pin=pin1, layername=pin_layers[0], pad_type=0)
-            _sb_diam = min([abs(self._get_edb_value(val).ToDouble()) for val in pad_params[1]])
+            _sb_diam = min([abs(self._pedb.value_to_float(val)) for val in pad_params[1]])
             sball_diam = 0.8 * _sb_diam
         if sball_height:
             sball_height = round(self._edb.utility.Value(sball_height).ToDouble(), 9)
@@ -2198,6 +2207,7 @@ class Components(object):
             ):
                 self._logger.error("Failed to set RLC model on component")
                 return False
+            self._layout._component_model_version += 1
         else:
             self._logger.warning(
                 "Component %s has not been assigned because either it is not present in the layout "
@@ -0,0 +1,107 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains the ``CutoutPlan`` class, the result of a cutout dry run.
+"""
+
+
+class CutoutPlan(object):
+    """Objects kept, deleted and clipped by a cutout, computed without modifying the database.
+
+    A plan is returned by :func:`pyedb.dotnet.edb.Edb.cutout` with ``plan=True`` and applied by passing it back
+    with ``plan=<CutoutPlan>``. It is valid as long as the layout is not modified or reopened.
+
+    Parameters
+    ----------
+    pedb : :class:`pyedb.dotnet.edb.Edb`
+        EDB object.
+    extent : Ansys.Ansoft.Edb.Geometry.PolygonData
+        Cutout extent.
+    signal_nets : list
+        Signal nets of the cutout.
+    reference_nets : list
+        Reference nets of the cutout.
+    """
+
+    def __init__(self, pedb, extent, signal_nets, reference_nets):
+        self._pedb = pedb
+        self.extent = extent
+        self.signal_nets = list(signal_nets)
+        self.reference_nets = list(reference_nets)
+        self._layout = pedb.layout
+        self.layout_version = pedb.layout.version
+        self.cutout_backend = "dotnet"
+        self.include_voids_in_extents = False
+        self.nets_to_delete = []
+        self.padstack_instances_to_delete = []
+        self.primitives_to_delete = []
+        self.primitives_to_clip = []
+        self.paths_to_clip = []
+        self.polygons_to_create = []
+        self.components_to_delete = []
+        self.timings = {}
+
+    @property
+    def extent_points(self):
+        """Extent points without arcs.
+
+        Returns
+        -------
+        list[list[float, float]]
+        """
+        return [[pt.X.ToDouble(), pt.Y.ToDouble()] for pt in list(self.extent.GetPolygonWithoutArcs().Points)]
+
+    @property
+    def is_valid(self):
+        """Whether the layout was not modified or reopened since the plan was computed.
+
+        Returns
+        -------
+        bool
+        """
+        # The layout object is recreated with a new mutation counter when a design is opened.
+        layout = self._pedb.layout
+        return layout is self._layout and layout.version == self.layout_version
+
+    @property
+    def summary(self):
+        """Number of objects of each set and duration of each stage in seconds.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            "nets_to_delete": len(self.nets_to_delete),
+            "padstack_instances_to_delete": len(self.padstack_instances_to_delete),
+            "primitives_to_delete": len(self.primitives_to_delete),
+            "primitives_to_clip": len(self.primitives_to_clip),
+            "paths_to_clip": len(self.paths_to_clip),
+            "polygons_to_create": len(self.polygons_to_create),
+            "components_to_delete": len(self.components_to_delete),
+            "timings": dict(self.timings),
+        }
+
+    def __repr__(self):
+        counts = ", ".join("{}={}".format(k, v) for k, v in self.summary.items() if k != "timings")
+        return "CutoutPlan({})".format(counts)
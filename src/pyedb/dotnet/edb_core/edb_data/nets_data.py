@@ -49,6 +49,23 @@ class EDBNetsData(NetDotNet):
         self._edb_object = raw_net
         NetDotNet.__init__(self, self._app, raw_net)
 
+    @property
+    def name(self):
+        """Net name.
+
+        Returns
+        -------
+        str
+        """
+        if self.net_object:
+            return self.net_object.GetName()
+
+    @name.setter
+    def name(self, value):
+        if self.net_object:
+            self.net_object.SetName(value)
+            self._app.layout._notify_change()
+
     @property
     def primitives(self):
         """Return the list of primitives that belongs to the net.
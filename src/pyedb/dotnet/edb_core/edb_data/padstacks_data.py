@@ -718,7 +718,7 @@ class EDBPadstack(object):
         float
             Thickness of the hole plating if present.
         """
-        value = self._get_edb_value(value).ToDouble()
+        value = self._ppadstack._pedb.value_to_float(value)
         hr = 200 * float(value) / float(self.hole_properties[0])
         self.hole_plating_ratio = hr
 
@@ -1014,6 +1014,7 @@ class EDBPadstack(object):
             if self.via_stop_layer == stop:
                 break
         i = 0
+        created = []
         for via in list(self.padstack_instances.values()):
             for inst in new_instances:
                 instance = inst.edb_padstack
@@ -1040,8 +1041,10 @@ class EDBPadstack(object):
                     None,
                 )
                 padstack_instance._edb_object.SetIsLayoutPin(via.is_pin)
+                created.append(padstack_instance)
                 i += 1
             via.delete()
+        self._ppadstack._pedb.layout._notify_change(created=created)
         self._ppadstack._pedb.logger.info("Created {} new microvias.".format(i))
         return new_instances
 
@@ -1589,6 +1592,7 @@ class EDBPadstackInstance(Primitive):
         stop_layer = self._pedb.stackup.signal_layers[self.stop_layer]._edb_layer
         layer = self._pedb.stackup.signal_layers[layer_name]._edb_layer
         self._edb_padstackinstance.SetLayerRange(layer, stop_layer)
+        self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
 
     @property
     def stop_layer(self):
@@ -1611,6 +1615,7 @@ class EDBPadstackInstance(Primitive):
         start_layer = self._pedb.stackup.signal_layers[self.start_layer]._edb_layer
         layer = self._pedb.stackup.signal_layers[layer_name]._edb_layer
         self._edb_padstackinstance.SetLayerRange(start_layer, layer)
+        self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
 
     @property
     def layer_range_names(self):
@@ -1695,6 +1700,7 @@ class EDBPadstackInstance(Primitive):
                 pos.append(v)
         point_data = self._pedb.edb_api.geometry.point_data(pos[0], pos[1])
         self._edb_padstackinstance.SetPositionAndRotation(point_data, self._pedb.edb_value(self.rotation))
+        self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
 
     @property
     def rotation(self):
@@ -113,6 +113,9 @@ class EdbPolygon(Primitive):
                     self._app.active_layout, self.layer_name, self.net, p
                 )
                 new_polys.append(cloned_poly)
+            self._pedb.layout._notify_change(
+                created=[self._edb_object] + [getattr(i, "_edb_object", i) for i in new_polys], deleted=[self.id]
+            )
         return new_polys
 
     def duplicate_across_layers(self, layers):
@@ -172,7 +175,9 @@ class EdbPolygon(Primitive):
                 self.polygon_data._edb_object.GetArcData(), True
             )
             polygon_data.Move(_vector)
-            return self._edb_object.SetPolygonData(polygon_data)
+            result = self._edb_object.SetPolygonData(polygon_data)
+            self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
+            return result
         return False
 
     def rotate(self, angle, center=None):
@@ -205,13 +210,17 @@ class EdbPolygon(Primitive):
                 center = polygon_data.GetBoundingCircleCenter()
                 if center:
                     polygon_data.Rotate(angle * math.pi / 180, center)
-                    return self._edb_object.SetPolygonData(polygon_data)
+                    result = self._edb_object.SetPolygonData(polygon_data)
+                    self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
+                    return result
             elif isinstance(center, list) and len(center) == 2:
                 center = self._edb.Geometry.PointData(
                     self._edb.Utility.Value(center[0]), self._edb.Utility.Value(center[1])
                 )
                 polygon_data.Rotate(angle * math.pi / 180, center)
-                return self._edb_object.SetPolygonData(polygon_data)
+                result = self._edb_object.SetPolygonData(polygon_data)
+                self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
+                return result
         return False
 
     def move_layer(self, layer):
@@ -314,6 +323,7 @@ class EdbPolygon(Primitive):
     @polygon_data.setter
     def polygon_data(self, poly):
         self._edb_object.SetPolygonData(poly._edb_object)
+        self._pedb.layout._notify_change(created=[self._edb_object], deleted=[self.id])
 
     def expand(self, offset=0.001, tolerance=1e-12, round_corners=True, maximum_corner_extension=0.001):
         """Expand the polygon shape by an absolute value in all direction.
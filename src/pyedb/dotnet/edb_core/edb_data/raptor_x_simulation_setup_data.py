@@ -141,7 +141,7 @@ class RaptorXGeneralSettings(object):
 
     @global_temperature.setter
     def global_temperature(self, value):
-        self._general_settings.GlobalTemperature = self._pedb.edb_value(value).ToDouble()
+        self._general_settings.GlobalTemperature = self._pedb.value_to_float(value)
 
     @property
     def max_frequency(self):
@@ -169,7 +169,7 @@ class RaptorXSimulationAdvancedSettings(object):
 
     @auto_removal_sliver_poly.setter
     def auto_removal_sliver_poly(self, value):
-        self._advanced_settings.AutoRemovalSliverPoly = self._pedb.edb_value(value).ToDouble()
+        self._advanced_settings.AutoRemovalSliverPoly = self._pedb.value_to_float(value)
 
     @property
     def cell_per_wave_length(self):
@@ -211,7 +211,7 @@ class RaptorXSimulationAdvancedSettings(object):
 
     @eliminate_slit_per_hole.setter
     def eliminate_slit_per_hole(self, value):
-        self._advanced_settings.EliminateSlitPerHoles = self._pedb.edb_value(value).ToDouble()
+        self._advanced_settings.EliminateSlitPerHoles = self._pedb.value_to_float(value)
 
     @property
     def mesh_frequency(self):
@@ -248,7 +248,7 @@ class RaptorXSimulationAdvancedSettings(object):
 
     @override_shrink_fac.setter
     def override_shrink_fac(self, value):
-        self._advanced_settings.OverrideShrinkFac = self._pedb.edb_value(value).ToDouble()
+        self._advanced_settings.OverrideShrinkFac = self._pedb.value_to_float(value)
 
     @property
     def plane_projection_factor(self):
@@ -261,7 +261,7 @@ class RaptorXSimulationAdvancedSettings(object):
 
     @plane_projection_factor.setter
     def plane_projection_factor(self, value):
-        self._advanced_settings.PlaneProjectionFactor = self._pedb.edb_value(value).ToDouble()
+        self._advanced_settings.PlaneProjectionFactor = self._pedb.value_to_float(value)
 
     @property
     def use_accelerate_via_extraction(self):
@@ -0,0 +1,332 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains the ``ExtentBuilder`` class, computing the cutout extents with shapely from cached net footprints.
+"""
+import hashlib
+
+import numpy as np
+import shapely
+
+from pyedb.dotnet.edb_core.geometry.polygon_data import PolygonData
+from pyedb.dotnet.edb_core.shapely_cutout import (
+    ARC_TOLERANCE,
+    polygon_data_to_shapely,
+    shapely_to_point_lists,
+)
+
+
+class ExtentBuilder(object):
+    """Builder of conforming, convex hull and bounding box extents from cached net footprints.
+
+    The geometry of each net, its primitives and pads, is read once from the layout and kept with a stamp of
+    the net objects. Each net is then buffered once per expansion size, corner style and defeature tolerance,
+    and the extent of a net set is the union of the cached footprints. Adding a net to a cutout only reads and
+    buffers that net.
+
+    Parameters
+    ----------
+    pedb : :class:`pyedb.dotnet.edb.Edb`
+        EDB object.
+    tolerance : float, optional
+        Maximum distance between the arcs of the primitives and their discretization.
+        The default is :data:`pyedb.dotnet.edb_core.shapely_cutout.ARC_TOLERANCE`, ``1e-7`` meters.
+
+    Examples
+    --------
+    >>> from pyedb import Edb
+    >>> edbapp = Edb("myaedbfolder")
+    >>> extent = edbapp.extent_builder.conformal(["DDR4_DQ0", "DDR4_DQ1"], 0.001)
+    >>> extent = edbapp.extent_builder.conformal(["DDR4_DQ0", "DDR4_DQ1", "DDR4_DQ2"], 0.001)
+    >>> edbapp.cutout(["DDR4_DQ0"], ["GND"], cutout_backend="shapely")
+    """
+
+    def __init__(self, pedb, tolerance=ARC_TOLERANCE):
+        self._pedb = pedb
+        self.tolerance = tolerance
+        self._geometries = {}
+        self._footprints = {}
+        self._stamps = {}
+        self._stamps_version = None
+
+    def clear(self):
+        """Remove all the net geometries and footprints from the cache."""
+        self._geometries = {}
+        self._footprints = {}
+        self._stamps = {}
+        self._stamps_version = None
+
+    def _net_stamp(self, net_name):
+        layout = self._pedb.layout
+        if self._stamps_version != layout.version:
+            self._stamps = {}
+            self._stamps_version = layout.version
+        if net_name not in self._stamps:
+            snapshot = layout.snapshot
+            mask = snapshot.mask(nets=[net_name], is_void=False)
+            digest = hashlib.sha1()
+            for array in (snapshot.ids, snapshot.type_index, snapshot.layer_index, snapshot.bbox):
+                digest.update(np.ascontiguousarray(array[mask]).tobytes())
+            self._stamps[net_name] = digest.hexdigest()
+        return self._stamps[net_name]
+
+    def _read_net_geometry(self, net_name):
+        snapshot = self._pedb.layout.snapshot
+        mask = snapshot.mask(nets=[net_name], is_void=False)
+        edb_objects = snapshot.edb_objects
+        geometries = [
+            polygon_data_to_shapely(edb_objects[row].GetPolygonData(), self.tolerance)
+            for row in np.flatnonzero(mask & snapshot.is_primitive)
+        ]
+        rows = np.flatnonzero(mask & snapshot.is_padstack_instance)
+        if len(rows):
+            pad_bboxes = snapshot.pad_bbox[rows]
+            has_box = ~np.isnan(pad_bboxes).any(axis=1)
+            geometries.extend(shapely.box(*pad_bboxes[has_box].T))
+            positions = snapshot.position[rows[~has_box]]
+            geometries.extend(shapely.points(positions))
+        return shapely.union_all(geometries)
+
+    def net_geometry(self, net_name):
+        """Get the geometry of a net, its primitives and pad bounding boxes, without expansion.
+
+        Parameters
+        ----------
+        net_name : str
+            Net name.
+
+        Returns
+        -------
+        :class:`shapely.Geometry`
+            Geometry of the net, empty if the net has no objects.
+        """
+        stamp = self._net_stamp(net_name)
+        cached = self._geometries.get(net_name)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, self._read_net_geometry(net_name))
+            self._geometries[net_name] = cached
+            self._footprints = {key: value for key, value in self._footprints.items() if key[0] != net_name}
+        return cached[1]
+
+    @staticmethod
+    def _buffer(geometry, expansion_size, use_round_corner):
+        if use_round_corner:
+            return shapely.buffer(geometry, expansion_size, join_style="round")
+        return shapely.buffer(geometry, expansion_size, cap_style="square", join_style="mitre", mitre_limit=2.0)
+
+    def net_footprint(self, net_name, expansion_size, use_round_corner=False, extent_defeature=0.0):
+        """Get the footprint of a net, its geometry expanded by a distance.
+
+        Parameters
+        ----------
+        net_name : str
+            Net name.
+        expansion_size : float
+            Expansion size in meters.
+        use_round_corner : bool, optional
+            Whether to round the corners. The default is ``False``, in which case they are mitered.
+        extent_defeature : float, optional
+            Defeature tolerance of the footprint. The default is ``0.0``.
+
+        Returns
+        -------
+        :class:`shapely.Geometry`
+        """
+        geometry = self.net_geometry(net_name)
+        key = (net_name, float(expansion_size), bool(use_round_corner), float(extent_defeature))
+        if key not in self._footprints:
+            footprint = self._buffer(geometry, expansion_size, use_round_corner)
+            if extent_defeature > 0:
+                footprint = shapely.simplify(footprint, extent_defeature)
+            self._footprints[key] = footprint
+        return self._footprints[key]
+
+    def _net_names(self, nets):
+        if isinstance(nets, str):
+            nets = [nets]
+        return sorted({net if isinstance(net, str) else net.name for net in nets})
+
+    def conformal(
+        self,
+        nets,
+        expansion_size,
+        use_round_corner=False,
+        extent_defeature=0.0,
+        geometries=None,
+        iterations=10,
+    ):
+        """Compute a conforming extent.
+
+        When the footprints do not form a single polygon, the expansion size is increased by a fifth, up to
+        ``iterations`` times, and the largest polygon is returned if they are still disjoint.
+
+        Parameters
+        ----------
+        nets : list
+            Net names or net objects.
+        expansion_size : float
+            Expansion size in meters.
+        use_round_corner : bool, optional
+            Whether to round the corners. The default is ``False``.
+        extent_defeature : float, optional
+            Defeature tolerance of the net footprints. The default is ``0.0``.
+        geometries : list, optional
+            Other shapely geometries to expand and include in the extent, like pins to preserve.
+            The default is ``None``.
+        iterations : int, optional
+            Maximum number of expansion increases. The default is ``10``.
+
+        Returns
+        -------
+        :class:`shapely.Polygon`
+        """
+        names = self._net_names(nets)
+        delta = expansion_size / 5
+        for k in range(iterations + 1):
+            footprints = [
+                self.net_footprint(name, expansion_size, use_round_corner, extent_defeature) for name in names
+            ]
+            if geometries:
+                footprints.append(self._buffer(shapely.union_all(geometries), expansion_size, use_round_corner))
+            parts = shapely.get_parts(shapely.union_all(footprints))
+            if len(parts) == 1:
+                if k:
+                    self._pedb.logger.info("Correctly computed Extension in {} iterations.".format(k))
+                else:
+                    self._pedb.logger.info("Correctly computed Extension at first iteration.")
+                return parts[0]
+            if not len(parts) or not delta:
+                break
+            expansion_size += delta
+        if not len(parts):
+            self._pedb.logger.error("Nets {} have no geometry.".format(names))
+            return shapely.Polygon()
+        self._pedb.logger.info("Failed to Correctly computed Extension.")
+        return parts[np.argmax(shapely.area(parts))]
+
+    def convex_hull(self, nets, expansion_size, use_round_corner=False, geometries=None):
+        """Compute a convex hull extent.
+
+        Parameters
+        ----------
+        nets : list
+            Net names or net objects.
+        expansion_size : float
+            Expansion size in meters.
+        use_round_corner : bool, optional
+            Whether to round the corners. The default is ``False``.
+        geometries : list, optional
+            Other shapely geometries to include in the extent. The default is ``None``.
+
+        Returns
+        -------
+        :class:`shapely.Polygon`
+        """
+        hulls = [shapely.convex_hull(self.net_geometry(name)) for name in self._net_names(nets)]
+        hulls.extend(geometries or [])
+        hull = shapely.convex_hull(shapely.union_all(hulls))
+        return self._buffer(hull, expansion_size, use_round_corner)
+
+    def bounding_box(self, nets, expansion_size, geometries=None):
+        """Compute a bounding box extent.
+
+        Parameters
+        ----------
+        nets : list
+            Net names or net objects.
+        expansion_size : float
+            Expansion size in meters.
+        geometries : list, optional
+            Other shapely geometries to include in the extent. The default is ``None``.
+
+        Returns
+        -------
+        :class:`shapely.Polygon`
+        """
+        bounds = [self.net_geometry(name) for name in self._net_names(nets)]
+        bounds.extend(geometries or [])
+        x_min, y_min, x_max, y_max = shapely.total_bounds(bounds)
+        return shapely.box(
+            x_min - expansion_size, y_min - expansion_size, x_max + expansion_size, y_max + expansion_size
+        )
+
+    def extent(
+        self,
+        nets,
+        extent_type="Conforming",
+        expansion_size=0.0,
+        use_round_corner=False,
+        extent_defeature=0.0,
+        geometries=None,
+    ):
+        """Compute an extent.
+
+        Parameters
+        ----------
+        nets : list
+            Net names or net objects.
+        extent_type : str, optional
+            Extent type, ``"Conforming"``, ``"ConvexHull"`` or ``"Bounding"``. The default is ``"Conforming"``.
+        expansion_size : float, optional
+            Expansion size in meters. The default is ``0.0``.
+        use_round_corner : bool, optional
+            Whether to round the corners. The default is ``False``.
+        extent_defeature : float, optional
+            Defeature tolerance of the conforming extent. The default is ``0.0``.
+        geometries : list, optional
+            Other shapely geometries to include in the extent. The default is ``None``.
+
+        Returns
+        -------
+        :class:`shapely.Polygon`
+        """
+        if str(extent_type) in ["Conforming", "1"]:
+            return self.conformal(nets, expansion_size, use_round_corner, extent_defeature, geometries)
+        if str(extent_type) in ["Bounding", "BoundingBox", "0"]:
+            return self.bounding_box(nets, expansion_size, geometries)
+        return self.convex_hull(nets, expansion_size, use_round_corner, geometries)
+
+    def to_polygon_data(self, geometry, include_holes=False):
+        """Convert a shapely polygon to an EDB polygon.
+
+        Parameters
+        ----------
+        geometry : :class:`shapely.Geometry`
+            Polygon. Only the largest polygon of a multipart geometry is converted.
+        include_holes : bool, optional
+            Whether to keep the holes of the polygon. The default is ``False``, in which case the regions enclosed
+            by the nets are kept in the extent, as with the EDB extent without voids.
+
+        Returns
+        -------
+        Ansys.Ansoft.Edb.Geometry.PolygonData
+            EDB polygon, ``None`` if the geometry is empty.
+        """
+        polygons = shapely_to_point_lists(geometry)
+        if not polygons:
+            return None
+        outline, holes = max(polygons, key=lambda polygon: shapely.Polygon(polygon[0]).area)
+        polygon_data = PolygonData(self._pedb, create_from_points=True, points=outline)._edb_object
+        for hole in holes if include_holes else []:
+            polygon_data.AddHole(PolygonData(self._pedb, create_from_points=True, points=hole)._edb_object)
+        return polygon_data
@@ -0,0 +1,237 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains the ``ExtentCache`` class, a persistent cache of the cutout extents.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+
+
+class ExtentCache(object):
+    """Cache of the cutout extents of a layout.
+
+    Extents are stored with a stamp of the layout objects, their nets, layers and bounding boxes, and are only
+    returned while the layout matches the stamp. The cache can be saved next to the ``.aedb`` folder and is
+    loaded from there the first time an extent is missing.
+
+    Parameters
+    ----------
+    pedb : :class:`pyedb.dotnet.edb.Edb`
+        EDB object.
+    file_path : str, optional
+        Cache file. The default is ``None``, in which case the ``<design>_extents.json`` file next to the
+        ``.aedb`` folder is used.
+
+    Examples
+    --------
+    >>> from pyedb import Edb
+    >>> edbapp = Edb("myaedbfolder")
+    >>> edbapp.cutout(["DDR4_DQ0"], ["GND"], use_extent_cache=True)
+    >>> edbapp.extent_cache.save()
+    """
+
+    def __init__(self, pedb, file_path=None):
+        self._pedb = pedb
+        if file_path is None and pedb.edbpath:
+            file_path = os.path.splitext(os.path.normpath(pedb.edbpath))[0] + "_extents.json"
+        self.file_path = file_path
+        self._entries = {}
+        self._polygons = {}
+        self._loaded = False
+        self._stamp = None
+        self._stamp_version = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        entry = self._entries.get(key)
+        return entry is not None and entry["stamp"] == self.layout_stamp
+
+    @staticmethod
+    def extent_key(signal_nets, extent_type, expansion_size, use_round_corner, extent_defeature=0.0, **options):
+        """Key of an extent.
+
+        Parameters
+        ----------
+        signal_nets : list[str]
+            Names of the signal nets.
+        extent_type : str
+            Extent type.
+        expansion_size : float
+            Expansion size in meters.
+        use_round_corner : bool
+            Whether the extent corners are rounded.
+        extent_defeature : float, optional
+            Defeature tolerance of the extent. The default is ``0.0``.
+        **options
+            Other JSON serializable options of the extent computation.
+
+        Returns
+        -------
+        str
+        """
+        key = {
+            "signal_nets": sorted(signal_nets),
+            "extent_type": str(extent_type),
+            "expansion_size": float(expansion_size),
+            "use_round_corner": bool(use_round_corner),
+            "extent_defeature": float(extent_defeature),
+        }
+        key.update(options)
+        return json.dumps(key, sort_keys=True)
+
+    @property
+    def layout_stamp(self):
+        """Stamp of the layout objects, nets, layers and bounding boxes.
+
+        Returns
+        -------
+        str
+        """
+        layout = self._pedb.layout
+        if self._stamp_version != layout.version:
+            snapshot = layout.snapshot
+            digest = hashlib.sha1()
+            for array in (
+                snapshot.ids,
+                snapshot.type_index,
+                snapshot.net_index,
+                snapshot.layer_index,
+                snapshot.is_void,
+                snapshot.bbox,
+            ):
+                digest.update(np.ascontiguousarray(array).tobytes())
+            digest.update(json.dumps([snapshot.net_names, snapshot.layer_names]).encode())
+            self._stamp = digest.hexdigest()
+            self._stamp_version = layout.version
+        return self._stamp
+
+    @staticmethod
+    def _arcs_to_list(polygon_data):
+        return [
+            [arc.Start.X.ToDouble(), arc.Start.Y.ToDouble(), arc.End.X.ToDouble(), arc.End.Y.ToDouble(), arc.Height]
+            for arc in list(polygon_data.GetArcData())
+        ]
+
+    def _polygon_from_arcs(self, arcs):
+        geometry = self._pedb.edb_api.geometry
+        arc_data = [geometry.arc_data([x0, y0], [x1, y1], height=height) for x0, y0, x1, y1, height in arcs]
+        return geometry.polygon_data.create_from_arcs(arc_data, True)
+
+    def get(self, key):
+        """Get an extent.
+
+        Parameters
+        ----------
+        key : str
+            Extent key from :func:`extent_key`.
+
+        Returns
+        -------
+        Ansys.Ansoft.Edb.Geometry.PolygonData
+            Extent, ``None`` if it is missing or was computed on a different layout.
+        """
+        if key not in self._entries and not self._loaded:
+            self.load()
+        if key not in self:
+            return None
+        if key not in self._polygons:
+            entry = self._entries[key]
+            polygon = self._polygon_from_arcs(entry["arcs"])
+            for hole in entry["holes"]:
+                polygon.AddHole(self._polygon_from_arcs(hole))
+            self._polygons[key] = polygon
+        return self._polygons[key]
+
+    def set(self, key, extent):
+        """Store an extent computed on the current layout.
+
+        Parameters
+        ----------
+        key : str
+            Extent key from :func:`extent_key`.
+        extent : Ansys.Ansoft.Edb.Geometry.PolygonData
+            Extent.
+        """
+        self._entries[key] = {
+            "stamp": self.layout_stamp,
+            "arcs": self._arcs_to_list(extent),
+            "holes": [self._arcs_to_list(hole) for hole in list(extent.Holes)],
+        }
+        self._polygons[key] = extent
+
+    def clear(self):
+        """Remove all the extents from the cache."""
+        self._entries = {}
+        self._polygons = {}
+
+    def load(self, file_path=None):
+        """Load the extents of a cache file, in addition to the cached ones.
+
+        Parameters
+        ----------
+        file_path : str, optional
+            Cache file. The default is ``None``, in which case :attr:`file_path` is used.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when the file does not exist or cannot be read.
+        """
+        file_path = file_path or self.file_path
+        self._loaded = True
+        if not file_path or not os.path.isfile(file_path):
+            return False
+        try:
+            with open(file_path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            self._pedb.logger.warning("Failed to read extent cache {}.".format(file_path))
+            return False
+        for key, entry in entries.items():
+            self._entries.setdefault(key, entry)
+        return True
+
+    def save(self, file_path=None):
+        """Save the cached extents, merged with the ones already in the cache file.
+
+        Parameters
+        ----------
+        file_path : str, optional
+            Cache file. The default is ``None``, in which case :attr:`file_path` is used.
+
+        Returns
+        -------
+        str
+            Path of the cache file.
+        """
+        file_path = file_path or self.file_path
+        if not self._loaded and file_path == self.file_path:
+            self.load()
+        with open(file_path, "w") as f:
+            json.dump(self._entries, f)
+        return file_path
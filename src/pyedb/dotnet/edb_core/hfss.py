@@ -136,7 +136,7 @@ class EdbHfss(object):
         if hasattr(prim_id, "GetId"):
             prim = prim_id
         else:
-            prim = [i for i in self._pedb.modeler.primitives if i.id == prim_id][0].primitive_object
+            prim = self._pedb.layout.id_index[prim_id]
         pos_edge = self._edb.cell.terminal.PrimitiveEdge.Create(prim, point_on_edge)
         pos_edge = convert_py_list_to_net_list(pos_edge, self._edb.cell.terminal.Edge)
         return self._edb.cell.terminal.EdgeTerminal.Create(
@@ -1581,14 +1581,18 @@ class EdbHfss(object):
         polygon_list = self._pedb.modeler.polygons
         polygon_with_voids = self._pedb.core_layout.get_poly_with_voids(polygon_list)
         self._logger.info("Number of polygons with voids found: {0}".format(str(polygon_with_voids.Count)))
+        edited = []
+        deleted = []
         for _poly in polygon_list:
             voids_from_current_poly = _poly.Voids
             new_poly_data = self._pedb.core_layout.defeature_polygon(setup_info=simulation_setup, poly=_poly)
             _poly.SetPolygonData(new_poly_data)
+            edited.append(_poly)
             if len(voids_from_current_poly) > 0:
                 for void in voids_from_current_poly:
                     void_data = void.GetPolygonData()
                     if void_data.Area() < float(simulation_setup.minimum_void_surface):
+                        deleted.append(void.GetId())
                         void.Delete()
                         self._logger.warning(
                             "Defeaturing Polygon {0}: Deleting Void {1} area is lower than the minimum criteria".format(
@@ -1603,7 +1607,10 @@ class EdbHfss(object):
                             setup_info=simulation_setup, poly=void_data
                         )
                         void.SetPolygonData(new_void_data)
-
+                        edited.append(void)
+        self._pedb.layout._notify_change(
+            created=edited, deleted=deleted + [getattr(i, "_edb_object", i).GetId() for i in edited]
+        )
         return True
 
     def create_rlc_boundary_on_pins(self, positive_pin=None, negative_pin=None, rvalue=0.0, lvalue=0.0, cvalue=0.0):
@@ -21,10 +21,11 @@
 # SOFTWARE.
 
 import re
+import time
+
+import numpy as np
 
 from pyedb.dotnet.clr_module import String
-from pyedb.dotnet.edb_core.edb_data.padstacks_data import EDBPadstackInstance
-from pyedb.dotnet.edb_core.edb_data.primitives_data import Primitive
 from pyedb.generic.general_methods import generate_unique_name
 
 
@@ -33,6 +34,7 @@ class LayoutValidation:
 
     def __init__(self, pedb):
         self._pedb = pedb
+        self.timing_report = {}
 
     def dc_shorts(self, net_list=None, fix=False):
         """Find DC shorts on layout.
@@ -61,64 +63,34 @@ class LayoutValidation:
             net_list = list(self._pedb.nets.nets.keys())
         elif isinstance(net_list, str):
             net_list = [net_list]
-        _objects_list = {}
-        _padstacks_list = {}
-        for prim in self._pedb.modeler.primitives:
-            n_name = prim.net_name
-            if n_name in _objects_list:
-                _objects_list[n_name].append(prim)
-            else:
-                _objects_list[n_name] = [prim]
-        for pad in list(self._pedb.padstacks.instances.values()):
-            n_name = pad.net_name
-            if n_name in _padstacks_list:
-                _padstacks_list[n_name].append(pad)
-            else:
-                _padstacks_list[n_name] = [pad]
+        connectivity = self._pedb.layout.connectivity
+        snapshot = connectivity.snapshot
         dc_shorts = []
         all_shorted_nets = []
         for net in net_list:
             if net in all_shorted_nets:
                 continue
-            objs = []
-            for i in _objects_list.get(net, []):
-                objs.append(i)
-            for i in _padstacks_list.get(net, []):
-                objs.append(i)
-            if not len(objs):
+            if not snapshot.mask(nets=net).any():
                 self._pedb.nets[net].delete()
                 continue
-
-            connected_objs = objs[0].get_connected_objects()
-            connected_objs.append(objs[0])
-            net_dc_shorts = [obj for obj in connected_objs]
             all_shorted_nets.append(net)
-            if net_dc_shorts:
-                dc_nets = list(set([obj.net.name for obj in net_dc_shorts]))
-                dc_nets = [i for i in dc_nets if i != net]
-                for dc in dc_nets:
-                    if dc:
-                        dc_shorts.append([net, dc])
-                        all_shorted_nets.append(dc)
-                if fix:
-                    temp = []
-                    for i in net_dc_shorts:
-                        temp.append(i.net.name)
-                    temp_key = set(temp)
-                    temp_count = {temp.count(i): i for i in temp_key}
-                    temp_count = dict(sorted(temp_count.items()))
-                    while True:
-                        temp_name = list(temp_count.values()).pop()
-                        if not temp_name.lower().startswith("unnamed"):
-                            break
-                        elif temp_name.lower():
-                            break
-                        elif len(temp) == 0:
-                            break
-                    rename_shorts = [i for i in net_dc_shorts if i._edb_object.GetNet().GetName() != temp_name]
-                    for i in rename_shorts:
-                        i._edb_object.SetNet(self._pedb.nets.nets[temp_name].net_obj)
-                        # i.net = temp_name
+            dc_nets = [i for i in connectivity.shorted_nets(net) if i]
+            for dc in dc_nets:
+                dc_shorts.append([net, dc])
+                all_shorted_nets.append(dc)
+            if fix and dc_nets:
+                rows = [snapshot.row(i) for group in connectivity.components_of_net(net) for i in group]
+                rows = np.flatnonzero(np.isin(connectivity.labels, connectivity.labels[rows]))
+                net_index = snapshot.net_index[rows]
+                # The nets are merged in the named one holding the most objects.
+                counts = np.bincount(net_index, minlength=len(snapshot.net_names))
+                counts[[i for i, name in enumerate(snapshot.net_names) if not name]] = -1
+                main_net = int(np.argmax(counts))
+                net_obj = self._pedb.nets.nets[snapshot.net_names[main_net]].net_obj
+                renamed = [snapshot.edb_objects[row] for row in rows[net_index != main_net]]
+                for obj in renamed:
+                    obj.SetNet(net_obj)
+                self._pedb.layout._notify_change(created=renamed, deleted=[obj.GetId() for obj in renamed])
         return dc_shorts
 
     def disjoint_nets(
@@ -128,6 +100,7 @@ class LayoutValidation:
         clean_disjoints_less_than=0.0,
         order_by_area=False,
         keep_disjoint_pins=False,
+        report_timing=False,
     ):
         """Find and fix disjoint nets from a given netlist.
 
@@ -144,6 +117,9 @@ class LayoutValidation:
             Default is ``False``.
         keep_disjoint_pins : bool, optional
             Whether if delete disjoints pins not connected to any other primitive or not. Default is ``False``.
+        report_timing : bool, optional
+            Whether to log the time spent on each net. The timings are always available in
+            :attr:`timing_report`. Default is ``False``.
 
         Returns
         -------
@@ -154,6 +130,7 @@ class LayoutValidation:
         --------
 
         >>> renamed_nets = edb.layout_validation.disjoint_nets(["GND","Net2"])
+        >>> slowest = max(edb.layout_validation.timing_report.items(), key=lambda i: i[1]["total"])
         """
         timer_start = self._pedb._logger.reset_timer()
 
@@ -161,104 +138,102 @@ class LayoutValidation:
             net_list = list(self._pedb.nets.keys())
         elif isinstance(net_list, str):
             net_list = [net_list]
-        _objects_list = {}
-        _padstacks_list = {}
-        for prim in self._pedb.modeler.primitives:
-            n_name = prim.net_name
-            if n_name in _objects_list:
-                _objects_list[n_name].append(prim)
-            else:
-                _objects_list[n_name] = [prim]
-        for pad in list(self._pedb.layout.padstack_instances):
-            n_name = pad.net_name
-            if n_name in _padstacks_list:
-                _padstacks_list[n_name].append(pad)
-            else:
-                _padstacks_list[n_name] = [pad]
+        connectivity = self._pedb.layout.connectivity
+        snapshot = connectivity.snapshot
+
+        def plan(net):
+            start = time.time()
+            actions = self._plan_disjoint_net(
+                connectivity, net, keep_only_main_net, clean_disjoints_less_than, order_by_area, keep_disjoint_pins
+            )
+            return actions, time.time() - start
+
+        plans = [plan(net) for net in net_list]
+
         new_nets = []
         disjoints_objects = []
-        self._pedb._logger.reset_timer()
-        for net in net_list:
-            net_groups = []
-            obj_dict = {}
-            for i in _objects_list.get(net, []):
-                obj_dict[i.id] = i
-            for i in _padstacks_list.get(net, []):
-                obj_dict[i.id] = i
-            objs = list(obj_dict.values())
-            l = len(objs)
-            while l > 0:
-                l1 = objs[0].get_connected_object_id_set()
-                l1.append(objs[0].id)
-                repetition = False
-                for id_by_net in net_groups:
-                    if set(l1).intersection(id_by_net):
-                        net_groups.append([i for i in l1 if i not in id_by_net])
-                        repetition = True
-                if not repetition:
-                    net_groups.append(l1)
-                objs = [i for i in objs if i.id not in l1]
-                l = len(objs)
-            if len(net_groups) > 1:
-
-                def area_calc(elem):
-                    sum = 0
-                    for el in elem:
-                        try:
-                            if isinstance(obj_dict[el], Primitive):
-                                if not obj_dict[el].is_void:
-                                    sum += obj_dict[el].area()
-                        except:
-                            pass
-                    return sum
-
-                if order_by_area:
-                    areas = [area_calc(i) for i in net_groups]
-                    sorted_list = [x for _, x in sorted(zip(areas, net_groups), reverse=True)]
-                else:
-                    sorted_list = sorted(net_groups, key=len, reverse=True)
-                for disjoints in sorted_list[1:]:
-                    if keep_only_main_net:
-                        for geo in disjoints:
-                            try:
-                                obj_dict[geo].delete()
-                            except KeyError:
-                                pass
-                    elif len(disjoints) == 1 and (
-                        clean_disjoints_less_than
-                        and "area" in dir(obj_dict[disjoints[0]])
-                        and obj_dict[disjoints[0]].area() < clean_disjoints_less_than
-                    ):
-                        try:
-                            obj_dict[disjoints[0]].delete()
-                        except KeyError:
-                            pass
-                    elif (
-                        len(disjoints) == 1
-                        and not keep_disjoint_pins
-                        and isinstance(obj_dict[disjoints[0]], EDBPadstackInstance)
-                    ):
-                        try:
-                            obj_dict[disjoints[0]].delete()
-                        except KeyError:
-                            pass
-
-                    else:
-                        new_net_name = generate_unique_name(net, n=6)
-                        net_obj = self._pedb.nets.find_or_create_net(new_net_name)
-                        if net_obj:
-                            new_nets.append(net_obj.name)
-                            for geo in disjoints:
-                                try:
-                                    obj_dict[geo].net_name = net_obj.name
-                                except KeyError:
-                                    pass
-                            disjoints_objects.extend(disjoints)
+        deleted = []
+        renamed = []
+        self.timing_report = {}
+        for net, (actions, read_time) in zip(net_list, plans):
+            start = time.time()
+            for action, disjoints in actions:
+                edb_objects = [snapshot.edb_objects[snapshot.row(i)] for i in disjoints]
+                if action == "delete":
+                    for obj, obj_id in zip(edb_objects, disjoints):
+                        if snapshot.is_primitive[snapshot.row(obj_id)]:
+                            deleted.extend(i.GetId() for i in obj.Voids)
+                        obj.Delete()
+                    deleted.extend(disjoints)
+                    continue
+                new_net_name = generate_unique_name(net, n=6)
+                net_obj = self._pedb.nets.find_or_create_net(new_net_name)
+                if net_obj:
+                    new_nets.append(net_obj.name)
+                    for obj in edb_objects:
+                        obj.SetNet(net_obj.api_object)
+                    renamed.extend(edb_objects)
+                    disjoints_objects.extend(disjoints)
+            write_time = time.time() - start
+            self.timing_report[net] = {
+                "disjoint_groups": len(actions),
+                "read": read_time,
+                "write": write_time,
+                "total": read_time + write_time,
+            }
+            if report_timing:
+                self._pedb._logger.info(
+                    "Net {}: {} disjoint groups evaluated in {:.3f}s and fixed in {:.3f}s.".format(
+                        net, len(actions), read_time, write_time
+                    )
+                )
+        if deleted or renamed:
+            self._pedb.layout._notify_change(created=renamed, deleted=deleted + disjoints_objects)
         self._pedb._logger.info("Found {} objects in {} new nets.".format(len(disjoints_objects), len(new_nets)))
         self._pedb._logger.info_timer("Disjoint Cleanup Completed.", timer_start)
 
         return new_nets
 
+    @staticmethod
+    def _plan_disjoint_net(
+        connectivity, net, keep_only_main_net, clean_disjoints_less_than, order_by_area, keep_disjoint_pins
+    ):
+        """Evaluate the disjoint groups of a net without editing the layout.
+
+        Returns
+        -------
+        list[tuple[str, list[int]]]
+            ``("delete", ids)`` or ``("rename", ids)`` actions, main group excluded.
+        """
+        snapshot = connectivity.snapshot
+        net_groups = connectivity.components_of_net(net)
+        if len(net_groups) < 2:
+            return []
+        if order_by_area:
+            areas = [connectivity.area(i) for i in net_groups]
+            sorted_list = [x for _, x in sorted(zip(areas, net_groups), reverse=True)]
+        else:
+            sorted_list = sorted(net_groups, key=len, reverse=True)
+        actions = []
+        for disjoints in sorted_list[1:]:
+            if keep_only_main_net:
+                actions.append(("delete", disjoints))
+            elif len(disjoints) == 1 and (
+                clean_disjoints_less_than
+                and snapshot.is_primitive[snapshot.row(disjoints[0])]
+                and connectivity.area(disjoints) < clean_disjoints_less_than
+            ):
+                actions.append(("delete", disjoints))
+            elif (
+                len(disjoints) == 1
+                and not keep_disjoint_pins
+                and snapshot.is_padstack_instance[snapshot.row(disjoints[0])]
+            ):
+                actions.append(("delete", disjoints))
+            else:
+                actions.append(("rename", disjoints))
+        return actions
+
     def fix_self_intersections(self, net_list=None):
         """Find and fix self intersections from a given netlist.
 
@@ -70,6 +70,26 @@ DC_ATTRIBUTES = [
     "dc_permittivity",
 ]
 PERMEABILITY_DEFAULT_VALUE = 1
+PROPERTY_IDS = {
+    "conductivity": "Conductivity",
+    "dielectric_loss_tangent": "DielectricLossTangent",
+    "magnetic_loss_tangent": "MagneticLossTangent",
+    "mass_density": "MassDensity",
+    "permittivity": "Permittivity",
+    "permeability": "Permeability",
+    "poisson_ratio": "PoissonsRatio",
+    "specific_heat": "SpecificHeat",
+    "thermal_conductivity": "ThermalConductivity",
+    "youngs_modulus": "YoungsModulus",
+    "thermal_expansion_coefficient": "ThermalExpansionCoefficient",
+}
+DC_MODEL_GETTERS = {
+    "dc_conductivity": "GetDCConductivity",
+    "dc_permittivity": "GetDCRelativePermitivity",
+    "dielectric_model_frequency": "GetFrequency",
+    "loss_tangent_at_frequency": "GetLossTangentAtFrequency",
+    "permittivity_at_frequency": "GetRelativePermitivityAtFrequency",
+}
 
 
 def get_line_float_value(line):
@@ -85,6 +105,22 @@ def get_line_float_value(line):
         return None
 
 
+def get_material_property_ids(edb_definition):
+    """Resolve the EDB material property IDs of the material properties.
+
+    Parameters
+    ----------
+    edb_definition : Any
+        EDB definition namespace.
+
+    Returns
+    -------
+    dict
+        Dictionary of property names with their material property IDs.
+    """
+    return {name: getattr(edb_definition.MaterialPropertyId, id_name) for name, id_name in PROPERTY_IDS.items()}
+
+
 class MaterialProperties(BaseModel):
     """Store material properties."""
 
@@ -416,11 +452,31 @@ class Material(object):
     def __load_all_properties(self) -> MaterialProperties:
         """Load all properties of the material."""
         res = MaterialProperties()
-        for property in res.model_dump().keys():
-            value = getattr(self, property)
+        for property, value in self._read_properties().items():
             setattr(res, property, value)
         return res
 
+    def _read_properties(self, property_ids=None):
+        """Read all properties of the material in one pass.
+
+        Parameters
+        ----------
+        property_ids : dict, optional
+            Dictionary of property names with their material property IDs. It can be shared
+            between materials to avoid resolving the IDs for each material.
+
+        Returns
+        -------
+        dict
+            Dictionary of property names with their values.
+        """
+        if property_ids is None:
+            property_ids = get_material_property_ids(self.__edb_definition)
+        values = {name: self.__property_value(property_id) for name, property_id in property_ids.items()}
+        for name, getter in DC_MODEL_GETTERS.items():
+            values[name] = getattr(self.__dc_model, getter)() if self.__dc_model else None
+        return {name: values[name] for name in MaterialProperties.model_fields}
+
     def __property_value(self, material_property_id):
         """Get property value from a material property id."""
         _, property_box = self.__material_def.GetProperty(material_property_id)
@@ -450,15 +506,16 @@ class Materials(object):
         self.__edb = edb
         self.__edb_definition = edb.edb_api.definition
         self.__syslib = os.path.join(self.__edb.base_path, "syslib")
+        self.__materials = None
 
     def __contains__(self, item):
         if isinstance(item, Material):
-            return item.name in self.materials
+            return item.name in self.__get_materials()
         else:
-            return item in self.materials
+            return item in self.__get_materials()
 
     def __getitem__(self, item):
-        return self.materials[item]
+        return self.__get_materials()[item]
 
     @property
     def syslib(self):
@@ -468,11 +525,65 @@ class Materials(object):
     @property
     def materials(self):
         """Get materials."""
-        materials = {
-            material_def.GetName(): Material(self.__edb, material_def)
-            for material_def in list(self.__edb.active_db.MaterialDefs)
-        }
-        return materials
+        return dict(self.__get_materials())
+
+    def __get_materials(self):
+        """Get the cached materials registry, building it from the database if needed.
+
+        The registry is reset by ``add_material``, ``duplicate``, ``delete_material`` and the dielectric model
+        methods, which are the only ones adding or removing material definitions.
+        """
+        if self.__materials is None:
+            materials = [Material(self.__edb, material_def) for material_def in list(self.__edb.active_db.MaterialDefs)]
+            self.__materials = {material.name: material for material in materials}
+        return self.__materials
+
+    def refresh(self):
+        """Reset the materials registry.
+
+        Use this method after material definitions are added or removed directly through the EDB API.
+        """
+        self.__materials = None
+
+    def to_dict(self):
+        """Get the properties of all materials.
+
+        The material property IDs are resolved once for all materials.
+
+        Returns
+        -------
+        dict
+            Dictionary of material names with their properties dictionaries.
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> edbapp.materials.to_dict()["copper"]["conductivity"]
+        """
+        property_ids = get_material_property_ids(self.__edb_definition)
+        res = {}
+        for name, material in self.__get_materials().items():
+            res[name] = {"name": name}
+            res[name].update(material._read_properties(property_ids))
+        return res
+
+    def to_dataframe(self):
+        """Get the properties of all materials as a dataframe.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            Dataframe indexed by material name with one column per material property.
+        """
+        import pandas as pd
+
+        materials = self.to_dict()
+        return pd.DataFrame(
+            [[properties[column] for column in MaterialProperties.model_fields] for properties in materials.values()],
+            index=pd.Index(list(materials), name="name"),
+            columns=list(MaterialProperties.model_fields),
+        )
 
     def __edb_value(self, value):
         """Convert a value to an EDB value.
@@ -495,7 +606,7 @@ class Materials(object):
         -------
         :class:`pyedb.dotnet.edb_core.materials.Material`
         """
-        curr_materials = self.materials
+        curr_materials = self.__get_materials()
         if name in curr_materials:
             raise ValueError(f"Material {name} already exists in material library.")
         elif name.lower() in (material.lower() for material in curr_materials):
@@ -504,6 +615,7 @@ class Materials(object):
 
         material_def = self.__edb_definition.MaterialDef.Create(self.__edb.active_db, name)
         material = Material(self.__edb, material_def)
+        self.__materials = None
         # Apply default values to the material
         if "permeability" not in kwargs:
             kwargs["permeability"] = PERMEABILITY_DEFAULT_VALUE
@@ -591,7 +703,7 @@ class Materials(object):
         -------
         :class:`pyedb.dotnet.edb_core.materials.Material`
         """
-        curr_materials = self.materials
+        curr_materials = self.__get_materials()
         if name in curr_materials:
             raise ValueError(f"Material {name} already exists in material library.")
         elif name.lower() in (material.lower() for material in curr_materials):
@@ -659,7 +771,7 @@ class Materials(object):
         -------
         :class:`pyedb.dotnet.edb_core.materials.Material`
         """
-        curr_materials = self.materials
+        curr_materials = self.__get_materials()
         if name in curr_materials:
             raise ValueError(f"Material {name} already exists in material library.")
         elif name.lower() in (material.lower() for material in curr_materials):
@@ -722,7 +834,7 @@ class Materials(object):
         >>> loss_tan = [0.025, 0.026, 0.027, 0.028, 0.029, 0.030]
         >>> diel = edb.materials.add_multipole_debye_material("My_MP_Debye", freq, rel_perm, loss_tan)
         """
-        curr_materials = self.materials
+        curr_materials = self.__get_materials()
         if name in curr_materials:
             raise ValueError(f"Material {name} already exists in material library.")
         elif name.lower() in (material.lower() for material in curr_materials):
@@ -763,12 +875,13 @@ class Materials(object):
             Dielectric material model.
         """
         if self.__edb_definition.MaterialDef.FindByName(self.__edb.active_db, name).IsNull():
-            if name.lower() in (material.lower() for material in self.materials):
+            if name.lower() in (material.lower() for material in self.__get_materials()):
                 raise ValueError(f"Material names are case-insensitive and {name.lower()} already exists.")
             self.__edb_definition.MaterialDef.Create(self.__edb.active_db, name)
 
         material_def = self.__edb_definition.MaterialDef.FindByName(self.__edb.active_db, name)
         succeeded = material_def.SetDielectricMaterialModel(material_model)
+        self.__materials = None
         if succeeded:
             material = Material(self.__edb, material_def)
             return material
@@ -788,14 +901,15 @@ class Materials(object):
         -------
         :class:`pyedb.dotnet.edb_core.materials.Material`
         """
-        curr_materials = self.materials
+        curr_materials = self.__get_materials()
         if new_material_name in curr_materials:
             raise ValueError(f"Material {new_material_name} already exists in material library.")
         elif new_material_name.lower() in (material.lower() for material in curr_materials):
             raise ValueError(f"Material names are case-insensitive and {new_material_name.lower()} already exists.")
 
-        material = self.materials[material_name]
+        material = self[material_name]
         material_def = self.__edb_definition.MaterialDef.Create(self.__edb.active_db, new_material_name)
+        self.__materials = None
         material_dict = material.to_dict()
         new_material = Material(self.__edb, material_def)
         new_material.update(material_dict)
@@ -808,10 +922,11 @@ class Materials(object):
         if material_def.IsNull():
             raise ValueError(f"Cannot find material {material_name}.")
         material_def.Delete()
+        self.__materials = None
 
     def update_material(self, material_name, input_dict):
         """Update material attributes."""
-        if material_name not in self.materials:
+        if material_name not in self:
             raise ValueError(f"Material {material_name} does not exist in material library.")
 
         material = self[material_name]
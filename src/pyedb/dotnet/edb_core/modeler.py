@@ -24,10 +24,13 @@
 This module contains these classes: `EdbLayout` and `Shape`.
 """
 import math
+import time
 import warnings
 
+import numpy as np
+
+from pyedb.dotnet.edb_core.cell.layout import primitive_cast
 from pyedb.dotnet.edb_core.cell.primitive.bondwire import Bondwire
-from pyedb.dotnet.edb_core.dotnet.primitive import CircleDotNet, RectangleDotNet
 from pyedb.dotnet.edb_core.edb_data.primitives_data import Primitive, cast
 from pyedb.dotnet.edb_core.edb_data.utilities import EDBStatistics
 from pyedb.dotnet.edb_core.general import convert_py_list_to_net_list
@@ -68,6 +71,8 @@ class Modeler(object):
     def __init__(self, p_edb):
         self._pedb = p_edb
         self._primitives = []
+        self._primitive_groups = {}
+        self._primitive_groups_version = None
 
     @property
     def _edb(self):
@@ -102,6 +107,49 @@ class Modeler(object):
         """Db object."""
         return self._pedb.active_db
 
+    def _update_primitive_groups(self):
+        """Group the primitives by layer, net, type, layer and net, and layer and type.
+
+        The groups are built in one pass over the layout snapshot, each primitive being wrapped once, and are
+        kept until the layout changes.
+        """
+        layout = self._pedb.layout
+        if self._primitive_groups_version == layout.version:
+            return
+        snapshot = layout.snapshot
+        groups = {"layer": {}, "net": {}, "type": {}, "layer_net": {}, "layer_type": {}}
+        wrappers = [None] * len(snapshot)
+        layer_names = snapshot.layer_names
+        net_names = snapshot.net_names
+        type_names = snapshot.type_names
+        edb_objects = snapshot.edb_objects
+        for row in np.flatnonzero(snapshot.is_primitive).tolist():
+            prim = primitive_cast(self._pedb, edb_objects[row])
+            if prim is None:
+                continue
+            wrappers[row] = prim
+            layer = layer_names[snapshot.layer_index[row]]
+            net = net_names[snapshot.net_index[row]]
+            prim_type = type_names[snapshot.type_index[row]]
+            groups["layer"].setdefault(layer, []).append(prim)
+            groups["net"].setdefault(net, []).append(prim)
+            groups["type"].setdefault(prim_type, []).append(prim)
+            groups["layer_net"].setdefault((layer, net), []).append(prim)
+            groups["layer_type"].setdefault((layer, prim_type), []).append(prim)
+        self._primitives = wrappers
+        self._primitive_groups = groups
+        self._primitive_groups_version = layout.version
+
+    def _get_grouped_primitives(self, group, key):
+        """Get a copy of the primitives of a group."""
+        self._update_primitive_groups()
+        return list(self._primitive_groups[group].get(key, []))
+
+    def _get_primitives_from_mask(self, mask):
+        """Get the primitives of the layout snapshot rows selected by a mask."""
+        self._update_primitive_groups()
+        return [self._primitives[row] for row in np.flatnonzero(mask).tolist() if self._primitives[row] is not None]
+
     @property
     def layers(self):
         """Dictionary of layers.
@@ -123,16 +171,12 @@ class Modeler(object):
 
         Returns
         -------
-        list of :class:`pyedb.dotnet.edb_core.edb_data.primitives_data.Primitive`
-            List of primitives.
+        :class:`pyedb.dotnet.edb_core.edb_data.primitives_data.Primitive`
+            Primitive or void, ``None`` if no primitive has this id.
         """
-        for p in self._layout.primitives:
-            if p.id == primitive_id:
-                return p
-        for p in self._layout.primitives:
-            for v in p.voids:
-                if v.id == primitive_id:
-                    return v
+        edb_object = self._pedb.layout.id_index.get(primitive_id)
+        if edb_object is not None and edb_object.GetObjType().ToString() == "Primitive":
+            return self._pedb.layout._cast(edb_object)
 
     @property
     def primitives(self):
@@ -156,7 +200,7 @@ class Modeler(object):
         """
         _primitives_by_layer = {}
         for lay in self.layers:
-            _primitives_by_layer[lay] = self.get_polygons_by_layer(lay)
+            _primitives_by_layer[lay] = self._get_grouped_primitives("layer_type", (lay, "Polygon"))
         return _primitives_by_layer
 
     @property
@@ -169,8 +213,8 @@ class Modeler(object):
             Dictionary of primitives with nat names as keys.
         """
         _prim_by_net = {}
-        for net, net_obj in self._pedb.nets.nets.items():
-            _prim_by_net[net] = [i for i in net_obj.primitives]
+        for net in self._pedb.nets.nets:
+            _prim_by_net[net] = self._get_grouped_primitives("net", net)
         return _prim_by_net
 
     @property
@@ -184,18 +228,35 @@ class Modeler(object):
         """
         _primitives_by_layer = {}
         for lay in self.layers:
-            _primitives_by_layer[lay] = []
+            _primitives_by_layer[lay] = self._get_grouped_primitives("layer", lay)
         for lay in self._pedb.stackup.non_stackup_layers:
-            _primitives_by_layer[lay] = []
-        for i in self._layout.primitives:
-            layer = i.layer
-            if not layer:
-                continue
-            lay = layer.name
-            if lay in _primitives_by_layer:
-                _primitives_by_layer[lay].append(i)
+            _primitives_by_layer[lay] = self._get_grouped_primitives("layer", lay)
         return _primitives_by_layer
 
+    @property
+    def primitives_by_layer_and_net(self):
+        """Primitives with layer and net names as keys.
+
+        Returns
+        -------
+        dict
+            Dictionary of primitives with ``(layer name, net name)`` tuples as keys.
+        """
+        self._update_primitive_groups()
+        return {key: list(value) for key, value in self._primitive_groups["layer_net"].items()}
+
+    @property
+    def primitives_by_type(self):
+        """Primitives with primitive types as keys.
+
+        Returns
+        -------
+        dict
+            Dictionary of primitives with types, for example ``"Path"`` or ``"Polygon"``, as keys.
+        """
+        self._update_primitive_groups()
+        return {key: list(value) for key, value in self._primitive_groups["type"].items()}
+
     @property
     def rectangles(self):
         """Rectangles.
@@ -206,7 +267,7 @@ class Modeler(object):
             List of rectangles.
 
         """
-        return [i for i in self.primitives if isinstance(i, RectangleDotNet)]
+        return self._get_grouped_primitives("type", "Rectangle")
 
     @property
     def circles(self):
@@ -218,7 +279,7 @@ class Modeler(object):
             List of circles.
 
         """
-        return [i for i in self.primitives if isinstance(i, CircleDotNet)]
+        return self._get_grouped_primitives("type", "Circle")
 
     @property
     def paths(self):
@@ -229,7 +290,7 @@ class Modeler(object):
         list of :class:`pyedb.dotnet.edb_core.edb_data.primitives_data.Primitive`
             List of paths.
         """
-        return [i for i in self.primitives if i.primitive_type == "path"]
+        return self._get_grouped_primitives("type", "Path")
 
     @property
     def polygons(self):
@@ -240,7 +301,7 @@ class Modeler(object):
         list of :class:`pyedb.dotnet.edb_core.edb_data.primitives_data.Primitive`
             List of polygons.
         """
-        return [i for i in self.primitives if i.primitive_type == "polygon"]
+        return self._get_grouped_primitives("type", "Polygon")
 
     def get_polygons_by_layer(self, layer_name, net_list=None):
         """Retrieve polygons by a layer.
@@ -257,14 +318,10 @@ class Modeler(object):
         list
             List of primitive objects.
         """
-        objinst = []
-        for el in self.polygons:
-            if el.layer.name == layer_name:
-                if net_list and el.net.name in net_list:
-                    objinst.append(el)
-                else:
-                    objinst.append(el)
-        return objinst
+        if not net_list:
+            return self._get_grouped_primitives("layer_type", (layer_name, "Polygon"))
+        snapshot = self._pedb.layout.snapshot
+        return self._get_primitives_from_mask(snapshot.mask(nets=net_list, layers=layer_name, types="Polygon"))
 
     def get_primitive_by_layer_and_point(self, point=None, layer=None, nets=None):
         """Return primitive given coordinate point [x, y], layer name and nets.
@@ -482,6 +539,7 @@ class Modeler(object):
             except:
                 continue_iterate = False
         polygon.SetPolygonData(poligon_data)
+        self._pedb.layout._notify_change(created=[polygon], deleted=[getattr(polygon, "_edb_object", polygon).GetId()])
         return True
 
     def _create_path(
@@ -560,7 +618,8 @@ class Modeler(object):
         if polygon.prim_obj.IsNull():  # pragma: no cover
             self._logger.error("Null path created")
             return False
-        polygon = self._pedb.layout.find_object_by_id(polygon.prim_obj.GetId())
+        self._pedb.layout._notify_change(created=[polygon.prim_obj])
+        polygon = self._pedb.layout._cast(polygon.prim_obj)
         return polygon
 
     def create_trace(
@@ -683,6 +742,7 @@ class Modeler(object):
             self._logger.error("Null polygon created")
             return False
         else:
+            self._pedb.layout._notify_change(created=[polygon])
             return cast(polygon, self._pedb)
 
     def create_polygon_from_points(self, point_list, layer_name, net_name=""):
@@ -787,7 +847,8 @@ class Modeler(object):
                 self._get_edb_value(rotation),
             )
         if rect:
-            return self._pedb.layout.find_object_by_id(rect._edb_object.GetId())
+            self._pedb.layout._notify_change(created=[rect._edb_object])
+            return self._pedb.layout._cast(rect._edb_object)
         return False  # pragma: no cover
 
     def create_circle(self, layer_name, x, y, radius, net_name=""):
@@ -823,7 +884,8 @@ class Modeler(object):
             self._get_edb_value(radius),
         )
         if circle:
-            return self._pedb.layout.find_object_by_id(circle._edb_object.GetId())
+            self._pedb.layout._notify_change(created=[circle._edb_object])
+            return self._pedb.layout._cast(circle._edb_object)
         return False  # pragma: no cover
 
     def delete_primitives(self, net_names):
@@ -847,11 +909,38 @@ class Modeler(object):
         if not isinstance(net_names, list):  # pragma: no cover
             net_names = [net_names]
 
-        for p in self.primitives[:]:
-            if p.net_name in net_names:
-                p.delete()
+        self.delete_many([p for p in self.primitives if p.net_name in net_names])
         return True
 
+    def delete_many(self, primitives):
+        """Delete several primitives at once.
+
+        The primitives are deleted with one EDB call each and the layout caches are invalidated once.
+
+        Parameters
+        ----------
+        primitives : list
+            Primitives to delete, as IDs or :class:`pyedb.dotnet.edb_core.edb_data.primitives_data.Primitive`.
+            Voids are deleted with their primitive.
+
+        Returns
+        -------
+        dict
+            Number of primitives deleted in ``"count"``, IDs not found in ``"not_found"`` and duration in seconds
+            in ``"time"``.
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> edbapp.modeler.delete_many(edbapp.modeler.get_primitives(net_name="GND", layer_name="TOP"))
+        """
+        start = time.time()
+        deleted, not_found = self._pedb.layout._delete_objects(primitives, include_voids=True)
+        report = {"count": len(deleted), "not_found": not_found, "time": time.time() - start}
+        self._logger.info("{} primitives deleted in {:.2f}s.".format(report["count"], report["time"]))
+        return report
+
     def get_primitives(self, net_name=None, layer_name=None, prim_type=None, is_void=False):
         """Get primitives by conditions.
 
@@ -870,23 +959,11 @@ class Modeler(object):
         list
             List of filtered primitives
         """
-        prims = []
-        for el in self.primitives:
-            if not el.type:
-                continue
-            if net_name:
-                if not el.net_name == net_name:
-                    continue
-            if layer_name:
-                if not el.layer_name == layer_name:
-                    continue
-            if prim_type:
-                if not el.type == prim_type:
-                    continue
-            if not el.is_void == is_void:
-                continue
-            prims.append(el)
-        return prims
+        snapshot = self._pedb.layout.snapshot
+        mask = snapshot.is_primitive & snapshot.mask(
+            nets=net_name or None, layers=layer_name or None, types=prim_type or None, is_void=is_void
+        )
+        return self._get_primitives_from_mask(mask)
 
     def fix_circle_void_for_clipping(self):
         """Fix issues when circle void are clipped due to a bug in EDB.
@@ -917,6 +994,7 @@ class Modeler(object):
             if res:
                 cloned_circle.SetIsNegative(True)
                 void_circle.Delete()
+        self._pedb.layout._notify_change()
         return True
 
     def add_void(self, shape, void_shape):
@@ -941,6 +1019,7 @@ class Modeler(object):
                 flag = shape.AddVoid(void)
             if not flag:
                 return flag
+        self._pedb.layout._notify_change(created=[], deleted=[])
         return True
 
     def shape_to_polygon_data(self, shape):
@@ -1257,8 +1336,10 @@ class Modeler(object):
                                 id = -1
                             if id >= 0:
                                 delete_list.pop(id)
+            deleted_ids = [poly.GetId() for poly in delete_list]
             for poly in delete_list:
                 poly.Delete()
+            self._pedb.layout._notify_change(deleted=deleted_ids)
 
         if delete_padstack_gemometries:
             self._logger.info("Deleting Padstack Definitions")
@@ -1287,6 +1368,7 @@ class Modeler(object):
         poly_data = poly.polygon_data
         new_poly = poly_data._edb_object.Defeature(tolerance)
         poly._edb_object.SetPolygonData(new_poly)
+        self._pedb.layout._notify_change(created=[poly._edb_object], deleted=[poly._edb_object.GetId()])
         return True
 
     def get_layout_statistics(self, evaluate_area=False, net_list=None):
@@ -1391,7 +1473,7 @@ class Modeler(object):
             Bondwire object created.
         """
 
-        return Bondwire(
+        bondwire = Bondwire(
             pedb=self._pedb,
             bondwire_type=bondwire_type,
             definition_name=definition_name,
@@ -1406,6 +1488,8 @@ class Modeler(object):
             end_y=self._pedb.edb_value(end_y),
             net=self._pedb.nets[net]._edb_object,
         )
+        self._pedb.layout._notify_change(created=[bondwire._edb_object])
+        return bondwire
 
     def create_pin_group(
         self,
@@ -1468,4 +1552,6 @@ class Modeler(object):
             net_obj = [i.GetNet() for i in pins if not i.GetNet().IsNull()]
             if net_obj:
                 obj.SetNet(net_obj[0])
+            # Pin groups are not indexed, so only the caches keyed on the layout version are invalidated.
+            self._pedb.layout._notify_change(created=[], deleted=[])
         return self._pedb.siwave.pin_groups[name]
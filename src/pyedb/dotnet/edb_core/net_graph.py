@@ -0,0 +1,573 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains the ``ComponentNetGraph`` class, the bipartite graph between components and nets, and
+the ``PowerTreeGraph`` class built on it.
+"""
+import numpy as np
+
+from pyedb.dotnet.edb_core.cell.connectivity import UnionFind
+
+COMPONENT_TYPES = {0: "Other", 1: "Resistor", 2: "Inductor", 3: "Capacitor", 4: "IC", 5: "IO"}
+RLC_TYPES = {1: "Resistor", 2: "Inductor", 3: "Capacitor"}
+
+
+class ComponentNetGraph(object):
+    """Bipartite graph between the components and the nets of a layout.
+
+    The component-net incidence is read from EDB in a single pass over the component pins and stored as
+    compressed sparse rows, in both directions. The component values are read once, on first access.
+    Merging nets across components is then done in Python, so that threshold sweeps do not go back to EDB.
+
+    Parameters
+    ----------
+    pedb : :class:`pyedb.dotnet.edb.Edb`
+        EDB object.
+
+    Attributes
+    ----------
+    net_names : list[str]
+        Net names, in layout order.
+    component_names : list[str]
+        Reference designators.
+    component_pins : list[list[tuple[str, str]]]
+        Pin name and net name of the pins of each component.
+    indptr : :class:`numpy.ndarray`
+        Row offsets of each component in :attr:`indices`.
+    indices : :class:`numpy.ndarray`
+        Sorted indices in :attr:`net_names` of the nets of each component.
+    component_nets : list[:class:`numpy.ndarray`]
+        Views of :attr:`indices` on the nets of each component.
+    net_indptr : :class:`numpy.ndarray`
+        Row offsets of each net in :attr:`net_indices`.
+    net_indices : :class:`numpy.ndarray`
+        Sorted indices in :attr:`component_names` of the components of each net.
+
+    Examples
+    --------
+    >>> from pyedb import Edb
+    >>> edbapp = Edb("myaedbfolder")
+    >>> graph = edbapp.nets.component_net_graph
+    >>> graph.components_on_net("GND")
+    >>> graph.shared_nets("U1", "U2")
+    """
+
+    def __init__(self, pedb):
+        self._pedb = pedb
+        self.net_names = list(pedb.nets.nets.keys())
+        self._net_lookup = {name: i for i, name in enumerate(self.net_names)}
+        components = pedb.components
+        self.component_names = list(components.instances.keys())
+        self._component_lookup = {name: i for i, name in enumerate(self.component_names)}
+        self.component_pins = [
+            [(pin.GetName(), pin.GetNet().GetName()) for pin in components.get_pin_from_component(refdes)]
+            for refdes in self.component_names
+        ]
+        rows = [
+            np.unique([self._net_lookup[net] for _, net in pins if net in self._net_lookup]).astype(np.int64)
+            for pins in self.component_pins
+        ]
+        self.indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        self.indptr[1:] = np.cumsum([len(row) for row in rows])
+        self.indices = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        # The transposed rows are sorted by net, then by component.
+        row_components = np.repeat(np.arange(len(rows), dtype=np.int64), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind="stable")
+        self.net_indices = row_components[order]
+        self.net_indptr = np.zeros(len(self.net_names) + 1, dtype=np.int64)
+        self.net_indptr[1:] = np.cumsum(np.bincount(self.indices, minlength=len(self.net_names)))
+        self.component_nets = np.split(self.indices, self.indptr[1:-1])
+        self._part_names = None
+        self.clear_values()
+
+    @property
+    def net_degrees(self):
+        """Number of components connected to each net.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        return np.diff(self.net_indptr)
+
+    def _net_row(self, net_name):
+        index = self._net_lookup.get(net_name)
+        if index is None:
+            return np.zeros(0, dtype=np.int64)
+        return self.net_indices[self.net_indptr[index] : self.net_indptr[index + 1]]
+
+    def _component_row(self, refdes):
+        index = self._component_lookup.get(refdes)
+        if index is None:
+            return np.zeros(0, dtype=np.int64)
+        return self.indices[self.indptr[index] : self.indptr[index + 1]]
+
+    def components_on_net(self, net_name):
+        """Get the components connected to a net.
+
+        Parameters
+        ----------
+        net_name : str
+
+        Returns
+        -------
+        list[str]
+        """
+        return [self.component_names[i] for i in self._net_row(net_name)]
+
+    def components_on_nets(self, net_names):
+        """Get the components connected to any of several nets.
+
+        Parameters
+        ----------
+        net_names : str, list
+
+        Returns
+        -------
+        list[str]
+            Reference designators, in component order.
+        """
+        if isinstance(net_names, str):
+            net_names = [net_names]
+        rows = [self._net_row(net) for net in net_names]
+        if not rows:
+            return []
+        return [self.component_names[i] for i in np.unique(np.concatenate(rows))]
+
+    def nets_of_component(self, refdes):
+        """Get the nets connected to a component.
+
+        Parameters
+        ----------
+        refdes : str
+
+        Returns
+        -------
+        list[str]
+        """
+        return [self.net_names[i] for i in self._component_row(refdes)]
+
+    def shared_nets(self, refdes1, refdes2):
+        """Get the nets connected to both of two components.
+
+        Parameters
+        ----------
+        refdes1 : str
+        refdes2 : str
+
+        Returns
+        -------
+        list[str]
+        """
+        shared = np.intersect1d(self._component_row(refdes1), self._component_row(refdes2), assume_unique=True)
+        return [self.net_names[i] for i in shared]
+
+    def degree(self, net_name):
+        """Get the number of components connected to a net.
+
+        Parameters
+        ----------
+        net_name : str
+
+        Returns
+        -------
+        int
+        """
+        return len(self._net_row(net_name))
+
+    @property
+    def part_names(self):
+        """Part name of each component, read on first access.
+
+        Returns
+        -------
+        list[str]
+        """
+        if self._part_names is None:
+            instances = self._pedb.components.instances
+            self._part_names = [instances[refdes].partname for refdes in self.component_names]
+        return self._part_names
+
+    @property
+    def component_types(self):
+        """EDB component type of each component.
+
+        ``1`` for resistors, ``2`` for inductors and ``3`` for capacitors.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        if self._component_types is None:
+            self.read_values()
+        return self._component_types
+
+    @property
+    def enabled(self):
+        """Whether each RLC component is enabled. ``False`` for the other components.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        if self._enabled is None:
+            self.read_values()
+        return self._enabled
+
+    @property
+    def rlc_values(self):
+        """Resistance, inductance and capacitance of each RLC component, ``nan`` otherwise.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+        """
+        if self._rlc_values is None:
+            self.read_values()
+        return self._rlc_values
+
+    def clear_values(self):
+        """Clear the component values, so that they are read again on next access."""
+        self._component_types = None
+        self._enabled = None
+        self._rlc_values = None
+        self._last_merged = None
+        self._last_groups = None
+
+    def read_values(self):
+        """Read the type, state and RLC values of all the components."""
+        count = len(self.component_names)
+        component_types = np.zeros(count, dtype=np.int64)
+        enabled = np.zeros(count, dtype=bool)
+        rlc_values = np.full((count, 3), np.nan)
+        instances = self._pedb.components.instances
+        for i, refdes in enumerate(self.component_names):
+            component = instances[refdes]
+            component_type = int(component.edbcomponent.GetComponentType())
+            component_types[i] = component_type
+            if component_type not in RLC_TYPES:
+                continue
+            enabled[i] = component.component_property.IsEnabled()
+            rlc_values[i] = [np.nan if value is None else value for value in component.rlc_values]
+        self.clear_values()
+        self._component_types = component_types
+        self._enabled = enabled
+        self._rlc_values = rlc_values
+
+    def merging_components(self, resistor_below=10, inductor_below=1, capacitor_above=1, exception_list=None):
+        """Get the components merging their nets in an extended net.
+
+        Parameters
+        ----------
+        resistor_below : int, float, optional
+            Resistors with a lower value merge their nets.
+        inductor_below : int, float, optional
+            Inductors with a lower value merge their nets.
+        capacitor_above : int, float, optional
+            Capacitors with a higher value merge their nets.
+        exception_list : list, optional
+            Reference designators of RLC components merging their nets whatever their value.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Boolean mask over :attr:`component_names`.
+        """
+        types = self.component_types
+        values = self.rlc_values
+        with np.errstate(invalid="ignore"):
+            merged = (
+                ((types == 1) & (values[:, 0] < resistor_below))
+                | ((types == 2) & (values[:, 1] < inductor_below))
+                | ((types == 3) & (values[:, 2] > capacitor_above))
+            )
+        if exception_list:
+            merged |= np.isin(self.component_names, list(exception_list)) & np.isin(types, list(RLC_TYPES))
+        return merged & self.enabled
+
+    def extended_nets(self, resistor_below=10, inductor_below=1, capacitor_above=1, exception_list=None):
+        """Group the nets connected through the merging components.
+
+        Parameters
+        ----------
+        resistor_below : int, float, optional
+            Resistors with a lower value merge their nets.
+        inductor_below : int, float, optional
+            Inductors with a lower value merge their nets.
+        capacitor_above : int, float, optional
+            Capacitors with a higher value merge their nets.
+        exception_list : list, optional
+            Reference designators of RLC components merging their nets whatever their value.
+
+        Returns
+        -------
+        list[list[str]]
+            Net groups, including the single nets. Groups and nets are in layout order.
+
+        Notes
+        -----
+        When the new thresholds select the same components as the previous call, the previous groups are
+        returned without merging again.
+        """
+        merged = self.merging_components(resistor_below, inductor_below, capacitor_above, exception_list)
+        if self._last_merged is None or not np.array_equal(merged, self._last_merged):
+            union_find = UnionFind(len(self.net_names))
+            for i in np.flatnonzero(merged):
+                nets = self.component_nets[i]
+                for net in nets[1:]:
+                    union_find.union(nets[0], net)
+            groups = {}
+            for net, label in enumerate(union_find.labels()):
+                groups.setdefault(label, []).append(self.net_names[net])
+            self._last_merged = merged
+            self._last_groups = list(groups.values())
+        return [list(group) for group in self._last_groups]
+
+
+class PowerTreeGraph(object):
+    """Power delivery graph of a layout.
+
+    Rails are the groups of nets joined through series components, that is two-pin inductors and two-pin
+    resistors below a resistance threshold which are not connected to a ground net. Every other component
+    connected to a rail is either one of its voltage regulator modules or one of its loads.
+
+    Parameters
+    ----------
+    pedb : :class:`pyedb.dotnet.edb.Edb`
+        EDB object.
+    ground_nets : list, optional
+        List of ground nets. The default is ``["GND"]``.
+    res_value : float, optional
+        Resistors with a lower or equal value are series components. The default is ``0.001``.
+
+    Attributes
+    ----------
+    graph : :class:`ComponentNetGraph`
+        Component-net graph the power tree is built on.
+    series : :class:`numpy.ndarray`
+        Boolean mask over the components of :attr:`graph` joining the nets of a rail.
+    vrms : dict[str, str]
+        Voltage regulator module names by reference designator of their component.
+
+    Examples
+    --------
+    >>> from pyedb import Edb
+    >>> edbapp = Edb("myaedbfolder")
+    >>> power_trees = edbapp.nets.power_tree_graph(["GND"])
+    >>> df = power_trees.to_dataframe(["1V0", "1V8", "3V3"])
+    """
+
+    COLUMNS = ["refdes", "pin_name", "net_name", "component_type", "component_partname", "pin_list"]
+
+    def __init__(self, pedb, ground_nets=None, res_value=0.001):
+        self._pedb = pedb
+        self.graph = graph = pedb.nets.component_net_graph
+        self.ground_nets = list(ground_nets) if ground_nets is not None else ["GND"]
+        ground = np.isin(graph.net_names, self.ground_nets)
+        on_ground = np.array([ground[nets].any() for nets in graph.component_nets], dtype=bool)
+        pin_counts = np.array([len(pins) for pins in graph.component_pins], dtype=np.int64)
+        types = graph.component_types
+        with np.errstate(invalid="ignore"):
+            series_type = (types == 2) | ((types == 1) & (graph.rlc_values[:, 0] <= res_value))
+        self.series = (pin_counts == 2) & ~on_ground & series_type
+        union_find = UnionFind(len(graph.net_names))
+        in_rail = np.zeros(len(graph.net_names), dtype=bool)
+        for i in np.flatnonzero(self.series):
+            nets = graph.component_nets[i]
+            in_rail[nets] = True
+            for net in nets[1:]:
+                union_find.union(nets[0], net)
+        self._labels = union_find.labels()
+        self._in_rail = in_rail
+        self._net_index = {name: i for i, name in enumerate(graph.net_names)}
+        self._component_index = {name: i for i, name in enumerate(graph.component_names)}
+        self._net_pins = None
+        self.vrms = {}
+        for name, vrm in pedb.voltage_regulator_modules.items():
+            component = vrm.component
+            if component:
+                self.vrms[component.refdes] = name
+
+    @property
+    def rails(self):
+        """Rails joining several nets.
+
+        Returns
+        -------
+        list[set[str]]
+        """
+        rails = {}
+        for net in np.flatnonzero(self._in_rail):
+            rails.setdefault(self._labels[net], set()).add(self.graph.net_names[net])
+        return list(rails.values())
+
+    def rail_of(self, net_name):
+        """Get the nets of the rail of a net.
+
+        Parameters
+        ----------
+        net_name : str
+
+        Returns
+        -------
+        list[str]
+            Nets of the rail in layout order, or only ``net_name`` if it is not joined to any other net.
+        """
+        index = self._net_index.get(net_name)
+        if index is None or not self._in_rail[index]:
+            return [net_name]
+        return [self.graph.net_names[i] for i in np.flatnonzero(self._labels == self._labels[index])]
+
+    def _pins_on_net(self, net_name):
+        if self._net_pins is None:
+            self._net_pins = {}
+            for i, pins in enumerate(self.graph.component_pins):
+                for pin_name, pin_net in pins:
+                    component_pins = self._net_pins.setdefault(pin_net, {})
+                    component_pins.setdefault(i, []).append(pin_name)
+        return self._net_pins.get(net_name, {})
+
+    def power_tree(self, net_name):
+        """Get the components connected to the rail of a net.
+
+        Parameters
+        ----------
+        net_name : str
+
+        Returns
+        -------
+        tuple[list[list], list[str], list[str]]
+            Rows of component pins, column names and nets of the rail, as returned by
+            :func:`pyedb.dotnet.edb_core.nets.EdbNets.get_powertree`.
+        """
+        graph = self.graph
+        net_group = self.rail_of(net_name)
+        component_list = []
+        for net in net_group:
+            for i, pin_names in sorted(self._pins_on_net(net).items()):
+                for pin_name in pin_names:
+                    component_list.append(
+                        [
+                            graph.component_names[i],
+                            pin_name,
+                            net,
+                            COMPONENT_TYPES.get(int(graph.component_types[i])),
+                            graph.part_names[i],
+                            "-".join(pin_names),
+                        ]
+                    )
+        return component_list, list(self.COLUMNS), net_group
+
+    def _rail_names(self, nets):
+        if nets is None:
+            nets = [net for net in self._pedb.nets.power if net not in self.ground_nets]
+        elif isinstance(nets, str):
+            nets = [nets]
+        rail_names = []
+        covered = set()
+        for net in nets:
+            if net not in covered:
+                rail_names.append(net)
+                covered.update(self.rail_of(net))
+        return rail_names
+
+    def power_trees(self, nets=None):
+        """Get the power trees of several rails.
+
+        Parameters
+        ----------
+        nets : str, list, optional
+            Nets whose rails are returned. The default is ``None``, in which case all the power nets
+            other than the ground nets are used. Nets of a rail already returned are skipped.
+
+        Returns
+        -------
+        dict[str, tuple[list[list], list[str], list[str]]]
+            Power trees by net name, as returned by :func:`power_tree`.
+        """
+        return {net: self.power_tree(net) for net in self._rail_names(nets)}
+
+    def role(self, refdes):
+        """Get the role of a component in the power delivery network.
+
+        Parameters
+        ----------
+        refdes : str
+
+        Returns
+        -------
+        str
+            ``"vrm"``, ``"series"`` or ``"load"``.
+        """
+        if refdes in self.vrms:
+            return "vrm"
+        if self.series[self._component_index[refdes]]:
+            return "series"
+        return "load"
+
+    def to_adjacency(self, nets=None):
+        """Export the power trees as adjacency lists.
+
+        Parameters
+        ----------
+        nets : str, list, optional
+            Nets whose rails are exported. The default is ``None``, in which case all the power nets
+            other than the ground nets are used.
+
+        Returns
+        -------
+        dict[str, dict[str, list[str]]]
+            For each rail, the components connected to each net and the nets connected to each component.
+        """
+        adjacency = {}
+        for rail, (component_list, _, net_group) in self.power_trees(nets).items():
+            rail_adjacency = {net: [] for net in net_group}
+            for refdes, _, net, _, _, _ in component_list:
+                if refdes not in rail_adjacency[net]:
+                    rail_adjacency[net].append(refdes)
+                neighbors = rail_adjacency.setdefault(refdes, [])
+                if net not in neighbors:
+                    neighbors.append(net)
+            adjacency[rail] = rail_adjacency
+        return adjacency
+
+    def to_dataframe(self, nets=None):
+        """Export the power trees as a DataFrame.
+
+        Parameters
+        ----------
+        nets : str, list, optional
+            Nets whose rails are exported. The default is ``None``, in which case all the power nets
+            other than the ground nets are used.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            One row per component pin, with the ``"rail"`` and ``"role"`` columns added to :attr:`COLUMNS`.
+        """
+        import pandas as pd
+
+        rows = []
+        for rail, (component_list, _, _) in self.power_trees(nets).items():
+            rows.extend([rail] + row + [self.role(row[0])] for row in component_list)
+        return pd.DataFrame(rows, columns=["rail"] + self.COLUMNS + ["role"])
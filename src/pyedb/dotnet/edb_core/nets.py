@@ -22,10 +22,14 @@
 
 from __future__ import absolute_import  # noreorder
 
+import time
 import warnings
 
+import numpy as np
+
 from pyedb.common.nets import CommonNets
 from pyedb.dotnet.edb_core.edb_data.nets_data import EDBNetsData
+from pyedb.dotnet.edb_core.net_graph import ComponentNetGraph, PowerTreeGraph
 from pyedb.generic.general_methods import generate_unique_name
 from pyedb.misc.utilities import compute_arc_points
 
@@ -71,8 +75,12 @@ class EdbNets(CommonNets):
 
     def __init__(self, p_edb):
         self._pedb = p_edb
-        self._nets_by_comp_dict = {}
-        self._comps_by_nets_dict = {}
+        self._nets = {}
+        self._nets_version = None
+        self._component_net_graph = None
+        self._component_net_graph_version = None
+        self._power_tree_graph = None
+        self._power_tree_graph_key = None
 
     @property
     def _edb(self):
@@ -113,7 +121,11 @@ class EdbNets(CommonNets):
         dict[str, :class:`pyedb.dotnet.edb_core.edb_data.nets_data.EDBNetsData`]
             Dictionary of nets.
         """
-        return {i.name: i for i in self._pedb.layout.nets}
+        layout = self._pedb.layout
+        if self._nets_version != layout.version:
+            self._nets = {i.name: i for i in layout.nets}
+            self._nets_version = layout.version
+        return self._nets
 
     @property
     def netlist(self):
@@ -225,21 +237,35 @@ class EdbNets(CommonNets):
     def nets_by_components(self):
         # type: () -> dict
         """Get all nets for each component instance."""
-        for comp, i in self._pedb.components.instances.items():
-            self._nets_by_comp_dict[comp] = i.nets
-        return self._nets_by_comp_dict
+        graph = self.component_net_graph
+        return {refdes: graph.nets_of_component(refdes) for refdes in graph.component_names}
 
     @property
     def components_by_nets(self):
         # type: () -> dict
         """Get all component instances grouped by nets."""
-        for comp, i in self._pedb.components.instances.items():
-            for n in i.nets:
-                if n in self._comps_by_nets_dict:
-                    self._comps_by_nets_dict[n].append(comp)
-                else:
-                    self._comps_by_nets_dict[n] = [comp]
-        return self._comps_by_nets_dict
+        graph = self.component_net_graph
+        return {net: graph.components_on_net(net) for net, degree in zip(graph.net_names, graph.net_degrees) if degree}
+
+    @property
+    def component_net_graph(self):
+        """Bipartite graph between the components and the nets.
+
+        The graph is rebuilt when the layout changes and its component values are read again when a
+        component model changes. :attr:`nets_by_components`, :attr:`components_by_nets` and
+        :func:`generate_extended_nets` are all computed on it.
+
+        Returns
+        -------
+        :class:`pyedb.dotnet.edb_core.net_graph.ComponentNetGraph`
+        """
+        layout = self._pedb.layout
+        if self._component_net_graph is None or self._component_net_graph_version[0] != layout.version:
+            self._component_net_graph = ComponentNetGraph(self._pedb)
+        elif self._component_net_graph_version[1] != layout._component_model_version:
+            self._component_net_graph.clear_values()
+        self._component_net_graph_version = (layout.version, layout._component_model_version)
+        return self._component_net_graph
 
     def generate_extended_nets(
         self,
@@ -276,58 +302,22 @@ class EdbNets(CommonNets):
         list
             List of all extended nets.
 
+        Notes
+        -----
+        The nets are merged on :attr:`component_net_graph`, so that calling this method again with other
+        thresholds does not read the components from EDB.
+
         Examples
         --------
         >>> from pyedb import Edb
         >>> app = Edb()
         >>> app.nets.get_extended_nets()
         """
-        if exception_list is None:
-            exception_list = []
-        _extended_nets = []
         _nets = self.nets
-        all_nets = list(_nets.keys())[:]
-        net_dicts = self._comps_by_nets_dict if self._comps_by_nets_dict else self.components_by_nets
-        comp_dict = self._nets_by_comp_dict if self._nets_by_comp_dict else self.nets_by_components
-
-        def get_net_list(net_name, _net_list):
-            comps = []
-            if net_name in net_dicts:
-                comps = net_dicts[net_name]
-
-            for vals in comps:
-                refdes = vals
-                cmp = self._pedb.components.instances[refdes]
-                is_enabled = cmp.is_enabled
-                if not is_enabled:
-                    continue
-                val_type = cmp.type
-                if val_type not in ["Inductor", "Resistor", "Capacitor"]:
-                    continue
-
-                val_value = cmp.rlc_values
-                if refdes in exception_list:
-                    pass
-                elif val_type == "Inductor" and val_value[1] < inductor_below:
-                    pass
-                elif val_type == "Resistor" and val_value[0] < resistor_below:
-                    pass
-                elif val_type == "Capacitor" and val_value[2] > capacitor_above:
-                    pass
-                else:
-                    continue
-
-                for net in comp_dict[refdes]:
-                    if net not in _net_list:
-                        _net_list.append(net)
-                        get_net_list(net, _net_list)
-
-        while len(all_nets) > 0:
-            new_ext = [all_nets[0]]
-            get_net_list(new_ext[0], new_ext)
-            all_nets = [i for i in all_nets if i not in new_ext]
-            _extended_nets.append(new_ext)
-
+        _extended_nets = self.component_net_graph.extended_nets(
+            resistor_below, inductor_below, capacitor_above, exception_list
+        )
+        for new_ext in _extended_nets:
             if len(new_ext) > 1:
                 i = new_ext[0]
                 for i in new_ext:
@@ -378,6 +368,97 @@ class EdbNets(CommonNets):
         # fmt: on
         return x, y
 
+    def metrics(self, nets=None):
+        """Compute geometry metrics of the nets.
+
+        All the metrics are aggregated in one pass over the layout snapshot.
+
+        Parameters
+        ----------
+        nets : str, list, optional
+            Net names. The default is ``None``, in which case all the nets are returned.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            Table indexed by net name with these columns:
+
+            - ``"length"``: Total length of the paths.
+            - ``"min_width"`` and ``"max_width"``: Width range of the paths, ``NaN`` for nets without paths.
+            - ``"area"``: Copper area of the primitives, net of their voids.
+            - ``"via_count"``: Number of padstack instances spanning several layers.
+            - ``"layer_transitions"``: Number of signal layers crossed by these padstack instances.
+            - ``"component_count"``: Number of components with pins on the net.
+            - ``"length_<layer>"``: Length of the paths on each signal layer.
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> df = edbapp.nets.metrics()
+        >>> df[df["via_count"] > 10].sort_values("length")
+        """
+        import pandas as pd
+
+        snapshot = self._pedb.layout.snapshot
+        net_count = len(snapshot.net_names)
+        layer_count = len(snapshot.layer_names)
+        net_index = snapshot.net_index
+
+        paths = snapshot.mask(types="Path", is_void=False)
+        path_nets = net_index[paths]
+        path_lengths = snapshot.length[paths]
+        path_widths = snapshot.width[paths]
+        length = np.bincount(path_nets, weights=path_lengths, minlength=net_count)
+        length_by_layer = np.bincount(
+            path_nets * layer_count + snapshot.layer_index[paths],
+            weights=path_lengths,
+            minlength=net_count * layer_count,
+        ).reshape(net_count, layer_count)
+        min_width = np.full(net_count, np.inf)
+        np.minimum.at(min_width, path_nets, path_widths)
+        max_width = np.full(net_count, -np.inf)
+        np.maximum.at(max_width, path_nets, path_widths)
+
+        conductors = snapshot.is_primitive & ~snapshot.is_void
+        area = np.bincount(net_index[conductors], weights=snapshot.area[conductors], minlength=net_count)
+
+        padstack_instances = snapshot.is_padstack_instance
+        vias = padstack_instances & (snapshot.layer_index != snapshot.stop_layer_index)
+        via_count = np.bincount(net_index[vias], minlength=net_count)
+        signal_layers = list(self._pedb.stackup.signal_layers.keys())
+        signal_position = {name: i for i, name in enumerate(signal_layers)}
+        layer_position = np.array([signal_position.get(name, -1) for name in snapshot.layer_names], dtype=np.int64)
+        start = layer_position[snapshot.layer_index[vias]]
+        stop = layer_position[snapshot.stop_layer_index[vias]]
+        spans = np.where((start >= 0) & (stop >= 0), np.abs(stop - start), 0)
+        layer_transitions = np.bincount(net_index[vias], weights=spans, minlength=net_count)
+
+        pins = padstack_instances & (snapshot.component_index >= 0)
+        net_components = np.unique(np.stack([net_index[pins], snapshot.component_index[pins]], axis=1), axis=0)
+        component_count = np.bincount(net_components[:, 0], minlength=net_count)
+
+        columns = {
+            "length": length,
+            "min_width": np.where(np.isinf(min_width), np.nan, min_width),
+            "max_width": np.where(np.isinf(max_width), np.nan, max_width),
+            "area": area,
+            "via_count": via_count,
+            "layer_transitions": layer_transitions.astype(np.int64),
+            "component_count": component_count,
+        }
+        for layer in signal_layers:
+            layer_index = snapshot.layer_names.index(layer) if layer in snapshot.layer_names else -1
+            columns["length_{}".format(layer)] = length_by_layer[:, layer_index] if layer_index >= 0 else 0.0
+        df = pd.DataFrame(columns, index=pd.Index(snapshot.net_names, name="net"))
+        if nets is None:
+            nets = list(self.nets.keys())
+        elif isinstance(nets, str):
+            nets = [nets]
+        fill_values = {column: 0 for column in df.columns if column not in ("min_width", "max_width")}
+        counts = {"via_count": int, "layer_transitions": int, "component_count": int}
+        return df.reindex(nets).fillna(fill_values).astype(counts)
+
     def classify_nets(self, power_nets=None, signal_nets=None):
         """Reassign power/ground or signal nets based on list of nets.
 
@@ -430,55 +511,55 @@ class EdbNets(CommonNets):
                 return True
         return False
 
+    def power_tree_graph(self, ground_nets=None, res_value=0.001):
+        """Power delivery graph of the layout.
+
+        The graph is built on :attr:`component_net_graph` and kept until the layout or a component model
+        changes, or it is requested with other parameters.
+
+        Parameters
+        ----------
+        ground_nets : list, optional
+            List of ground nets. The default is ``["GND"]``.
+        res_value : float, optional
+            Resistors with a lower or equal value join the nets of a rail. The default is ``0.001``.
+
+        Returns
+        -------
+        :class:`pyedb.dotnet.edb_core.net_graph.PowerTreeGraph`
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> power_trees = edbapp.nets.power_tree_graph(["GND"]).power_trees()
+        """
+        self.component_net_graph  # Refresh the graph and its version.
+        key = (self._component_net_graph_version, tuple(ground_nets or ["GND"]), res_value)
+        if self._power_tree_graph is None or self._power_tree_graph_key != key:
+            self._power_tree_graph = PowerTreeGraph(self._pedb, ground_nets, res_value)
+            self._power_tree_graph_key = key
+        return self._power_tree_graph
+
     def get_dcconnected_net_list(self, ground_nets=["GND"], res_value=0.001):
         """Get the nets connected to the direct current through inductors.
 
         .. note::
-           Only inductors are considered.
+           Only inductors and resistors with a value lower or equal to ``res_value`` are considered.
 
         Parameters
         ----------
         ground_nets : list, optional
             List of ground nets. The default is ``["GND"]``.
+        res_value : float, optional
+            Resistance threshold. The default is ``0.001``.
 
         Returns
         -------
         list
             List of nets connected to DC through inductors.
         """
-        temp_list = []
-        for _, comp_obj in self._pedb.components.inductors.items():
-            numpins = comp_obj.numpins
-
-            if numpins == 2:
-                nets = comp_obj.nets
-                if not set(nets).intersection(set(ground_nets)):
-                    temp_list.append(set(nets))
-                else:
-                    pass
-        for _, comp_obj in self._pedb.components.resistors.items():
-            numpins = comp_obj.numpins
-
-            if numpins == 2 and self._pedb._decompose_variable_value(comp_obj.res_value) <= res_value:
-                nets = comp_obj.nets
-                if not set(nets).intersection(set(ground_nets)):
-                    temp_list.append(set(nets))
-                else:
-                    pass
-        dcconnected_net_list = []
-
-        while not not temp_list:
-            s = temp_list.pop(0)
-            interseciton_flag = False
-            for i in temp_list:
-                if not not s.intersection(i):
-                    i.update(s)
-                    interseciton_flag = True
-
-            if not interseciton_flag:
-                dcconnected_net_list.append(s)
-
-        return dcconnected_net_list
+        return self.power_tree_graph(ground_nets, res_value).rails
 
     def get_powertree(self, power_net_name, ground_nets):
         """Retrieve the power tree.
@@ -487,57 +568,15 @@ class EdbNets(CommonNets):
         ----------
         power_net_name : str
             Name of the power net.
-        ground_nets :
-
+        ground_nets : list
+            List of ground nets.
 
         Returns
         -------
-
+        tuple[list[list], list[str], list[str]]
+            Rows of component pins, column names and nets of the rail.
         """
-        flag_in_ng = False
-        net_group = []
-        for ng in self.get_dcconnected_net_list(ground_nets):
-            if power_net_name in ng:
-                flag_in_ng = True
-                net_group.extend(ng)
-                break
-
-        if not flag_in_ng:
-            net_group.append(power_net_name)
-
-        component_list = []
-        rats = self._pedb.components.get_rats()
-        for net in net_group:
-            for el in rats:
-                if net in el["net_name"]:
-                    i = 0
-                    for n in el["net_name"]:
-                        if n == net:
-                            df = [el["refdes"][i], el["pin_name"][i], net]
-                            component_list.append(df)
-                        i += 1
-
-        component_type = []
-        for el in component_list:
-            refdes = el[0]
-            comp_type = self._pedb.components._cmp[refdes].type
-            component_type.append(comp_type)
-            el.append(comp_type)
-
-            comp_partname = self._pedb.components._cmp[refdes].partname
-            el.append(comp_partname)
-            pins = self._pedb.components.get_pin_from_component(component=refdes, netName=el[2])
-            el.append("-".join([i.GetName() for i in pins]))
-
-        component_list_columns = [
-            "refdes",
-            "pin_name",
-            "net_name",
-            "component_type",
-            "component_partname",
-            "pin_list",
-        ]
-        return component_list, component_list_columns, net_group
+        return self.power_tree_graph(ground_nets).power_tree(power_net_name)
 
     def get_net_by_name(self, net_name):
         """Find a net by name."""
@@ -590,16 +629,63 @@ class EdbNets(CommonNets):
         if isinstance(netlist, str):
             netlist = [netlist]
 
-        self._pedb.modeler.delete_primitives(netlist)
-        self._pedb.padstacks.delete_padstack_instances(netlist)
+        not_found = self.delete_many(netlist)["not_found"]
+        return [name for name in netlist if name not in not_found]
+
+    def delete_many(self, nets, delete_objects=True):
+        """Delete several nets at once, with their primitives and padstack instances.
+
+        Objects are deleted in bulk with :func:`pyedb.dotnet.edb_core.modeler.Modeler.delete_many` and
+        :func:`pyedb.dotnet.edb_core.padstack.EdbPadstacks.delete_many`.
+
+        Parameters
+        ----------
+        nets : list
+            Nets to delete, as names or :class:`pyedb.dotnet.edb_core.edb_data.nets_data.EDBNetsData`.
+        delete_objects : bool, optional
+            Whether to delete the primitives and padstack instances of the nets. The default is ``True``.
 
-        nets_deleted = []
+        Returns
+        -------
+        dict
+            Number of nets, primitives and padstack instances deleted in ``"count"``, ``"primitives"`` and
+            ``"padstack_instances"``, names of the nets not found in ``"not_found"`` and duration in seconds in
+            ``"time"``.
 
-        for i in self._pedb.nets.nets.values():
-            if i.name in netlist:
-                i.net_object.Delete()
-                nets_deleted.append(i.name)
-        return nets_deleted
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> edbapp.nets.delete_many(["Net1", "Net2"])
+        """
+        start = time.time()
+        names = [net if isinstance(net, str) else net.name for net in nets]
+        existing = self.nets
+        report = {
+            "count": 0,
+            "primitives": 0,
+            "padstack_instances": 0,
+            "not_found": [name for name in names if name not in existing],
+        }
+        names = list(dict.fromkeys(name for name in names if name in existing))
+        if delete_objects and names:
+            snapshot = self._pedb.layout.snapshot
+            mask = snapshot.mask(nets=names)
+            primitive_ids = snapshot.ids[mask & snapshot.is_primitive]
+            instance_ids = snapshot.ids[mask & snapshot.is_padstack_instance]
+            report["primitives"] = self._pedb.modeler.delete_many(primitive_ids.tolist())["count"]
+            report["padstack_instances"] = self._pedb.padstacks.delete_many(instance_ids.tolist())["count"]
+        for name in names:
+            existing[name].net_object.Delete()
+        if delete_objects or not names:
+            self._pedb.layout._notify_change(created=[], deleted=[])
+        else:
+            # Objects kept on a deleted net lose their net, so the indexes filtering on net names are rebuilt.
+            self._pedb.layout._notify_change()
+        report["count"] = len(names)
+        report["time"] = time.time() - start
+        self._logger.info("{} nets deleted in {:.2f}s.".format(report["count"], report["time"]))
+        return report
 
     def find_or_create_net(self, net_name="", start_with="", contain="", end_with=""):
         """Find or create the net with the given name in the layout.
@@ -626,12 +712,14 @@ class EdbNets(CommonNets):
         if not net_name and not start_with and not contain and not end_with:
             net_name = generate_unique_name("NET_")
             net = self._edb.cell.net.create(self._active_layout, net_name)
+            self._pedb.layout._notify_change(created=[], deleted=[])
             return net
         else:
             if not start_with and not contain and not end_with:
                 net = self._edb.cell.net.find_by_name(self._active_layout, net_name)
                 if net.is_null:
                     net = self._edb.cell.net.create(self._active_layout, net_name)
+                    self._pedb.layout._notify_change(created=[], deleted=[])
                 return net
             elif start_with:
                 nets_found = [
@@ -24,11 +24,14 @@
 This module contains the `EdbPadstacks` class.
 """
 import math
+import time
 import warnings
 
+import numpy as np
 import rtree
 
 from pyedb.dotnet.clr_module import Array
+from pyedb.dotnet.edb_core.cell.pin_locator import PinLocator
 from pyedb.dotnet.edb_core.edb_data.padstacks_data import (
     EDBPadstack,
     EDBPadstackInstance,
@@ -75,7 +78,10 @@ class EdbPadstacks(object):
     def __init__(self, p_edb):
         self._pedb = p_edb
         self._instances = {}
+        self._instances_version = None
         self._definitions = {}
+        self._pin_locators = {}
+        self._pin_locators_version = None
 
     @property
     def _edb(self):
@@ -220,10 +226,10 @@ class EdbPadstacks(object):
             List of padstack instances.
 
         """
-        edb_padstack_inst_list = self._pedb.layout.padstack_instances
-        if len(self._instances) == len(edb_padstack_inst_list):
-            return self._instances
-        self._instances = {i.id: i for i in edb_padstack_inst_list}
+        layout = self._pedb.layout
+        if self._instances_version != layout.version:
+            self._instances = {i.id: i for i in layout.padstack_instances}
+            self._instances_version = layout.version
         return self._instances
 
     @property
@@ -248,8 +254,15 @@ class EdbPadstacks(object):
         Parameters
         ----------
         value : int
+
+        Returns
+        -------
+        :class:`dotnet.edb_core.edb_data.padstacks_data.EDBPadstackInstance`
+            Padstack instance, ``None`` if no padstack instance has this id.
         """
-        return self._pedb.modeler.find_object_by_id(value)
+        edb_object = self._pedb.layout.id_index.get(value)
+        if edb_object is not None and edb_object.GetObjType().ToString() == "PadstackInstance":
+            return EDBPadstackInstance(edb_object, self._pedb)
 
     @property
     def pins(self):
@@ -458,12 +471,39 @@ class EdbPadstacks(object):
         if not isinstance(net_names, list):  # pragma: no cover
             net_names = [net_names]
 
-        for p_id, p in self.instances.items():
-            if p.net_name in net_names:
-                if not p.delete():  # pragma: no cover
-                    return False
+        self.delete_many([p for p in self.instances.values() if p.net_name in net_names])
         return True
 
+    def delete_many(self, padstack_instances):
+        """Delete several padstack instances at once.
+
+        The instances are deleted with one EDB call each and the layout caches are invalidated once.
+
+        Parameters
+        ----------
+        padstack_instances : list
+            Padstack instances to delete, as IDs or
+            :class:`pyedb.dotnet.edb_core.edb_data.padstacks_data.EDBPadstackInstance`.
+
+        Returns
+        -------
+        dict
+            Number of instances deleted in ``"count"``, IDs not found in ``"not_found"`` and duration in seconds
+            in ``"time"``.
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> vias = [i for i in edbapp.padstacks.instances.values() if i.net_name == "GND" and not i.is_pin]
+        >>> edbapp.padstacks.delete_many(vias)
+        """
+        start = time.time()
+        deleted, not_found = self._pedb.layout._delete_objects(padstack_instances)
+        report = {"count": len(deleted), "not_found": not_found, "time": time.time() - start}
+        self._logger.info("{} padstack instances deleted in {:.2f}s.".format(report["count"], report["time"]))
+        return report
+
     def set_solderball(self, padstackInst, sballLayer_name, isTopPlaced=True, ballDiam=100e-6):
         """Set solderball for the given PadstackInstance.
 
@@ -1208,7 +1248,12 @@ class EdbPadstacks(object):
             )
             padstack_instance.is_layout_pin = is_pin
             py_padstack_instance = EDBPadstackInstance(padstack_instance.api_object, self._pedb)
-
+            layout = self._pedb.layout
+            up_to_date = self._instances_version == layout.version
+            layout._notify_change(created=[padstack_instance.api_object])
+            if up_to_date:
+                self._instances[py_padstack_instance.id] = py_padstack_instance
+                self._instances_version = layout.version
             return py_padstack_instance
         else:
             return False
@@ -1495,7 +1540,8 @@ class EdbPadstacks(object):
         Returns
         -------
         list
-            List of :class:`dotnet.edb_core.edb_data.padstacks_data.EDBPadstackInstance`.
+            List of :class:`dotnet.edb_core.edb_data.padstacks_data.EDBPadstackInstance`, from the nearest
+            to the farthest. Equidistant pins are ordered by ID.
 
         Examples
         --------
@@ -1504,29 +1550,50 @@ class EdbPadstacks(object):
         >>> reference_pins = edbapp.padstacks.get_reference_pins(positive_pin=pin, reference_net="GND",
         >>> search_radius=5e-3, max_limit=0, component_only=True)
         """
-        pinlist = []
         if not positive_pin:
             search_radius = 10e-2
             component_only = True
-        if component_only:
-            references_pins = [
-                pin for pin in list(positive_pin.component.pins.values()) if pin.net_name == reference_net
-            ]
-            if not references_pins:
-                return pinlist
-        else:
-            references_pins = self.get_padstack_instance_by_net_name(reference_net)
-            if not references_pins:
-                return pinlist
-        pinlist = [
-            p
-            for p in references_pins
-            if GeometryOperators.points_distance(positive_pin.position, p.position) <= search_radius
-        ]
-        if max_limit and len(pinlist) > max_limit:
-            pin_dict = {GeometryOperators.points_distance(positive_pin.position, p.position): p for p in pinlist}
-            pinlist = [pin[1] for pin in sorted(pin_dict.items())[:max_limit]]
-        return pinlist
+        component = positive_pin.component.refdes if component_only else None
+        snapshot = self._pedb.layout.snapshot
+        row = snapshot.row(positive_pin.id)
+        position = snapshot.position[row] if row >= 0 else positive_pin.position
+        locator = self.get_pin_locator(reference_net, component)
+        ids, _ = locator.query([position], k=max_limit, radius=self._pedb.value_to_float(search_radius))
+        return [self.instances[i] for i in ids[0].tolist()]
+
+    def get_pin_locator(self, nets, component=None):
+        """Get a nearest neighbor index of the padstack instances of some nets.
+
+        Locators are built from the layout snapshot and kept until the layout changes, so that searching the
+        reference pins of many ports only builds one locator per component and net.
+
+        Parameters
+        ----------
+        nets : str, list
+            Net names of the padstack instances.
+        component : str, optional
+            Name of the component of the padstack instances. The default is ``None``, in which case all the
+            padstack instances of the layout are used.
+
+        Returns
+        -------
+        :class:`pyedb.dotnet.edb_core.cell.pin_locator.PinLocator`
+
+        Examples
+        --------
+        >>> edbapp = Edb("target_path")
+        >>> locator = edbapp.padstacks.get_pin_locator("GND", component="U1")
+        >>> positions = [pin.position for pin in edbapp.components.instances["U1"].pins.values()]
+        >>> ids, distances = locator.query(positions, k=4, radius=2e-3)
+        """
+        layout = self._pedb.layout
+        if self._pin_locators_version != layout.version:
+            self._pin_locators = {}
+            self._pin_locators_version = layout.version
+        key = (tuple([nets] if isinstance(nets, str) else nets), component)
+        if key not in self._pin_locators:
+            self._pin_locators[key] = PinLocator.from_snapshot(layout.snapshot, list(key[0]), component)
+        return self._pin_locators[key]
 
     def get_padstack_instances_rtree_index(self, nets=None):
         """Returns padstack instances Rtree index.
@@ -1544,14 +1611,89 @@ class EdbPadstacks(object):
         """
         if isinstance(nets, str):
             nets = [nets]
-        padstack_instances_index = rtree.index.Index()
-        if nets:
-            instances = [inst for inst in list(self.instances.values()) if inst.net_name in nets]
-        else:
-            instances = list(self.instances.values())
-        for inst in instances:
-            padstack_instances_index.insert(inst.id, inst.position)
-        return padstack_instances_index
+        snapshot = self._pedb.layout.snapshot
+        mask = snapshot.mask(nets=nets or None, types="PadstackInstance")
+        mask &= ~np.isnan(snapshot.position).any(axis=1)
+        ids = snapshot.ids[mask].tolist()
+        if not ids:
+            return rtree.index.Index()
+        positions = snapshot.position[mask].tolist()
+        return rtree.index.Index((i, (x, y, x, y), None) for i, (x, y) in zip(ids, positions))
+
+    def get_instance_arrays(self, nets=None, layers=None):
+        """Get the placement of padstack instances as NumPy arrays.
+
+        Arrays are read from the layout snapshot, which is extracted once per layout change. Pin positions are
+        transformed to layout coordinates with one transform per component instead of one per pin.
+
+        Parameters
+        ----------
+        nets : str or list, optional
+            Net names to keep. The default is ``None``, in which case all nets are kept.
+        layers : str or list, optional
+            Layer names to keep. Padstack instances are kept if their layer range covers one of these layers.
+            The default is ``None``, in which case all layers are kept.
+
+        Returns
+        -------
+        dict
+            Dictionary with these arrays aligned with the padstack instances:
+
+            - ``"id"``: EDB IDs.
+            - ``"x"`` and ``"y"``: Positions in layout coordinates.
+            - ``"rotation"``: Rotations in radians, ``NaN`` if unknown.
+            - ``"start_layer_index"`` and ``"stop_layer_index"``: Indices in ``"layer_names"``, ``-1`` if the
+              layer is not a stackup layer.
+            - ``"definition_id"``: Indices in ``"definition_names"``.
+            - ``"net_id"``: Indices in ``"net_names"``.
+            - ``"component_id"``: Indices in ``"component_names"``, ``-1`` for instances without component.
+
+            It also holds the ``"layer_names"``, ``"definition_names"``, ``"net_names"`` and ``"component_names"``
+            lookup lists, where the layer names are the stackup layers from top to bottom.
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> arrays = edbapp.padstacks.get_instance_arrays(nets="GND")
+        >>> distances = np.hypot(arrays["x"] - 0.01, arrays["y"] - 0.02)
+        """
+        if isinstance(nets, str):
+            nets = [nets]
+        if isinstance(layers, str):
+            layers = [layers]
+        snapshot = self._pedb.layout.snapshot
+        layer_names = list(self._pedb.stackup.layers.keys())
+        stackup_index = {name: i for i, name in enumerate(layer_names)}
+        layer_map = np.array([stackup_index.get(name, -1) for name in snapshot.layer_names] + [-1], dtype=np.int32)
+        mask = snapshot.mask(nets=nets, types="PadstackInstance")
+        start_index = layer_map[snapshot.layer_index[mask]]
+        stop_index = layer_map[snapshot.stop_layer_index[mask]]
+        if layers is not None:
+            keep = np.array([stackup_index[name] for name in layers if name in stackup_index], dtype=np.int32)
+            low = np.minimum(start_index, stop_index)[:, None]
+            high = np.maximum(start_index, stop_index)[:, None]
+            in_range = ((keep >= low) & (keep <= high)).any(axis=1)
+            # Instances on non stackup layers can only match by name.
+            selected = in_range | snapshot.mask(layers=layers)[mask]
+            mask[np.flatnonzero(mask)[~selected]] = False
+            start_index = start_index[selected]
+            stop_index = stop_index[selected]
+        return {
+            "id": snapshot.ids[mask],
+            "x": snapshot.position[mask, 0],
+            "y": snapshot.position[mask, 1],
+            "rotation": snapshot.rotation[mask],
+            "start_layer_index": start_index,
+            "stop_layer_index": stop_index,
+            "definition_id": snapshot.definition_index[mask],
+            "net_id": snapshot.net_index[mask],
+            "component_id": snapshot.component_index[mask],
+            "layer_names": layer_names,
+            "definition_names": list(snapshot.definition_names),
+            "net_names": list(snapshot.net_names),
+            "component_names": list(snapshot.component_names),
+        }
 
     def get_padstack_instances_intersecting_bounding_box(self, bounding_box, nets=None):
         """Returns the list of padstack instances ID intersecting a given bounding box and nets.
@@ -1570,12 +1712,11 @@ class EdbPadstacks(object):
         """
         if not bounding_box:
             raise Exception("No bounding box was provided")
-        index = self.get_padstack_instances_rtree_index(nets=nets)
         if not len(bounding_box) == 4:
             raise Exception("The bounding box length must be equal to 4")
-        if isinstance(bounding_box, list):
-            bounding_box = tuple(bounding_box)
-        return list(index.intersection(bounding_box))
+        if isinstance(nets, str):
+            nets = [nets]
+        return self._pedb.layout.spatial_index.intersection(bounding_box, nets=nets or None, types="PadstackInstance")
 
     def merge_via_along_lines(
         self, net_name="GND", distance_threshold=5e-3, minimum_via_number=6, selected_angles=None
@@ -1654,6 +1795,5 @@ class EdbPadstacks(object):
                     self._logger.error(f"Failed to create padstack definition {new_padstack_def}")
                 if not self.place(position=[0, 0], definition_name=new_padstack_def, net_name=net_name):
                     self._logger.error(f"Failed to place padstack instance {new_padstack_def}")
-            for inst in _instances_to_delete:
-                inst.delete()
+            self.delete_many(_instances_to_delete)
         return True
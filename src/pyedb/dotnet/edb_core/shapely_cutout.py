@@ -0,0 +1,353 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains the ``ShapelyCutout`` class, a cutout backend computing the geometry with shapely.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import math
+
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
+from shapely.geometry.base import BaseGeometry
+
+from pyedb.misc.utilities import compute_arc_points
+
+OUTSIDE = 0
+PARTIAL = 1
+INSIDE = 2
+ARC_TOLERANCE = 1e-7
+
+
+def arc_point_count(p1, p2, height, tolerance):
+    """Number of points discretizing an arc within a tolerance.
+
+    Parameters
+    ----------
+    p1 : list
+        Arc starting point.
+    p2 : list
+        Arc ending point.
+    height : float
+        Arc height.
+    tolerance : float
+        Maximum distance between the arc and its discretization.
+
+    Returns
+    -------
+    int
+        Number of points between the arc ends.
+    """
+    half_chord = math.hypot(p2[0] - p1[0], p2[1] - p1[1]) / 2
+    height = abs(height)
+    if half_chord == 0 or height == 0:
+        return 0
+    radius = half_chord**2 / (2 * height) + height / 2
+    angle = 2 * math.asin(min(1.0, half_chord / radius))
+    if height > half_chord:
+        angle = 2 * math.pi - angle
+    if tolerance >= radius:
+        return 1
+    step = 2 * math.acos(1 - tolerance / radius)
+    return max(1, int(math.ceil(angle / step)) - 1)
+
+
+def polygon_data_points(polygon_data, tolerance=None):
+    """Get the vertices of an EDB polygon, with its arcs discretized.
+
+    Parameters
+    ----------
+    polygon_data : Ansys.Ansoft.Edb.Geometry.PolygonData
+        EDB polygon.
+    tolerance : float, optional
+        Maximum distance between the arcs and their discretization. The default is ``None``, in which case
+        each arc is discretized with six points.
+
+    Returns
+    -------
+    list[tuple[float, float]]
+    """
+    points = list(polygon_data.Points)
+    vertices = []
+    for i, point in enumerate(points):
+        if not point.IsArc():
+            vertices.append((point.X.ToDouble(), point.Y.ToDouble()))
+            continue
+        p1 = [points[i - 1].X.ToDouble(), points[i - 1].Y.ToDouble()]
+        p2 = [points[(i + 1) % len(points)].X.ToDouble(), points[(i + 1) % len(points)].Y.ToDouble()]
+        height = point.GetArcHeight().ToDouble()
+        n = 6 if tolerance is None else arc_point_count(p1, p2, height, tolerance)
+        x_arc, y_arc = compute_arc_points(p1, p2, height, n=n)
+        vertices.extend(zip(x_arc, y_arc))
+    return vertices
+
+
+def polygon_data_to_shapely(polygon_data, tolerance=None):
+    """Convert an EDB polygon and its holes to a shapely polygon.
+
+    Parameters
+    ----------
+    polygon_data : Ansys.Ansoft.Edb.Geometry.PolygonData
+        EDB polygon.
+    tolerance : float, optional
+        Maximum distance between the arcs and their discretization. The default is ``None``, in which case
+        each arc is discretized with six points.
+
+    Returns
+    -------
+    :class:`shapely.Geometry`
+        Valid polygon or multipolygon, empty if the EDB polygon is degenerated.
+    """
+    vertices = polygon_data_points(polygon_data, tolerance)
+    if len(vertices) < 3:
+        return Polygon()
+    holes = [polygon_data_points(hole, tolerance) for hole in list(polygon_data.Holes)]
+    polygon = Polygon(vertices, [hole for hole in holes if len(hole) > 2])
+    if not polygon.is_valid:
+        polygon = shapely.make_valid(polygon)
+    return polygon
+
+
+def classify_padstack_instances(extent, positions, pad_bboxes=None):
+    """Classify padstack instances against an extent in one vectorized call.
+
+    Parameters
+    ----------
+    extent : :class:`shapely.Geometry`
+        Extent, with its holes.
+    positions : :class:`numpy.ndarray`
+        Instance positions with shape ``(n, 2)``.
+    pad_bboxes : :class:`numpy.ndarray`, optional
+        Pad bounding boxes with shape ``(n, 4)``. The default is ``None``, in which case only the positions are
+        checked. Instances with ``NaN`` or empty bounding boxes are classified by their position.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        :data:`INSIDE` for the instances whose position and pad are inside the extent, :data:`PARTIAL` for the
+        ones whose position is inside the extent and whose pad touches or crosses its boundary, and
+        :data:`OUTSIDE` for the others.
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+    inside = shapely.intersects_xy(extent, positions[:, 0], positions[:, 1])
+    flags = np.where(inside, INSIDE, OUTSIDE).astype(np.int8)
+    if pad_bboxes is None:
+        return flags
+    pad_bboxes = np.asarray(pad_bboxes, dtype=np.float64).reshape(-1, 4)
+    with np.errstate(invalid="ignore"):
+        has_area = (pad_bboxes[:, 2] > pad_bboxes[:, 0]) & (pad_bboxes[:, 3] > pad_bboxes[:, 1])
+    check = inside & has_area
+    shapely.prepare(extent)
+    boxes = shapely.box(*pad_bboxes[check].T)
+    flags[check] = np.where(shapely.contains_properly(extent, boxes), INSIDE, PARTIAL)
+    return flags
+
+
+def shapely_to_point_lists(geometry):
+    """Split a shapely geometry into the point lists of its polygons.
+
+    Parameters
+    ----------
+    geometry : :class:`shapely.Geometry`
+
+    Returns
+    -------
+    list[tuple[list, list]]
+        Outline points and hole point lists of each polygon with a non-zero area, ready for
+        :func:`pyedb.dotnet.edb_core.modeler.Modeler.create_polygon`.
+    """
+    polygons = []
+    for part in shapely.get_parts(geometry):
+        if part.geom_type == "Polygon" and part.area > 0:
+            outline = [list(point) for point in part.exterior.coords[:-1]]
+            holes = [[list(point) for point in hole.coords[:-1]] for hole in part.interiors]
+            polygons.append((outline, holes))
+        elif part.geom_type in ("MultiPolygon", "GeometryCollection"):
+            polygons.extend(shapely_to_point_lists(part))
+    return polygons
+
+
+class ShapelyCutout(object):
+    """Cutout backend classifying and clipping the layout objects with shapely.
+
+    Objects are first classified with their bounding box from the layout snapshot, with vectorized
+    predicates over an STRtree. Only the objects whose bounding box crosses the extent boundary are read
+    from EDB and compared exactly. Partial polygons are clipped in Python on several threads, shapely
+    releasing the GIL, and only the objects to create and delete are written back to EDB.
+
+    Parameters
+    ----------
+    pedb : :class:`pyedb.dotnet.edb.Edb`
+        EDB object.
+    extent : Ansys.Ansoft.Edb.Geometry.PolygonData or :class:`shapely.Geometry`
+        Cutout extent.
+    number_of_threads : int, optional
+        Number of threads clipping the polygons. The default is ``4``.
+    tolerance : float, optional
+        Maximum distance between the arcs of the extent and of the clipped primitives and their discretization.
+        The default is :data:`ARC_TOLERANCE`, ``1e-7`` meters.
+
+    Examples
+    --------
+    >>> from pyedb import Edb
+    >>> edbapp = Edb("myaedbfolder")
+    >>> edbapp.cutout(["DDR4_DQ0"], ["GND"], cutout_backend="shapely")
+    """
+
+    def __init__(self, pedb, extent, number_of_threads=4, tolerance=ARC_TOLERANCE):
+        self._pedb = pedb
+        self.tolerance = tolerance
+        self.extent = extent if isinstance(extent, BaseGeometry) else polygon_data_to_shapely(extent, tolerance)
+        shapely.prepare(self.extent)
+        self.number_of_threads = max(1, int(number_of_threads or 1))
+
+    def _map(self, function, geometries):
+        """Apply a vectorized shapely function on chunks of geometries in parallel."""
+        if self.number_of_threads == 1 or len(geometries) < 2 * self.number_of_threads:
+            return function(geometries)
+        chunks = np.array_split(geometries, self.number_of_threads)
+        with ThreadPoolExecutor(self.number_of_threads) as pool:
+            return np.concatenate(list(pool.map(function, chunks)))
+
+    def classify_bounding_boxes(self, bboxes):
+        """Classify bounding boxes against the extent.
+
+        Parameters
+        ----------
+        bboxes : :class:`numpy.ndarray`
+            Bounding boxes with shape ``(n, 4)``. Rows with ``NaN`` values are always inside.
+
+        Returns
+        -------
+        tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`]
+            Boolean masks of the boxes inside the extent, outside of it and crossing its boundary.
+        """
+        bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        no_box = np.isnan(bboxes).any(axis=1)
+        boxes = shapely.box(*np.where(no_box[:, None], 0.0, bboxes).T)
+        tree = shapely.STRtree(boxes)
+        hits = tree.query(self.extent, predicate="intersects")
+        intersects = np.zeros(len(bboxes), dtype=bool)
+        intersects[hits] = True
+        inside = np.zeros(len(bboxes), dtype=bool)
+        inside[hits] = self._map(lambda chunk: shapely.within(chunk, self.extent), boxes[hits])
+        crossing = intersects & ~inside & ~no_box
+        return inside | no_box, ~intersects & ~no_box, crossing
+
+    def _snapshot_rows(self, objects):
+        snapshot = self._pedb.layout.snapshot
+        return snapshot, np.array([snapshot.row(obj.id) for obj in objects], dtype=np.int64)
+
+    def _bounding_boxes(self, objects):
+        snapshot, rows = self._snapshot_rows(objects)
+        bboxes = np.full((len(objects), 4), np.nan)
+        bboxes[rows >= 0] = snapshot.bbox[rows[rows >= 0]]
+        return bboxes
+
+    def padstack_instances_to_delete(self, padstack_instances, include_partial=False, simple_check=True):
+        """Get the padstack instances outside of the extent.
+
+        Parameters
+        ----------
+        padstack_instances : list
+            List of :class:`pyedb.dotnet.edb_core.edb_data.padstacks_data.EDBPadstackInstance`.
+        include_partial : bool, optional
+            Whether to keep the instances whose pad crosses the extent boundary. The default is ``False``.
+        simple_check : bool, optional
+            Whether to only check the instance position. The default is ``True``, otherwise the pad bounding
+            boxes from :attr:`pyedb.dotnet.edb_core.cell.layout_snapshot.LayoutSnapshot.pad_bbox` are checked too.
+
+        Returns
+        -------
+        list
+        """
+        if not padstack_instances:
+            return []
+        snapshot, rows = self._snapshot_rows(padstack_instances)
+        found = rows >= 0
+        positions = np.full((len(padstack_instances), 2), np.nan)
+        positions[found] = snapshot.position[rows[found]]
+        for i in np.flatnonzero(np.isnan(positions).any(axis=1)):
+            positions[i] = padstack_instances[i].position
+        pad_bboxes = None
+        if not simple_check:
+            pad_bboxes = np.full((len(padstack_instances), 4), np.nan)
+            pad_bboxes[found] = snapshot.pad_bbox[rows[found]]
+        flags = classify_padstack_instances(self.extent, positions, pad_bboxes)
+        keep = flags == INSIDE
+        if include_partial:
+            keep |= flags == PARTIAL
+        return [inst for inst, kept in zip(padstack_instances, keep) if not kept]
+
+    def plan_primitives(self, primitives, paths=None):
+        """Plan the deletion and the clipping of primitives.
+
+        Parameters
+        ----------
+        primitives : list
+            Primitives to clip as polygons.
+        paths : list, optional
+            Paths to clip with EDB, which keeps them as paths. The default is ``None``.
+
+        Returns
+        -------
+        tuple[list, list, list, list]
+            Primitives to delete, primitives to replace by their clipped polygons, polygons to create as
+            ``(outline, holes, layer name, net name)`` tuples and paths crossing the extent boundary.
+        """
+        to_delete = []
+        paths_to_clip = []
+        if paths:
+            _, outside, crossing = self.classify_bounding_boxes(self._bounding_boxes(paths))
+            to_delete.extend(path for path, out in zip(paths, outside) if out)
+            paths_to_clip.extend(path for path, cross in zip(paths, crossing) if cross)
+        if not primitives:
+            return to_delete, [], [], paths_to_clip
+        _, outside, crossing = self.classify_bounding_boxes(self._bounding_boxes(primitives))
+        to_delete.extend(prim for prim, out in zip(primitives, outside) if out)
+        crossing_primitives = [prim for prim, cross in zip(primitives, crossing) if cross]
+        geometries = []
+        for prim in crossing_primitives:
+            geometry = polygon_data_to_shapely(prim._edb_object.GetPolygonData(), self.tolerance)
+            voids = [
+                polygon_data_to_shapely(void.GetPolygonData(), self.tolerance) for void in list(prim._edb_object.Voids)
+            ]
+            if voids:
+                geometry = shapely.difference(geometry, shapely.union_all(voids))
+            geometries.append(geometry)
+        geometries = np.array(geometries, dtype=object)
+        if not len(geometries):
+            return to_delete, [], [], paths_to_clip
+        inside = self._map(lambda chunk: shapely.within(chunk, self.extent), geometries)
+        disjoint = self._map(lambda chunk: shapely.disjoint(chunk, self.extent), geometries)
+        partial = ~inside & ~disjoint
+        clipped = self._map(lambda chunk: shapely.intersection(chunk, self.extent), geometries[partial])
+        to_clip = [prim for prim, cut in zip(crossing_primitives, partial) if cut]
+        to_create = []
+        for prim, geometry in zip(to_clip, clipped):
+            layer_name = prim.layer_name
+            net_name = prim.net_name
+            for outline, holes in shapely_to_point_lists(geometry):
+                to_create.append((outline, holes, layer_name, net_name))
+        to_delete.extend(prim for prim, out in zip(crossing_primitives, disjoint) if out)
+        return to_delete, to_clip, to_create, paths_to_clip
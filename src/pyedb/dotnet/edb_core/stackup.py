@@ -66,6 +66,9 @@ logger = logging.getLogger(__name__)
 class LayerCollection(object):
     def __init__(self, pedb, edb_object=None):
         self._pedb = pedb
+        self._layers_cache = None
+        self._layers_cache_version = None
+        self._layer_table = None
 
         if edb_object:
             self._edb_object = self._pedb.edb_api.cell._cell.LayerCollection(edb_object)
@@ -277,17 +280,84 @@ class LayerCollection(object):
     @property
     def non_stackup_layers(self):
         """Retrieve the dictionary of signal layers."""
-        return {name: obj for name, obj in self.all_layers.items() if not obj.is_stackup_layer}
+        return OrderedDict(self._update_layers_cache()["non_stackup"])
 
-    @property
-    def all_layers(self):
+    def _update_layers_cache(self):
+        """Read and group the layout layers.
+
+        Layers are read once and kept until the layer collection of the layout is set again, which happens in
+        ``add_layer*``, ``remove_layer``, ``_set_layout_stackup`` and ``load``.
+
+        Returns
+        -------
+        dict
+            Dictionaries of layers by name for the ``"all"``, ``"stackup"``, ``"non_stackup"``, ``"signal"``
+            and ``"dielectric"`` groups.
+        """
+        version = self._pedb.layout._layer_collection_version
+        if self._layers_cache is not None and self._layers_cache_version == version:
+            return self._layers_cache
         self.refresh_layer_collection()
-        layer_list = list(self._edb_object.Layers(self._pedb.edb_api.cell.layer_type_set.AllLayerSet))
-        temp = dict()
-        for i in layer_list:
+        layer_type = self._pedb.edb_api.cell.layer_type
+        cache = {
+            "all": OrderedDict(),
+            "stackup": OrderedDict(),
+            "non_stackup": OrderedDict(),
+            "signal": OrderedDict(),
+            "dielectric": OrderedDict(),
+        }
+        for i in list(self._edb_object.Layers(self._pedb.edb_api.cell.layer_type_set.AllLayerSet)):
             obj = layer_cast(self._pedb, i)
-            temp[obj.name] = obj
-        return temp
+            cache["all"][obj.name] = obj
+            if not i.IsStackupLayer():
+                cache["non_stackup"][obj.name] = obj
+                continue
+            cache["stackup"][obj.name] = obj
+            if i.GetLayerType() == layer_type.SignalLayer:
+                cache["signal"][obj.name] = obj
+            elif i.GetLayerType() == layer_type.DielectricLayer:
+                cache["dielectric"][obj.name] = obj
+        self._layers_cache = cache
+        self._layers_cache_version = version
+        self._layer_table = None
+        return cache
+
+    @property
+    def all_layers(self):
+        return OrderedDict(self._update_layers_cache()["all"])
+
+    @property
+    def layer_table(self):
+        """Ordered table of the layers with their main properties.
+
+        Returns
+        -------
+        OrderedDict
+            Dictionary of layer names with dictionaries of ``"type"``, ``"is_stackup_layer"``,
+            ``"lower_elevation"``, ``"upper_elevation"``, ``"thickness"`` and ``"material"`` values.
+            Elevations, thickness and material are ``None`` for non stackup layers.
+
+        Examples
+        --------
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> edbapp.stackup.layer_table["1_Top"]["thickness"]
+        """
+        cache = self._update_layers_cache()
+        if self._layer_table is None:
+            table = OrderedDict()
+            for name, obj in cache["all"].items():
+                row = {"type": obj.type, "is_stackup_layer": name in cache["stackup"]}
+                if row["is_stackup_layer"]:
+                    row["lower_elevation"] = obj.lower_elevation
+                    row["upper_elevation"] = obj.upper_elevation
+                    row["thickness"] = obj.thickness
+                    row["material"] = obj.material
+                else:
+                    row.update({"lower_elevation": None, "upper_elevation": None, "thickness": None, "material": None})
+                table[name] = row
+            self._layer_table = table
+        return OrderedDict((name, dict(row)) for name, row in self._layer_table.items())
 
     @property
     def layers_by_id(self):
@@ -302,7 +372,7 @@ class LayerCollection(object):
         -------
         Dict[str, :class:`pyedb.dotnet.edb_core.edb_data.layer_data.LayerEdbClass`]
         """
-        return {name: obj for name, obj in self.all_layers.items() if obj.is_stackup_layer}
+        return OrderedDict(self._update_layers_cache()["stackup"])
 
     def find_layer_by_name(self, name: str):
         """Finds a layer with the given name."""
@@ -638,12 +708,7 @@ class Stackup(LayerCollection):
         -------
         Dict[str, :class:`pyedb.dotnet.edb_core.edb_data.layer_data.LayerEdbClass`]
         """
-        layer_type = self._pedb.edb_api.cell.layer_type.SignalLayer
-        _lays = OrderedDict()
-        for name, obj in self.layers.items():
-            if obj._edb_layer.GetLayerType() == layer_type:
-                _lays[name] = obj
-        return _lays
+        return OrderedDict(self._update_layers_cache()["signal"])
 
     @property
     def dielectric_layers(self):
@@ -654,12 +719,7 @@ class Stackup(LayerCollection):
         dict[str, :class:`dotnet.edb_core.edb_data.layer_data.EDBLayer`]
             Dictionary of dielectric layers.
         """
-        layer_type = self._pedb.edb_api.cell.layer_type.DielectricLayer
-        _lays = OrderedDict()
-        for name, obj in self.layers.items():
-            if obj._edb_layer.GetLayerType() == layer_type:
-                _lays[name] = obj
-        return _lays
+        return OrderedDict(self._update_layers_cache()["dielectric"])
 
     def _edb_value(self, value):
         return self._pedb.edb_value(value)
@@ -1803,19 +1863,12 @@ class Stackup(LayerCollection):
         >>> edb = Edb(edbpath=targetfile1,  edbversion="2021.2")
         >>> edb.stackup.residual_copper_area_per_layer()
         """
-        temp_data = {name: 0 for name, _ in self.signal_layers.items()}
-        outline_area = 0
-        for i in self._pedb.modeler.primitives:
-            layer_name = i._edb_object.GetLayer().GetName()
-            if layer_name.lower() == "outline":
-                if i.area() > outline_area:
-                    outline_area = i.area()
-            elif layer_name not in temp_data:
-                continue
-            elif not i.is_void:
-                temp_data[layer_name] = temp_data[layer_name] + i.area()
-            else:
-                pass
+        snapshot = self._pedb.layout.snapshot
+        outline_layers = [name for name in snapshot.layer_names if name.lower() == "outline"]
+        outline_mask = snapshot.is_primitive & snapshot.mask(layers=outline_layers)
+        outline_area = float(snapshot.area[outline_mask].max()) if outline_mask.any() else 0
+        copper_area = snapshot.area_by_layer(snapshot.is_primitive & ~snapshot.is_void)
+        temp_data = {name: copper_area.get(name, 0) for name in self.signal_layers}
         temp_data = {name: area / outline_area * 100 for name, area in temp_data.items()}
         return temp_data
 
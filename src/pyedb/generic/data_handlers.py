@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from decimal import Decimal
+from functools import lru_cache
 import json
 import math
 import random
@@ -8,6 +9,31 @@ import string
 
 from pyedb.generic.general_methods import settings
 
+RKM_MAPS = {
+    # Resistors
+    "L": "m",
+    "R": "",
+    "E": "",
+    "k": "k",
+    "K": "k",
+    "M": "M",
+    "G": "G",
+    "T": "T",
+    # Capacitors and inductors
+    "f": "f",
+    "F": "f",
+    "u": "u",
+    "U": "u",
+    "n": "n",
+    "N": "n",
+    "p": "p",
+    "P": "p",
+}
+# Matches RKM codes that start with a digit.
+RKM_FD_REGEX = re.compile(r"([0-9]+)([{}])([0-9]*)$".format("".join(RKM_MAPS.keys())))
+# Matches RKM codes that end with a digit.
+RKM_LD_REGEX = re.compile(r"([0-9]*)([{}])([0-9]+)$".format("".join(RKM_MAPS.keys())))
+
 
 def format_decimals(el):  # pragma: no cover
     """
@@ -128,6 +154,7 @@ def ensure_list(element_list):  # pragma: no cover
     return element_list
 
 
+@lru_cache(maxsize=1024)
 def from_rkm(code):  # pragma: no cover
     """Convert an RKM code string to a string with a decimal point.
 
@@ -169,26 +196,14 @@ def from_rkm(code):  # pragma: no cover
 
     """
 
-    # Matches RKM codes that start with a digit.
-    # fd_pattern = r'([0-9]+)([LREkKMGTFmuµUnNpP]+)([0-9]*)'
-    fd_pattern = r"([0-9]+)([{}]+)([0-9]*)".format(
-        "".join(RKM_MAPS.keys()),
-    )
-    # matches rkm codes that end with a digit
-    # ld_pattern = r'([0-9]*)([LREkKMGTFmuµUnNpP]+)([0-9]+)'
-    ld_pattern = r"([0-9]*)([{}]+)([0-9]+)".format("".join(RKM_MAPS.keys()))
-
-    fd_regex = re.compile(fd_pattern, re.I)
-    ld_regex = re.compile(ld_pattern, re.I)
-
-    for regex in [fd_regex, ld_regex]:
+    for regex in [RKM_FD_REGEX, RKM_LD_REGEX]:
         m = regex.match(code)
         if m:
             fd, base, ld = m.groups()
             ps = RKM_MAPS[base]
 
             if ld:
-                return_str = "".join([fd, ".", ld, ps])
+                return_str = "".join([fd or "0", ".", ld, ps])
             else:
                 return_str = "".join([fd, ps])
             return return_str
@@ -0,0 +1,113 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+This module contains a pure Python parser of EDB value strings.
+
+Plain numbers and numbers followed by a unit, such as ``"0.1mm"``, ``"3.3V"`` or ``"10nH"``, are converted
+to SI floats without going through ``Edb.Utility.Value``. Expressions and variables cannot be parsed and
+must still be evaluated by EDB.
+"""
+from functools import lru_cache
+import re
+
+SI_PREFIXES = {
+    "f": 1e-15,
+    "p": 1e-12,
+    "n": 1e-9,
+    "u": 1e-6,
+    "m": 1e-3,
+    "": 1.0,
+    "k": 1e3,
+    "M": 1e6,
+    "G": 1e9,
+    "T": 1e12,
+}
+SI_BASE_UNITS = ("m", "s", "Hz", "H", "F", "V", "A", "W", "ohm", "Ohm", "S")
+
+
+def _build_unit_scales():
+    scales = {"": 1.0}
+    for unit in SI_BASE_UNITS:
+        for prefix, scale in SI_PREFIXES.items():
+            scales[prefix + unit] = scale
+    # A bare ``m`` is ambiguous between meter and milli and is left to EDB.
+    del scales["m"]
+    scales.update({"megohm": 1e6, "MegOhm": 1e6, "mil": 2.54e-5, "in": 2.54e-2})
+    return scales
+
+
+UNIT_SCALES = _build_unit_scales()
+VALUE_PATTERN = re.compile(r"^\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*([A-Za-z]*)\s*$")
+
+
+@lru_cache(maxsize=4096)
+def parse_value_string(value):
+    """Convert an EDB value string to an SI float.
+
+    Parameters
+    ----------
+    value : str
+        Value string, for example ``"0.1mm"``.
+
+    Returns
+    -------
+    float or None
+        Value in SI units, or ``None`` if the string is an expression, a variable or has an unknown unit.
+
+    Examples
+    --------
+    >>> parse_value_string("0.1mm")
+    0.0001
+    >>> parse_value_string("$width") is None
+    True
+    """
+    match = VALUE_PATTERN.match(value)
+    if not match:
+        return None
+    number, unit = match.groups()
+    scale = UNIT_SCALES.get(unit)
+    if scale is None:
+        return None
+    return float(number) * scale
+
+
+def parse_value(value):
+    """Convert a number or an EDB value string to an SI float.
+
+    Parameters
+    ----------
+    value : str, float, int
+        Value to convert.
+
+    Returns
+    -------
+    float or None
+        Value in SI units, or ``None`` if the value must be evaluated by EDB.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return parse_value_string(value)
+    return None
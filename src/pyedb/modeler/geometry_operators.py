@@ -1260,6 +1260,48 @@ class GeometryOperators(object):
 
         return [xc, yc, zc]
 
+    @staticmethod
+    def get_polygons_centroid(polygons):
+        """Evaluate the centroids of several polygons defined by their points.
+
+        This is the batch version of :func:`get_polygon_centroid`. Polygons with the same number of points
+        are evaluated together with NumPy.
+
+        Parameters
+        ----------
+        polygons : List, numpy.ndarray
+            List of polygons, with each polygon defined by a list of ``[x,y,z]`` points, or array with shape
+            ``(k, n, 3)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with shape ``(k, 3)`` of ``[x,y,z]`` coordinates for the centroids of the polygons.
+
+        """
+        polygons = [np.asarray(pts, dtype=float).reshape(-1, 3) for pts in polygons]
+        centroids = np.empty((len(polygons), 3))
+        groups = defaultdict(list)
+        for i, pts in enumerate(polygons):
+            if len(pts) == 0:
+                raise ValueError("pts must contain at list one point")
+            groups[len(pts)].append(i)
+        for indexes in groups.values():
+            pts1 = np.stack([polygons[i] for i in indexes])
+            pts0 = np.roll(pts1, 1, axis=1)
+            x0, y0, z0 = pts0[..., 0], pts0[..., 1], pts0[..., 2]
+            x1, y1, z1 = pts1[..., 0], pts1[..., 1], pts1[..., 2]
+            L = ((x1 - x0) ** 2 + (y1 - y0) ** 2) ** 0.5
+            L2 = ((z1 - z0) ** 2 + (x1 - x0) ** 2) ** 0.5
+            sl = L.sum(axis=1)
+            sl2 = L2.sum(axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                xc = np.where(sl != 0.0, ((x0 + x1) / 2 * L).sum(axis=1) / sl, x1[:, -1])
+                yc = np.where(sl != 0.0, ((y0 + y1) / 2 * L).sum(axis=1) / sl, y1[:, -1])
+                zc = np.where(sl2 != 0.0, ((z0 + z1) / 2 * L2).sum(axis=1) / sl2, z1[:, -1])
+            centroids[indexes] = np.column_stack([xc, yc, zc])
+        return centroids
+
     @staticmethod
     def cs_xy_pointing_expression(yaw, pitch, roll):  # pragma: no cover
         """Return x_pointing and y_pointing vectors as expressions from
@@ -1566,6 +1608,84 @@ class GeometryOperators(object):
         else:
             return True
 
+    @staticmethod
+    def _batch_slices(count, width, size=1 << 20):
+        """Split ``count`` rows in slices of at most ``size`` elements when each row has ``width`` elements."""
+        step = max(1, size // max(1, width))
+        return [slice(start, start + step) for start in range(0, count, step)]
+
+    @staticmethod
+    def points_in_polygon(points, polygon, tolerance=1e-8):
+        """Determine if points are inside, outside the polygon or exactly at the border.
+
+        This is the batch version of :func:`point_in_polygon`, evaluating all points against all polygon sides
+        with NumPy.
+
+        points : List, numpy.ndarray
+            List of ``[x, y]`` coordinates, or array with shape ``(n, 2)``.
+        polygon : List
+            [[x1, x2, ..., xn],[y1, y2, ..., yn]]
+        tolerance : float
+            tolerance used for the algorithm. Default value is 1e-8.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with shape ``(n,)`` with, for each point:
+
+            - ``-1`` When the point is outside the polygon.
+            - ``0`` When the point is exactly on one of the sides of the polygon.
+            - ``1`` When the point is inside the polygon.
+        """
+        tol = tolerance
+        points = np.asarray(points, dtype=float)
+        if points.shape[-1] != 2:  # pragma: no cover
+            raise ValueError("Points must be a list in the form [[x1, y1], [x2, y2], ...].")
+        points = points.reshape(-1, 2)
+        x = np.asarray(polygon[0], dtype=float)
+        y = np.asarray(polygon[1], dtype=float)
+        if len(x) != len(y):  # pragma: no cover
+            raise ValueError("Polygon x and y lists must be the same length")
+        xj = np.roll(x, 1)
+        yj = np.roll(y, 1)
+        result = np.empty(len(points), dtype=int)
+        for rows in GeometryOperators._batch_slices(len(points), len(x)):
+            px = points[rows, 0:1]
+            py = points[rows, 1:2]
+            vpix = x - px
+            vpiy = y - py
+            vpjx = xj - px
+            vpjy = yj - py
+            on_vertex = np.sqrt(vpix**2 + vpiy**2) < tol
+            a = np.arctan2(vpjx * vpiy - vpjy * vpix, vpjx * vpix + vpjy * vpiy)
+            on_side = np.abs(np.abs(a) - math.pi) < tol
+            asum = np.abs(a.sum(axis=1))
+            flags = np.where(asum < tol, -1, np.where(np.abs(asum - 2 * math.pi) < tol, 1, 2))
+            flags[(on_vertex | on_side).any(axis=1)] = 0
+            if (flags == 2).any():  # pragma: no cover
+                raise Exception("Unexpected error!")
+            result[rows] = flags
+        return result
+
+    @staticmethod
+    def are_points_in_polygon(points, polygon):
+        """Determine if points are inside or outside a polygon, both located on the same plane.
+
+        This is the batch version of :func:`is_point_in_polygon`.
+
+        points : List, numpy.ndarray
+            List of ``[x, y]`` coordinates, or array with shape ``(n, 2)``.
+        polygon : List
+            [[x1, x2, ..., xn],[y1, y2, ..., yn]]
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array with shape ``(n,)``, ``True`` for the points inside the polygon or exactly on one of its
+            sides.
+        """
+        return GeometryOperators.points_in_polygon(points, polygon) != -1
+
     @staticmethod
     def are_segments_intersecting(a1, a2, b1, b2, include_collinear=True):
         """
@@ -1654,6 +1774,57 @@ class GeometryOperators(object):
         return False
         # fmt: on
 
+    @staticmethod
+    def are_segment_pairs_intersecting(a1, a2, b1, b2, include_collinear=True):
+        """
+        Determine if the segments a and b are intersecting, pair by pair.
+
+        This is the batch version of :func:`are_segments_intersecting`. The arrays are broadcast against each
+        other, so that ``a1[:, None]`` and ``a2[:, None]`` check each segment a against all segments b.
+
+        a1 : List, numpy.ndarray
+            First points of segments a. Array of ``[x, y]`` coordinates with shape ``(..., 2)``.
+        a2 : List, numpy.ndarray
+            Second points of segments a. Array of ``[x, y]`` coordinates with shape ``(..., 2)``.
+        b1 : List, numpy.ndarray
+            First points of segments b. Array of ``[x, y]`` coordinates with shape ``(..., 2)``.
+        b2 : List, numpy.ndarray
+            Second points of segments b. Array of ``[x, y]`` coordinates with shape ``(..., 2)``.
+        include_collinear : bool
+            If ``True`` two segments are considered intersecting also if just one end lies on the other segment.
+            Default is ``True``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array with the broadcast shape of the inputs without their last axis, ``True`` for the
+            intersecting segments.
+        """
+        # fmt: off
+        a1, a2, b1, b2 = (np.asarray(v, dtype=float) for v in (a1, a2, b1, b2))
+
+        def on_segment(p, q, r):
+            # Given three collinear points p, q, r, check if point q lies on line-segment 'pr'
+            return ((q[..., 0] <= np.maximum(p[..., 0], r[..., 0])) & (q[..., 0] >= np.minimum(p[..., 0], r[..., 0])) &
+                    (q[..., 1] <= np.maximum(p[..., 1], r[..., 1])) & (q[..., 1] >= np.minimum(p[..., 1], r[..., 1])))
+
+        def orientation(p, q, r):
+            # 0 : Collinear points, 1 : Clockwise points, -1 : Counterclockwise
+            return np.sign((q[..., 1]-p[..., 1]) * (r[..., 0]-q[..., 0]) -
+                           (q[..., 0]-p[..., 0]) * (r[..., 1]-q[..., 1]))
+
+        o1 = orientation(a1, a2, b1)
+        o2 = orientation(a1, a2, b2)
+        o3 = orientation(b1, b2, a1)
+        o4 = orientation(b1, b2, a2)
+        general = (o1 != o2) & (o3 != o4)
+        collinear = (((o1 == 0) & on_segment(a1, b1, a2)) | ((o2 == 0) & on_segment(a1, b2, a2)) |
+                     ((o3 == 0) & on_segment(b1, a1, b2)) | ((o4 == 0) & on_segment(b1, a2, b2)))
+        if include_collinear:
+            return general | collinear
+        return general & ~collinear
+        # fmt: on
+
     @staticmethod
     def is_segment_intersecting_polygon(a, b, polygon):
         """
@@ -1688,6 +1859,46 @@ class GeometryOperators(object):
                 return True
         return False
 
+    @staticmethod
+    def are_segments_intersecting_polygon(a, b, polygon):
+        """
+        Determine if segments defined by two points ``a`` and ``b`` intersect a polygon.
+        Points on the vertices and on the polygon boundaries are not considered intersecting.
+
+        This is the batch version of :func:`is_segment_intersecting_polygon`.
+
+        a : List, numpy.ndarray
+            First points of the segments. Array of ``[x, y]`` coordinates with shape ``(n, 2)``.
+        b : List, numpy.ndarray
+            Second points of the segments. Array of ``[x, y]`` coordinates with shape ``(n, 2)``.
+        polygon : List
+            [[x1, x2, ..., xn],[y1, y2, ..., yn]]
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array with shape ``(n,)``, ``True`` for the segments intersecting the polygon.
+        """
+        a = np.asarray(a, dtype=float).reshape(-1, 2)
+        b = np.asarray(b, dtype=float).reshape(-1, 2)
+        if len(a) != len(b):  # pragma: no cover
+            raise ValueError("a and b must have the same number of points")
+        if len(polygon[0]) != len(polygon[1]):  # pragma: no cover
+            raise ValueError("Polygon x and y lists must be the same length")
+        vi = np.column_stack([polygon[0], polygon[1]]).astype(float)
+        vj = np.roll(vi, 1, axis=0)
+        # one point is inside and one is outside, no need for further investigation.
+        result = GeometryOperators.are_points_in_polygon(a, polygon) != GeometryOperators.are_points_in_polygon(
+            b, polygon
+        )
+        rest = np.flatnonzero(~result)
+        for rows in GeometryOperators._batch_slices(len(rest), len(vi)):
+            rows = rest[rows]
+            result[rows] = GeometryOperators.are_segment_pairs_intersecting(
+                a[rows, None], b[rows, None], vi, vj, include_collinear=False
+            ).any(axis=1)
+        return result
+
     @staticmethod
     def is_perpendicular(a, b, tol=1e-6):
         """Check if two vectors are perpendicular.
@@ -1764,6 +1975,38 @@ class GeometryOperators(object):
         return d
         # fmt: on
 
+    @staticmethod
+    def points_segments_distance(p, a, b):
+        """Calculate the distances between points ``p`` and segments defined by two points ``a`` and ``b``.
+
+        This is the batch version of :func:`point_segment_distance`, evaluating all points against all segments.
+
+        Parameters
+        ----------
+        p : List, numpy.ndarray
+            Array of ``[x, y]`` or ``[x, y, z]`` coordinates for the reference points, with shape ``(n, 2)``
+            or ``(n, 3)``.
+        a : List, numpy.ndarray
+            Array of coordinates for the first points of the segments, with shape ``(m, 2)`` or ``(m, 3)``.
+        b : List, numpy.ndarray
+            Array of coordinates for the second points of the segments, with shape ``(m, 2)`` or ``(m, 3)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with shape ``(n, m)`` of distances between the points and the segments. Distances to
+            segments of zero length are ``inf`` or ``nan``.
+        """
+        # fmt: off
+        p = np.atleast_2d(np.asarray(p, dtype=float))[:, None, :]
+        a = np.atleast_2d(np.asarray(a, dtype=float))
+        b = np.atleast_2d(np.asarray(b, dtype=float))
+        den = np.sqrt((b[:, 0] - a[:, 0])**2 + (b[:, 1] - a[:, 1])**2)
+        num = (b[:, 0] - a[:, 0])*(a[:, 1] - p[..., 1]) - (a[:, 0] - p[..., 0])*(b[:, 1] - a[:, 1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.abs(num)/den
+        # fmt: on
+
     @staticmethod
     def find_largest_rectangle_inside_polygon(polygon, partition_max_order=16):
         """Find the largest area rectangles of arbitrary orientation in a polygon.
@@ -1806,32 +2049,26 @@ class GeometryOperators(object):
             s = int(math.ceil(float(max(y)-ymin)/L))
 
             # get the lattice points S inside the polygon
-            Spoints = []
-            for i in range(r + 1):
-                xi = xmin + L * i
-                for j in range(s + 1):
-                    yj = ymin + L * j
-                    if GeometryOperators.is_point_in_polygon([xi, yj], [x, y]):
-                        Spoints.append([xi, yj])
+            xi = xmin + L * np.arange(r + 1)
+            yj = ymin + L * np.arange(s + 1)
+            lattice = np.stack(np.meshgrid(xi, yj, indexing="ij"), axis=-1).reshape(-1, 2)
+            Spoints = lattice[GeometryOperators.are_points_in_polygon(lattice, [x, y])].tolist()
             return Spoints
 
         def build_u_matrix(S, polygon):
             N = len(S)
             # preallocate the matrix
-            Umatrix = [[None for j in range(N)] for i in range(N)]
-            for i in range(N):
-                for j in range(N):
-                    if i >= j:
-                        Umatrix[i][j] = 0
-                    else:
-                        if GeometryOperators.is_segment_intersecting_polygon(S[i], S[j], polygon):
-                            Umatrix[i][j] = 0
-                        else:
-                            p = GeometryOperators.get_mid_point(S[i], S[j])
-                            if not GeometryOperators.is_point_in_polygon(p, polygon):
-                                Umatrix[i][j] = 0
-                            else:
-                                Umatrix[i][j] = GeometryOperators.v_points(S[i], S[j])
+            Umatrix = [[0 for j in range(N)] for i in range(N)]
+            if N < 2:
+                return Umatrix
+            # pairs i < j whose segment does not intersect the polygon and whose midpoint is inside
+            i, j = np.triu_indices(N, k=1)
+            points = np.array(S)
+            valid = ~GeometryOperators.are_segments_intersecting_polygon(points[i], points[j], polygon)
+            mid_points = (points[i[valid]] + points[j[valid]]) / 2.0
+            valid[valid] = GeometryOperators.are_points_in_polygon(mid_points, polygon)
+            for k, m in zip(i[valid].tolist(), j[valid].tolist()):
+                Umatrix[k][m] = GeometryOperators.v_points(S[k], S[m])
             return Umatrix
 
         def inside(i, j):
@@ -2085,36 +2322,18 @@ class GeometryOperators(object):
 
         angles = []
         # Evaluate the angle with x-axis for every possible line defined by 2 points
-        # Nested for loops to iterate over each point
+        # One vectorized row per point, against all the following points
         for i in range(num_points - 1):
-            angles.append([])
-            for j in range(i + 1, num_points):
-                p1 = points[i]
-                p2 = points[j]
-                x1 = p1[0]
-                y1 = p1[1]
-                x2 = p2[0]
-                y2 = p2[1]
-
-                dx = x2 - x1
-                dy = y2 - y1
-
-                # Calculate the angle in radians with the x-axis
-                angle_rad = np.arctan2(dy, dx)
-                if abs(angle_rad - np.pi) < tol_rad:
-                    angles[i].append(0.0)
-                elif angle_rad < 0:
-                    angles[i].append(angle_rad + np.pi)
-                else:
-                    angles[i].append(angle_rad)
-
-        # rounding the angles float number
-        def bin_float(value, bin_size):
-            return round(value / bin_size) * bin_size
-
-        for col in angles:
-            for i, a in enumerate(col):
-                col[i] = bin_float(a, tol_rad)
+            dx = points[i + 1 :, 0] - points[i, 0]
+            dy = points[i + 1 :, 1] - points[i, 1]
+
+            # Calculate the angle in radians with the x-axis
+            angle_rad = np.arctan2(dy, dx)
+            angle_rad = np.where(
+                np.abs(angle_rad - np.pi) < tol_rad, 0.0, np.where(angle_rad < 0, angle_rad + np.pi, angle_rad)
+            )
+            # rounding the angles float number
+            angles.append((np.round(angle_rad / tol_rad) * tol_rad).tolist())
 
         # Group the lines based on angles
         detected_lines_idx = []
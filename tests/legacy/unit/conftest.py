@@ -27,6 +27,7 @@ import csv
 import os
 from os.path import dirname
 
+from mock import MagicMock
 import pytest
 
 example_models_path = os.path.join(dirname(dirname(dirname(os.path.realpath(__file__)))), "example_models")
@@ -60,3 +61,78 @@ def points_for_line_detection_135():
             points.append((x, y))
 
     return points
+
+
+def _mock_point(x, y):
+    point = MagicMock()
+    point.X.ToDouble.return_value = x
+    point.Y.ToDouble.return_value = y
+    return point
+
+
+def _mock_primitive(obj_id, prim_type, net, layer, bbox=None, area=0.0, is_void=False, voids=()):
+    prim = MagicMock()
+    prim.GetId.return_value = obj_id
+    prim.GetObjType.return_value.ToString.return_value = "Primitive"
+    prim.GetPrimitiveType.return_value.ToString.return_value = prim_type
+    prim.GetNet.return_value.GetName.return_value = net
+    prim.GetLayer.return_value.GetName.return_value = layer
+    prim.IsVoid.return_value = is_void
+    prim.Voids = list(voids)
+    if bbox:
+        polygon_data = prim.GetPolygonData.return_value
+        polygon_data.GetBBox.return_value.Item1 = _mock_point(bbox[0], bbox[1])
+        polygon_data.GetBBox.return_value.Item2 = _mock_point(bbox[2], bbox[3])
+        polygon_data.Area.return_value = area
+    if prim_type == "Path":
+        # Horizontal path with flat end caps along the middle of its bounding box.
+        prim.GetWidth.return_value = bbox[3] - bbox[1]
+        arc = MagicMock()
+        arc.GetLength.return_value = bbox[2] - bbox[0]
+        prim.GetCenterLine.return_value.GetArcData.return_value = [arc]
+        flat = MagicMock(value__=1)
+        prim.GetEndCapStyle.return_value = (True, flat, flat)
+    return prim
+
+
+def _mock_padstack_instance(
+    obj_id, net, position, start_layer, stop_layer, component=None, rotation=0.0, definition="VIA"
+):
+    inst = MagicMock()
+    inst.GetId.return_value = obj_id
+    inst.GetObjType.return_value.ToString.return_value = "PadstackInstance"
+    inst.GetNet.return_value.GetName.return_value = net
+    edb_rotation = MagicMock()
+    edb_rotation.ToDouble.return_value = rotation
+    inst.GetPositionAndRotationValue.return_value = (True, _mock_point(*position), edb_rotation)
+    inst.GetComponent.return_value = component
+    inst.GetPadstackDef.return_value.GetName.return_value = definition
+    start = MagicMock()
+    start.GetName.return_value = start_layer
+    stop = MagicMock()
+    stop.GetName.return_value = stop_layer
+    inst.GetLayerRange.return_value = (True, start, stop)
+    return inst
+
+
+@pytest.fixture(scope="function", autouse=False)
+def mock_edb_layout():
+    """Mocked .NET layout with a few primitives and padstack instances."""
+    void = _mock_primitive(2, "Polygon", "GND", "TOP", (2.0, 2.0, 4.0, 4.0), 4.0, is_void=True)
+    component = MagicMock()
+    component.GetName.return_value = "U1"
+    component.GetTransform.return_value.TransformPoint.return_value = _mock_point(6.0, 21.0)
+    layout = MagicMock()
+    layout.Primitives = [
+        _mock_primitive(1, "Polygon", "GND", "TOP", (0.0, 0.0, 10.0, 10.0), 100.0, voids=[void]),
+        void,
+        _mock_primitive(3, "Path", "SIG", "TOP", (0.0, 20.0, 10.0, 21.0), 10.0),
+        _mock_primitive(4, "Rectangle", "SIG", "BOTTOM", (0.0, 0.0, 5.0, 5.0), 25.0),
+        _mock_primitive(5, "Bondwire", "SIG", "TOP"),
+        _mock_primitive(6, "Polygon", "", "Outline", (-10.0, -10.0, 30.0, 30.0), 1600.0),
+    ]
+    layout.PadstackInstances = [
+        _mock_padstack_instance(10, "GND", (1.0, 1.0), "TOP", "BOTTOM"),
+        _mock_padstack_instance(11, "SIG", (5.0, 20.0), "TOP", "BOTTOM", component=component),
+    ]
+    return layout
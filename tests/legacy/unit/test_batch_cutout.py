@@ -0,0 +1,103 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent.futures import ThreadPoolExecutor
+
+from mock import MagicMock, patch
+import pytest
+
+from pyedb.dotnet.edb_core import batch_cutout as batch_module
+from pyedb.dotnet.edb_core.batch_cutout import batch_cutout, run_cutout_job
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+
+def thread_pool(max_workers, mp_context=None):
+    return ThreadPoolExecutor(max_workers)
+
+
+def fake_job(edbpath, job, edbversion=None):
+    if job.get("fail"):
+        raise RuntimeError("worker died")
+    return {"name": job["output_aedb_path"], "extent": [[0.0, 0.0]], "timings": {"total": 1.0}, "error": None}
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self, tmp_path):
+        self.source = tmp_path / "board.aedb"
+        self.source.mkdir()
+        (self.source / "edb.def").write_text("def")
+        self.output = str(tmp_path / "lane_0.aedb")
+
+    @patch("pyedb.dotnet.edb.Edb")
+    def test_run_cutout_job(self, mock_edb):
+        """Copy the design, cut it out and save it."""
+        edb = mock_edb.return_value
+        edb.cutout.return_value = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0]]
+        job = {"output_aedb_path": self.output, "signal_list": ["SIG"], "reference_list": ["GND"]}
+        result = run_cutout_job(str(self.source), job, "2024.1")
+        assert result["error"] is None
+        assert result["name"] == "lane_0"
+        assert result["extent"] == edb.cutout.return_value
+        assert set(result["timings"]) == {"copy", "open", "cutout", "save", "total"}
+        assert (self.source.parent / "lane_0.aedb" / "edb.def").read_text() == "def"
+        mock_edb.assert_called_once_with(edbpath=self.output, edbversion="2024.1")
+        edb.cutout.assert_called_once_with(signal_list=["SIG"], reference_list=["GND"], open_cutout_at_end=True)
+        edb.save_edb.assert_called_once()
+        edb.close_edb.assert_called_once()
+
+    @patch("pyedb.dotnet.edb.Edb")
+    def test_run_cutout_job_failure(self, mock_edb):
+        """Report cutout failures and exceptions without raising."""
+        mock_edb.return_value.cutout.return_value = []
+        result = run_cutout_job(str(self.source), {"output_aedb_path": self.output, "name": "lane"})
+        assert result["name"] == "lane"
+        assert result["error"] == "Cutout failed."
+        mock_edb.return_value.save_edb.assert_not_called()
+        mock_edb.return_value.cutout.side_effect = RuntimeError("no license")
+        result = run_cutout_job(str(self.source), {"output_aedb_path": self.output})
+        assert "no license" in result["error"]
+        assert "total" in result["timings"]
+
+    @patch.object(batch_module, "run_cutout_job", fake_job)
+    @patch.object(batch_module, "ProcessPoolExecutor", thread_pool)
+    def test_batch_cutout(self):
+        """Return the results in the order of the jobs, including the failed workers."""
+        jobs = [{"output_aedb_path": "a.aedb"}, {"output_aedb_path": "b.aedb", "fail": True}, {"output_aedb_path": "c"}]
+        logger = MagicMock()
+        results = batch_cutout(str(self.source), jobs, workers=2, logger=logger)
+        assert [result["name"] for result in results] == ["a.aedb", "b", "c"]
+        assert results[0]["error"] is None
+        assert "worker died" in results[1]["error"]
+        assert logger.error.call_count == 1
+        assert logger.info.call_count == 2
+
+    def test_batch_cutout_invalid_jobs(self):
+        """Reject jobs without output or overwriting the source or each other."""
+        assert batch_cutout(str(self.source), []) == []
+        with pytest.raises(ValueError):
+            batch_cutout(str(self.source), [{"signal_list": ["SIG"]}])
+        with pytest.raises(ValueError):
+            batch_cutout(str(self.source), [{"output_aedb_path": str(self.source)}])
+        with pytest.raises(ValueError):
+            batch_cutout(str(self.source), [{"output_aedb_path": self.output}, {"output_aedb_path": self.output}])
@@ -0,0 +1,124 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from mock import MagicMock
+import pytest
+
+from pyedb.dotnet.edb_core.cell.connectivity import LayoutConnectivity, UnionFind
+from pyedb.dotnet.edb_core.cell.layout_snapshot import LayoutSnapshot
+from pyedb.dotnet.edb_core.dotnet.database import NetDotNet
+from pyedb.dotnet.edb_core.layout_validation import LayoutValidation
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+# GND polygon 1 is shorted to the SIG path 3 through via 10, the other objects are isolated.
+COMPONENTS = [{1, 3, 10}, {4}, {5}, {6}, {11}]
+
+
+def mock_layout_instance(components):
+    def connected_objects(edb_object):
+        ids = next(component for component in components if edb_object.GetId() in component)
+        items = []
+        for obj_id in ids:
+            loi = MagicMock()
+            loi.GetLayoutObj.return_value.GetId.return_value = obj_id
+            items.append(loi)
+        return MagicMock(Items=items)
+
+    layout_instance = MagicMock()
+    layout_instance.GetLayoutObjInstance.side_effect = lambda edb_object, _: edb_object
+    layout_instance.GetConnectedObjects.side_effect = connected_objects
+    return layout_instance
+
+
+def test_union_find():
+    """Label the sets of a union-find."""
+    union_find = UnionFind(6)
+    union_find.union(0, 3)
+    union_find.union(4, 3)
+    union_find.union(1, 2)
+    assert union_find.find(0) == union_find.find(4)
+    assert union_find.labels().tolist() == [0, 1, 1, 0, 0, 2]
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self, mock_edb_layout):
+        self.pedb = MagicMock()
+        self.snapshot = LayoutSnapshot(self.pedb, mock_edb_layout)
+        self.layout_instance = mock_layout_instance(COMPONENTS)
+        self.connectivity = LayoutConnectivity(self.snapshot, self.layout_instance)
+
+    def test_extraction(self):
+        """Query the connectivity once per connected component."""
+        assert self.connectivity.count == 5
+        assert self.connectivity.query_count == 5
+        assert self.connectivity.labels[self.snapshot.row(2)] == -1
+        assert sorted(self.connectivity.component_of(3)) == [1, 3, 10]
+        assert self.connectivity.component_of(2) == []
+
+    def test_queries(self):
+        """Group net objects, find shorts and small islands."""
+        assert self.connectivity.components_of_net("GND") == [[1, 10]]
+        assert self.connectivity.components_of_net("SIG") == [[3], [4], [5], [11]]
+        assert self.connectivity.shorted_nets("GND") == ["SIG"]
+        assert self.connectivity.shorted_nets("SIG") == ["GND"]
+        assert self.connectivity.area([1, 10]) == 96.0
+        assert self.connectivity.islands(smaller_than=30.0) == [[4], [5], [11]]
+        assert self.connectivity.islands(smaller_than=30.0, nets="GND") == []
+
+    def test_layout_validation(self):
+        """Run DC shorts and disjoint nets on the same connectivity."""
+        pedb = self.pedb
+        pedb.layout.connectivity = self.connectivity
+        validation = LayoutValidation(pedb)
+        assert validation.dc_shorts(["GND", "SIG"]) == [["GND", "SIG"]]
+        pedb.nets.find_or_create_net.return_value.name = "SIG_NEW"
+        new_nets = validation.disjoint_nets("SIG", keep_disjoint_pins=True)
+        assert new_nets == ["SIG_NEW"] * 3
+        assert self.layout_instance.GetConnectedObjects.call_count == 5
+
+    def test_disjoint_nets_rename(self):
+        """Move the disjoint groups to the EDB net of the created net."""
+        pedb = self.pedb
+        pedb.layout.connectivity = self.connectivity
+        edb_net = MagicMock()
+        edb_net.GetName.return_value = "SIG_NEW"
+        pedb.nets.find_or_create_net.return_value = NetDotNet(MagicMock(), edb_net)
+        assert LayoutValidation(pedb).disjoint_nets("SIG", keep_disjoint_pins=True) == ["SIG_NEW"] * 3
+        for obj_id in (4, 5, 11):
+            self.snapshot.edb_objects[self.snapshot.row(obj_id)].SetNet.assert_called_once_with(edb_net)
+
+    def test_disjoint_nets_timing(self):
+        """Evaluate all the nets before applying the fixes, reporting the time spent on each net."""
+        pedb = self.pedb
+        pedb.layout.connectivity = self.connectivity
+        validation = LayoutValidation(pedb)
+        assert validation.disjoint_nets(["GND", "SIG"], clean_disjoints_less_than=30.0) == []
+        assert set(validation.timing_report) == {"GND", "SIG"}
+        assert validation.timing_report["GND"]["disjoint_groups"] == 0
+        assert validation.timing_report["SIG"]["disjoint_groups"] == 3
+        # The disjoint pin 11 and the SIG primitives below 30 are deleted.
+        for obj_id in (4, 5, 11):
+            self.snapshot.edb_objects[self.snapshot.row(obj_id)].Delete.assert_called_once()
+        self.snapshot.edb_objects[self.snapshot.row(3)].Delete.assert_not_called()
+        pedb.layout._notify_change.assert_called_once()
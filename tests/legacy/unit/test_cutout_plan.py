@@ -0,0 +1,91 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from mock import MagicMock
+import pytest
+
+from pyedb.dotnet.edb import Edb
+from pyedb.dotnet.edb_core.cutout_plan import CutoutPlan
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self):
+        self.edb = MagicMock()
+        self.edb.layout.version = 3
+        extent = MagicMock()
+        extent.GetPolygonWithoutArcs.return_value.Points = [MagicMock(), MagicMock()]
+        self.plan = CutoutPlan(self.edb, extent, ["SIG"], ["GND"])
+        self.net = MagicMock()
+        self.pin = MagicMock()
+        self.prims = [MagicMock(), MagicMock()]
+        self.paths = [MagicMock(), MagicMock()]
+        self.paths[0]._edb_object.SetClipInfo.return_value = True
+        self.paths[1]._edb_object.SetClipInfo.return_value = False
+        self.component = MagicMock()
+        self.plan.nets_to_delete = [self.net]
+        self.plan.padstack_instances_to_delete = [self.pin]
+        self.plan.primitives_to_delete = [self.prims[0]]
+        self.plan.primitives_to_clip = [self.prims[1]]
+        self.plan.polygons_to_create = [["pdata", "TOP", "GND", []]]
+        self.plan.paths_to_clip = self.paths
+        self.plan.components_to_delete = [self.component]
+        self.plan.timings = {"extent": 1.0}
+
+    def test_summary(self):
+        """Count the objects of each set of a plan."""
+        summary = self.plan.summary
+        assert summary["primitives_to_clip"] == 1
+        assert summary["paths_to_clip"] == 2
+        assert summary["timings"] == {"extent": 1.0}
+        assert "components_to_delete=1" in repr(self.plan)
+        assert len(self.plan.extent_points) == 2
+
+    def test_apply(self):
+        """Apply a plan, clipping the paths EDB fails to clip as polygons."""
+        self.edb._plan_primitive_clip.return_value = ("clip", [["pdata2", "TOP", "GND", []]])
+        assert Edb._apply_cutout_plan(self.edb, self.plan)
+        self.edb.nets.delete_many.assert_called_once_with([self.net], delete_objects=False)
+        self.edb.padstacks.delete_many.assert_called_once_with([self.pin])
+        self.edb.modeler.delete_many.assert_called_once_with(self.prims + self.paths[1:])
+        self.edb._plan_primitive_clip.assert_called_once_with(self.paths[1], self.plan.extent, False)
+        created = [call.args[0] for call in self.edb.modeler.create_polygon.call_args_list]
+        assert created == ["pdata", "pdata2"]
+        self.component.edbcomponent.Delete.assert_called_once()
+        assert "apply" in self.plan.timings
+
+    def test_apply_modified_layout(self):
+        """Refuse to apply a plan once the layout was modified."""
+        assert self.plan.is_valid
+        self.edb.layout.version = 4
+        assert not self.plan.is_valid
+        assert Edb._apply_cutout_plan(self.edb, self.plan) == []
+        self.edb.padstacks.delete_many.assert_not_called()
+
+    def test_apply_reopened_layout(self):
+        """Refuse to apply a plan once another layout was opened, even with the same version."""
+        self.edb.layout = MagicMock()
+        self.edb.layout.version = 3
+        assert not self.plan.is_valid
+        assert Edb._apply_cutout_plan(self.edb, self.plan) == []
@@ -0,0 +1,164 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from types import SimpleNamespace
+
+from mock import MagicMock
+import numpy as np
+import pytest
+import shapely
+
+from pyedb.dotnet.edb import Edb
+from pyedb.dotnet.edb_core.extent_builder import ExtentBuilder
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+
+def mock_polygon_data(x0, y0, x1, y1):
+    polygon_data = MagicMock()
+    polygon_data.Points = []
+    for x, y in [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]:
+        point = MagicMock()
+        point.X.ToDouble.return_value = x
+        point.Y.ToDouble.return_value = y
+        point.IsArc.return_value = False
+        polygon_data.Points.append(point)
+    polygon_data.Holes = []
+    return polygon_data
+
+
+class MockSnapshot(object):
+    """Snapshot of rectangle primitives and padstack instances given as ``(net, bbox, is_padstack)``."""
+
+    def __init__(self, objects):
+        self.net_names = sorted({net for net, _, _ in objects})
+        self.ids = np.arange(len(objects), dtype=np.int64)
+        self.net_index = np.array([self.net_names.index(net) for net, _, _ in objects])
+        self.type_index = np.array([int(is_padstack) for _, _, is_padstack in objects])
+        self.layer_index = np.zeros(len(objects), dtype=np.int64)
+        self.bbox = np.array([bbox for _, bbox, _ in objects], dtype=float)
+        self.is_padstack_instance = self.type_index == 1
+        self.is_primitive = ~self.is_padstack_instance
+        self.pad_bbox = np.where(self.is_padstack_instance[:, None], self.bbox, np.nan)
+        self.position = (self.bbox[:, :2] + self.bbox[:, 2:]) / 2
+        self.edb_objects = []
+        for _, bbox, _ in objects:
+            edb_object = MagicMock()
+            edb_object.GetPolygonData.return_value = mock_polygon_data(*bbox)
+            self.edb_objects.append(edb_object)
+
+    def mask(self, nets=None, is_void=None):
+        return np.isin(self.net_index, [self.net_names.index(net) for net in nets if net in self.net_names])
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self):
+        self.snapshot = MockSnapshot(
+            [
+                ("SIG1", [0.0, 0.0, 4.0, 1.0], False),
+                ("SIG1", [3.5, 0.0, 4.5, 1.0], True),
+                ("SIG2", [0.0, 3.0, 4.0, 4.0], False),
+                ("SIG3", [20.0, 20.0, 21.0, 21.0], False),
+            ]
+        )
+        self.edb = MagicMock()
+        self.edb.layout = SimpleNamespace(version=0, snapshot=self.snapshot)
+        self.builder = ExtentBuilder(self.edb)
+
+    def test_net_footprint(self):
+        """Buffer the primitives and pads of a net once."""
+        footprint = self.builder.net_footprint("SIG1", 0.5)
+        assert footprint.bounds == pytest.approx((-0.5, -0.5, 5.0, 1.5))
+        assert footprint.area == pytest.approx(5.5 * 2)
+        assert self.builder.net_footprint("SIG1", 0.5) is footprint
+        round_footprint = self.builder.net_footprint("SIG1", 0.5, use_round_corner=True)
+        assert round_footprint.area < footprint.area
+        assert self.builder.net_footprint("NONE", 0.5).is_empty
+
+    def test_conformal_reuses_net_footprints(self):
+        """Union cached footprints, only reading the geometry of the added nets."""
+        extent = self.builder.conformal(["SIG1", "SIG2"], 1.0)
+        assert extent.geom_type == "Polygon"
+        assert extent.bounds == pytest.approx((-1.0, -1.0, 5.5, 5.0))
+        reads = [edb_object.GetPolygonData.call_count for edb_object in self.snapshot.edb_objects]
+        assert reads == [1, 0, 1, 0]
+        self.builder.conformal(["SIG1", "SIG2", "SIG3"], 1.0)
+        reads = [edb_object.GetPolygonData.call_count for edb_object in self.snapshot.edb_objects]
+        assert reads == [1, 0, 1, 1]
+
+    def test_conformal_grows_expansion(self):
+        """Increase the expansion size until the footprints overlap and fall back on the largest polygon."""
+        extent = self.builder.conformal(["SIG1", "SIG2"], 0.5)
+        assert extent.geom_type == "Polygon"
+        assert extent.bounds[3] > 4.5
+        extent = self.builder.conformal(["SIG1", "SIG3"], 0.5, iterations=2)
+        assert extent.bounds == pytest.approx(self.builder.net_footprint("SIG1", 0.7).bounds)
+
+    def test_layout_change(self):
+        """Read again the nets whose objects changed."""
+        footprint = self.builder.net_footprint("SIG2", 0.5)
+        self.snapshot.bbox[3] = [22.0, 20.0, 23.0, 21.0]
+        self.edb.layout.version = 1
+        assert self.builder.net_footprint("SIG2", 0.5) is footprint
+        assert self.snapshot.edb_objects[3].GetPolygonData.call_count == 0
+        self.snapshot.bbox[2] = [0.0, 3.0, 5.0, 4.0]
+        self.snapshot.edb_objects[2].GetPolygonData.return_value = mock_polygon_data(0.0, 3.0, 5.0, 4.0)
+        self.edb.layout.version = 2
+        assert self.builder.net_footprint("SIG2", 0.5).bounds == pytest.approx((-0.5, 2.5, 5.5, 4.5))
+
+    def test_convex_hull_and_bounding_box(self):
+        """Compute convex hull and bounding box extents with extra geometries."""
+        hull = self.builder.extent(["SIG1", "SIG2"], "ConvexHull", 0.5)
+        assert hull.bounds == pytest.approx((-0.5, -0.5, 5.0, 4.5))
+        assert shapely.equals(shapely.convex_hull(hull), hull)
+        box = self.builder.extent(["SIG1"], "Bounding", 1.0, geometries=[shapely.Point(10.0, 10.0)])
+        assert box.bounds == pytest.approx((-1.0, -1.0, 11.0, 11.0))
+        assert box.area == pytest.approx(144.0)
+
+    def test_defeature(self):
+        """Simplify the footprints with the defeature tolerance."""
+        footprint = self.builder.net_footprint("SIG1", 0.5, use_round_corner=True)
+        simplified = self.builder.net_footprint("SIG1", 0.5, use_round_corner=True, extent_defeature=0.1)
+        assert len(simplified.exterior.coords) < len(footprint.exterior.coords)
+        assert simplified.symmetric_difference(footprint).area < 0.1 * footprint.length
+
+    def test_edb_extent(self):
+        """Compute a cutout extent with the pins to preserve and convert it to an EDB polygon."""
+        self.edb.extent_builder = self.builder
+        self.edb.padstacks.instances = {7: SimpleNamespace(position=[10.0, 0.5])}
+        polygon_data = Edb._create_shapely_extent(self.edb, ["SIG1"], "ConvexHull", 0.5, False, pins_to_preserve=[7])
+        points = self.edb.edb_api.geometry.api_class.PolygonData.call_args[0][0]
+        assert polygon_data is self.edb.edb_api.geometry.api_class.PolygonData.return_value
+        # The rectangle of SIG1 and the preserved pin, with its mitered tip beveled.
+        assert len(points) == 6
+        self.edb._smart_cut_locations.assert_not_called()
+
+    def test_polygon_data_holes(self):
+        """Drop the holes of an extent unless they are requested."""
+        ring = shapely.Polygon([(0, 0), (10, 0), (10, 10), (0, 10)]).difference(
+            shapely.Polygon([(4, 4), (6, 4), (6, 6), (4, 6)])
+        )
+        polygon_data = self.builder.to_polygon_data(ring)
+        polygon_data.AddHole.assert_not_called()
+        polygon_data = self.builder.to_polygon_data(ring, include_holes=True)
+        polygon_data.AddHole.assert_called_once()
@@ -0,0 +1,109 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from types import SimpleNamespace
+
+from mock import MagicMock
+import numpy as np
+import pytest
+
+from pyedb.dotnet.edb_core.extent_cache import ExtentCache
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+
+def mock_snapshot(bbox):
+    return SimpleNamespace(
+        ids=np.array([1, 2]),
+        type_index=np.array([0, 1]),
+        net_index=np.array([0, 1]),
+        layer_index=np.array([0, 0]),
+        is_void=np.array([False, False]),
+        bbox=np.array(bbox, dtype=float),
+        net_names=["SIG", "GND"],
+        layer_names=["TOP"],
+    )
+
+
+def mock_arc(x0, y0, x1, y1, height=0.0):
+    arc = MagicMock()
+    arc.Start.X.ToDouble.return_value = x0
+    arc.Start.Y.ToDouble.return_value = y0
+    arc.End.X.ToDouble.return_value = x1
+    arc.End.Y.ToDouble.return_value = y1
+    arc.Height = height
+    return arc
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self, tmp_path):
+        self.pedb = MagicMock()
+        self.pedb.edbpath = str(tmp_path / "board.aedb")
+        self.pedb.layout.version = 0
+        self.pedb.layout.snapshot = mock_snapshot([[0, 0, 1, 1], [0, 0, 2, 2]])
+        self.extent = MagicMock()
+        self.extent.GetArcData.return_value = [mock_arc(0, 0, 1, 0), mock_arc(1, 0, 0, 0, 0.5)]
+        hole = MagicMock()
+        hole.GetArcData.return_value = [mock_arc(0.1, 0.1, 0.2, 0.1)]
+        self.extent.Holes = [hole]
+        self.cache = ExtentCache(self.pedb)
+        self.key = ExtentCache.extent_key(["SIG2", "SIG1"], "Conforming", 1e-3, True)
+
+    def test_key(self):
+        """Build the same key whatever the order of the signal nets."""
+        assert ExtentCache.extent_key(["SIG1", "SIG2"], "Conforming", 0.001, 1) == self.key
+        assert ExtentCache.extent_key(["SIG1", "SIG2"], "Conforming", 0.002, True) != self.key
+        assert ExtentCache.extent_key(["SIG1", "SIG2"], "Conforming", 0.001, True, 1e-4) != self.key
+
+    def test_get_set(self):
+        """Return an extent while the layout matches its stamp."""
+        assert self.cache.get(self.key) is None
+        self.cache.set(self.key, self.extent)
+        assert self.cache.get(self.key) is self.extent
+        self.pedb.layout.version = 1
+        assert self.cache.get(self.key) is self.extent
+        self.pedb.layout.version = 2
+        self.pedb.layout.snapshot = mock_snapshot([[0, 0, 1, 1], [0, 0, 3, 3]])
+        assert self.cache.get(self.key) is None
+
+    def test_save_load(self):
+        """Rebuild the extent arcs and holes from the cache file of a later session."""
+        self.cache.set(self.key, self.extent)
+        path = self.cache.save()
+        assert path == str(self.pedb.edbpath).replace(".aedb", "_extents.json")
+        cache = ExtentCache(self.pedb)
+        geometry = self.pedb.edb_api.geometry
+        extent = cache.get(self.key)
+        assert extent is geometry.polygon_data.create_from_arcs.return_value
+        assert geometry.arc_data.call_count == 3
+        geometry.arc_data.assert_any_call([1.0, 0.0], [0.0, 0.0], height=0.5)
+        extent.AddHole.assert_called_once()
+        assert len(cache) == 1
+
+    def test_load_missing_file(self):
+        """Ignore missing and corrupted cache files."""
+        assert not self.cache.load()
+        with open(self.cache.file_path, "w") as f:
+            f.write("{")
+        assert not self.cache.load()
+        assert len(self.cache) == 0
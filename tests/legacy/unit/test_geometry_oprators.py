@@ -20,6 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import os
+import time
+
+import numpy as np
 import pytest
 
 from pyedb.modeler.geometry_operators import GeometryOperators as go
@@ -27,6 +31,24 @@ from pyedb.modeler.geometry_operators import GeometryOperators as go
 pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
 
 
+# L-shaped polygon with a notch, as [[x1, x2, ..., xn],[y1, y2, ..., yn]]
+POLYGON = [[0.0, 6.0, 6.0, 4.0, 4.0, 2.0, 2.0, 0.0], [0.0, 0.0, 6.0, 6.0, 2.0, 2.0, 6.0, 6.0]]
+
+
+def _random_points(count, seed=0):
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(-1.0, 7.0, (count, 2))
+    # snap some points to the lattice to hit the vertices and the sides
+    points[::4] = np.round(points[::4])
+    return points
+
+
+def _elapsed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
 class TestClass:
     def test_find_points_along_lines(self, points_for_line_detection):
         distance_threshold = 0.015
@@ -60,3 +82,87 @@ class TestClass:
         assert nplines == 24
         assert nslines == 7
         assert nlines == 21
+
+    def test_points_in_polygon(self):
+        points = _random_points(400)
+        expected = [go.point_in_polygon(p.tolist(), POLYGON) for p in points]
+        assert go.points_in_polygon(points, POLYGON).tolist() == expected
+        assert set(expected) == {-1, 0, 1}
+        expected = [go.is_point_in_polygon(p.tolist(), POLYGON) for p in points]
+        assert go.are_points_in_polygon(points, POLYGON).tolist() == expected
+
+    def test_are_segment_pairs_intersecting(self):
+        rng = np.random.default_rng(1)
+        a1, a2, b1, b2 = np.round(rng.uniform(0.0, 4.0, (4, 500, 2)))
+        for include_collinear in (True, False):
+            expected = [
+                go.are_segments_intersecting(*[v.tolist() for v in segments], include_collinear=include_collinear)
+                for segments in zip(a1, a2, b1, b2)
+            ]
+            result = go.are_segment_pairs_intersecting(a1, a2, b1, b2, include_collinear=include_collinear)
+            assert result.tolist() == expected
+        # each segment a against all segments b
+        result = go.are_segment_pairs_intersecting(a1[:20, None], a2[:20, None], b1[:30], b2[:30])
+        assert result.shape == (20, 30)
+        assert result[3, 7] == go.are_segments_intersecting(a1[3], a2[3], b1[7], b2[7])
+
+    def test_are_segments_intersecting_polygon(self):
+        a = _random_points(300, seed=2)
+        b = _random_points(300, seed=3)
+        expected = [go.is_segment_intersecting_polygon(p.tolist(), q.tolist(), POLYGON) for p, q in zip(a, b)]
+        assert go.are_segments_intersecting_polygon(a, b, POLYGON).tolist() == expected
+        assert any(expected) and not all(expected)
+
+    def test_points_segments_distance(self):
+        points = _random_points(50, seed=4)
+        a = _random_points(20, seed=5)
+        b = a + 1.0
+        result = go.points_segments_distance(points, a, b)
+        assert result.shape == (50, 20)
+        for i, p in enumerate(points):
+            for j in range(20):
+                assert result[i, j] == go.point_segment_distance(p.tolist(), a[j].tolist(), b[j].tolist())
+
+    def test_get_polygons_centroid(self):
+        rng = np.random.default_rng(6)
+        polygons = [rng.uniform(0.0, 1.0, (n, 3)).tolist() for n in (3, 5, 3, 8)] + [[[1.0, 2.0, 3.0]] * 2]
+        result = go.get_polygons_centroid(polygons)
+        for centroid, polygon in zip(result, polygons):
+            assert centroid == pytest.approx(go.get_polygon_centroid(polygon), rel=1e-12)
+        assert result[-1].tolist() == [1.0, 2.0, 3.0]
+
+    def test_find_largest_rectangle_inside_polygon(self):
+        rectangles = go.find_largest_rectangle_inside_polygon(POLYGON, partition_max_order=12)
+        assert len(rectangles) == 3
+        for rectangle in rectangles:
+            assert go.are_points_in_polygon(rectangle, POLYGON).all()
+
+    def test_batch_large_inputs(self):
+        """Match the scalar predicates on large inputs."""
+        points = _random_points(2000, seed=7)
+        expected = [go.point_in_polygon(p.tolist(), POLYGON) for p in points]
+        assert go.points_in_polygon(points, POLYGON).tolist() == expected
+
+        a, b = points[:1000], points[1000:]
+        expected = [go.is_segment_intersecting_polygon(p.tolist(), q.tolist(), POLYGON) for p, q in zip(a, b)]
+        assert go.are_segments_intersecting_polygon(a, b, POLYGON).tolist() == expected
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(not os.getenv("PYEDB_BENCHMARK"), reason="Benchmark, run with PYEDB_BENCHMARK=1.")
+    def test_batch_benchmark(self):
+        """Report the time of the batch predicates and of loops over the scalar ones."""
+        points = _random_points(2000, seed=7)
+        scalar_time, _ = _elapsed(lambda: [go.point_in_polygon(p.tolist(), POLYGON) for p in points])
+        batch_time, _ = _elapsed(lambda: go.points_in_polygon(points, POLYGON))
+        print("points_in_polygon: scalar {:.2f} ms, batch {:.2f} ms.".format(scalar_time * 1e3, batch_time * 1e3))
+
+        a, b = points[:1000], points[1000:]
+        scalar_time, _ = _elapsed(
+            lambda: [go.is_segment_intersecting_polygon(p.tolist(), q.tolist(), POLYGON) for p, q in zip(a, b)]
+        )
+        batch_time, _ = _elapsed(lambda: go.are_segments_intersecting_polygon(a, b, POLYGON))
+        print(
+            "are_segments_intersecting_polygon: scalar {:.2f} ms, batch {:.2f} ms.".format(
+                scalar_time * 1e3, batch_time * 1e3
+            )
+        )
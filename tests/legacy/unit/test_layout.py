@@ -0,0 +1,153 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from mock import MagicMock
+import pytest
+
+from pyedb.dotnet.edb_core.cell.layout import Layout
+from pyedb.dotnet.edb_core.cell.primitive.path import Path
+from pyedb.dotnet.edb_core.edb_data.padstacks_data import EDBPadstackInstance
+from pyedb.dotnet.edb_core.edb_data.primitives_data import EdbPolygon
+from pyedb.dotnet.edb_core.modeler import Modeler
+from pyedb.dotnet.edb_core.padstack import EdbPadstacks
+from tests.legacy.unit.conftest import _mock_primitive
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self, mock_edb_layout):
+        self.pedb = MagicMock()
+        self.layout = Layout(self.pedb, mock_edb_layout)
+        self.pedb.layout = self.layout
+
+    def test_version(self):
+        """Increment the mutation counter on each change."""
+        assert self.layout.version == 0
+        self.layout._notify_change()
+        self.layout._notify_change()
+        assert self.layout.version == 2
+
+    def test_snapshot_cache(self):
+        """Rebuild the snapshot only after a change."""
+        snapshot = self.layout.snapshot
+        assert self.layout.snapshot is snapshot
+        self.layout._notify_change()
+        assert self.layout.snapshot is not snapshot
+        assert len(self.layout.snapshot) == 8
+
+    def test_padstack_instances_cache(self):
+        """Key the padstack instances dictionary on the layout version."""
+        padstacks = EdbPadstacks(self.pedb)
+        instances = padstacks.instances
+        assert sorted(instances) == [10, 11]
+        assert padstacks.instances is instances
+        self.layout._edb_object.PadstackInstances = self.layout._edb_object.PadstackInstances[:1]
+        assert padstacks.instances is instances
+        self.layout._notify_change()
+        assert sorted(padstacks.instances) == [10]
+
+    def test_layer_collection_change(self):
+        """Invalidate the layout caches when the layer collection is replaced."""
+        snapshot = self.layout.snapshot
+        index = self.layout.spatial_index
+        self.layout.layer_collection = MagicMock()
+        assert self.layout._layer_collection_version == 1
+        assert self.layout.version == 1
+        assert self.layout.snapshot is not snapshot
+        assert self.layout.spatial_index is not index
+
+    def test_spatial_index_update(self):
+        """Update the spatial index in place on tracked changes and rebuild it on untracked ones."""
+        index = self.layout.spatial_index
+        assert len(index) == 7
+        self.layout._notify_change(deleted=[10])
+        assert self.layout.spatial_index is index
+        assert 10 not in index
+        self.layout._notify_change()
+        assert self.layout.spatial_index is not index
+        assert 10 in self.layout.spatial_index
+
+    def test_id_index(self):
+        """Look up primitives, voids and padstack instances by id."""
+        index = self.layout.id_index
+        assert sorted(index) == [1, 2, 3, 4, 5, 6, 10, 11]
+        assert index[11] is self.layout._edb_object.PadstackInstances[1]
+        assert self.layout.find_object_by_id(11).id == 11
+        assert self.layout.find_object_by_id(2).id == 2
+        created = _mock_primitive(20, "Polygon", "GND", "TOP", (0.0, 0.0, 1.0, 1.0), 1.0)
+        self.layout._notify_change(created=[created], deleted=[3])
+        assert self.layout.id_index is index
+        assert index[20] is created
+        assert 3 not in index
+
+    def test_find_instance_by_id(self):
+        """Find padstack instances only."""
+        padstacks = EdbPadstacks(self.pedb)
+        assert padstacks.find_instance_by_id(10).id == 10
+        assert padstacks.find_instance_by_id(1) is None
+        assert padstacks.find_instance_by_id(99) is None
+
+    def test_delete_objects(self):
+        """Delete objects given by ID or wrapper with a single change notification."""
+        edb_layout = self.layout._edb_object
+        polygon, void = edb_layout.Primitives[0], edb_layout.Primitives[1]
+        padstacks = EdbPadstacks(self.pedb)
+        report = padstacks.delete_many([10, padstacks.instances[11], 11, 99])
+        assert report["count"] == 2
+        assert report["not_found"] == [99]
+        assert self.layout.version == 1
+        edb_layout.PadstackInstances[0].Delete.assert_called_once()
+        edb_layout.PadstackInstances[1].Delete.assert_called_once()
+        deleted, not_found = self.layout._delete_objects([1, 2], include_voids=True)
+        assert deleted == [1]
+        assert not_found == []
+        polygon.Delete.assert_called_once()
+        void.Delete.assert_not_called()
+        assert self.layout.version == 2
+        assert self.layout._delete_objects([]) == ([], [])
+        assert self.layout.version == 2
+
+    def test_setters_notify(self):
+        """Notify geometry edits done through pyedb wrappers, updating the indexes in place."""
+        index = self.layout.spatial_index
+        primitives = self.layout._edb_object.Primitives
+        EdbPolygon(primitives[0], self.pedb).move(["1mm", "2mm"])
+        path = Path(self.pedb, primitives[2])
+        path.width = "1mm"
+        path.add_point(1.0, 2.0)
+        EDBPadstackInstance(self.layout._edb_object.PadstackInstances[0], self.pedb).position = [2.0, 3.0]
+        assert self.layout.version == 4
+        assert self.layout.spatial_index is index
+        assert all(i in index for i in (1, 3, 10))
+
+    def test_edit_notifies(self):
+        """Notify polygon edits done with raw EDB calls, updating the indexes in place."""
+        index = self.layout.spatial_index
+        poly = MagicMock()
+        poly._edb_object = self.layout._edb_object.Primitives[3]
+        assert Modeler(self.pedb).defeature_polygon(poly)
+        poly._edb_object.SetPolygonData.assert_called_once()
+        assert self.layout.version == 1
+        assert self.layout.spatial_index is index
+        assert 4 in index
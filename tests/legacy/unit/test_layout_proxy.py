@@ -0,0 +1,138 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import tracemalloc
+
+from mock import MagicMock
+import numpy as np
+import pytest
+
+from pyedb.dotnet.edb_core.cell.layout import Layout
+from pyedb.dotnet.edb_core.cell.layout_proxy import (
+    LayoutObjectProxy,
+    PadstackInstanceProxy,
+    PrimitiveProxy,
+)
+from pyedb.dotnet.edb_core.cell.layout_snapshot import LayoutSnapshot
+from pyedb.dotnet.edb_core.cell.primitive.primitive import Primitive
+from pyedb.dotnet.edb_core.edb_data.padstacks_data import EDBPadstackInstance
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+
+def _allocated(factory):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = factory()
+        return tracemalloc.get_traced_memory()[0] - before, objects
+    finally:
+        tracemalloc.stop()
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self, mock_edb_layout):
+        self.snapshot = LayoutSnapshot(MagicMock(), mock_edb_layout)
+
+    def test_proxies(self):
+        """Read indexed attributes from the snapshot."""
+        proxies = {proxy.id: proxy for proxy in self.snapshot.get_proxies()}
+        assert isinstance(proxies[1], PrimitiveProxy)
+        assert isinstance(proxies[11], PadstackInstanceProxy)
+        assert proxies[1].net_name == "GND"
+        assert proxies[1].layer_name == "TOP"
+        assert proxies[1].primitive_type == "polygon"
+        assert proxies[1].bbox == [0.0, 0.0, 10.0, 10.0]
+        assert proxies[1].area() == 96.0
+        assert proxies[2].is_void
+        assert proxies[11].position == [6.0, 21.0]
+        assert proxies[11].start_layer == "TOP"
+        assert proxies[11].stop_layer == "BOTTOM"
+        assert proxies[11].padstack_definition == "VIA"
+        assert proxies[10].rotation == 0.0
+        assert proxies[11] == self.snapshot.get_proxies(self.snapshot.mask(nets="SIG", types="PadstackInstance"))[0]
+
+    def test_proxy_lazy_attributes(self):
+        """Resolve other attributes on a full object created on demand."""
+        proxy = self.snapshot.get_proxies(self.snapshot.is_padstack_instance)[0]
+        assert proxy._edb_object is self.snapshot.edb_objects[self.snapshot.row(10)]
+        assert isinstance(proxy.full_object, EDBPadstackInstance)
+        proxy._edb_object.IsLayoutPin.return_value = True
+        assert proxy.is_pin
+        assert type(proxy).__dictoffset__ == 0
+
+    def test_proxy_write(self, mock_edb_layout):
+        """Read indexed attributes from the current snapshot after a write."""
+        pedb = MagicMock()
+        pedb.layout = Layout(pedb, mock_edb_layout)
+        pedb.nets.netlist = ["SIG"]
+        proxy = pedb.layout.snapshot.get_proxies(pedb.layout.snapshot.mask(nets="GND", types="Polygon"))[0]
+        edb_object = proxy._edb_object
+        edb_object.SetNet.side_effect = lambda net: edb_object.GetNet.return_value.GetName.configure_mock(
+            return_value="SIG"
+        )
+        proxy.net_name = "SIG"
+        edb_object.SetNet.assert_called_once()
+        assert proxy._snapshot is pedb.layout.snapshot
+        assert proxy.net_name == "SIG"
+        assert pedb.layout.version == 2
+
+    def test_slots(self):
+        """Store proxies in slots, without an instance dictionary."""
+        for cls in (LayoutObjectProxy, PrimitiveProxy, PadstackInstanceProxy):
+            assert "__slots__" in cls.__dict__
+            assert cls.__dictoffset__ == 0
+        proxy = self.snapshot.get_proxies()[0]
+        # Unknown attributes are resolved on the full object, so only the class layout is checked.
+        assert not any("__dict__" in cls.__dict__ for cls in type(proxy).__mro__[:-1])
+        with pytest.raises(AttributeError):
+            object.__setattr__(proxy, "name", "test")
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(not os.getenv("PYEDB_BENCHMARK"), reason="Benchmark, run with PYEDB_BENCHMARK=1.")
+    def test_memory_benchmark(self):
+        """Report the memory of compact proxies and full wrappers."""
+        count = 20000
+        edb_object = MagicMock()
+        pedb = MagicMock()
+        snapshot = LayoutSnapshot(pedb)
+        snapshot.ids = np.arange(count, dtype=np.int64)
+        snapshot.type_names = ["PadstackInstance", "Polygon"]
+        snapshot._type_lookup = {"PadstackInstance": 0, "Polygon": 1}
+        snapshot.type_index = (np.arange(count) % 2).astype(np.int32)
+        snapshot._edb_objects = [edb_object] * count
+
+        proxies_size, proxies = _allocated(snapshot.get_proxies)
+        wrappers_size, wrappers = _allocated(
+            lambda: [
+                EDBPadstackInstance(edb_object, pedb) if i % 2 == 0 else Primitive(pedb, edb_object)
+                for i in range(count)
+            ]
+        )
+        assert len(proxies) == len(wrappers) == count
+        print(
+            "{} objects: proxies {:.0f} kB, wrappers {:.0f} kB ({:.1f}x).".format(
+                count, proxies_size / 1024, wrappers_size / 1024, wrappers_size / proxies_size
+            )
+        )
@@ -0,0 +1,142 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from mock import MagicMock
+import numpy as np
+import pytest
+
+from pyedb.dotnet.edb_core.cell.layout_snapshot import LayoutSnapshot
+from tests.legacy.unit.conftest import _mock_padstack_instance, _mock_point
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self, mock_edb_layout):
+        self.snapshot = LayoutSnapshot(MagicMock(), mock_edb_layout)
+
+    def test_columns(self):
+        """Extract one row per primitive and padstack instance."""
+        snapshot = self.snapshot
+        assert len(snapshot) == 8
+        assert snapshot.ids.tolist() == [1, 2, 3, 4, 5, 6, 10, 11]
+        assert snapshot.net_names == ["GND", "SIG", ""]
+        assert snapshot.layer_names == ["TOP", "BOTTOM", "Outline"]
+        assert snapshot.is_void.tolist() == [False, True, False, False, False, False, False, False]
+        assert snapshot.is_padstack_instance.tolist() == [False] * 6 + [True] * 2
+        assert snapshot.bbox[0].tolist() == [0.0, 0.0, 10.0, 10.0]
+        assert np.isnan(snapshot.bbox[4]).all()
+        assert 11 in snapshot
+        assert snapshot.row(11) == 7
+        assert snapshot.row(99) == -1
+
+    def test_area_and_position(self):
+        """Report area net of voids and padstack positions with component transform."""
+        snapshot = self.snapshot
+        assert snapshot.area[snapshot.row(1)] == 96.0
+        assert snapshot.area[snapshot.row(2)] == 4.0
+        assert snapshot.position[snapshot.row(10)].tolist() == [1.0, 1.0]
+        assert snapshot.position[snapshot.row(11)].tolist() == [6.0, 21.0]
+        assert snapshot.position[snapshot.row(3)].tolist() == [5.0, 20.5]
+
+    def test_mask(self):
+        """Filter rows by net, layer, type and void flag."""
+        snapshot = self.snapshot
+        assert snapshot.ids[snapshot.mask(nets="GND")].tolist() == [1, 2, 10]
+        assert snapshot.ids[snapshot.mask(nets="GND", is_void=False)].tolist() == [1, 10]
+        assert snapshot.ids[snapshot.mask(layers="BOTTOM")].tolist() == [4, 10, 11]
+        assert snapshot.ids[snapshot.mask(types=["Path", "Rectangle"])].tolist() == [3, 4]
+        assert not snapshot.mask(nets="UNKNOWN").any()
+
+    def test_area_by_layer(self):
+        """Sum copper area per layer."""
+        snapshot = self.snapshot
+        area = snapshot.area_by_layer(snapshot.is_primitive & ~snapshot.is_void)
+        assert area == {"TOP": 106.0, "BOTTOM": 25.0, "Outline": 1600.0}
+
+    def test_to_dataframe(self):
+        """Export the snapshot to a DataFrame."""
+        df = self.snapshot.to_dataframe()
+        assert len(df) == 8
+        assert df.loc[df["id"] == 11, "stop_layer"].tolist() == ["BOTTOM"]
+        assert df.loc[df["id"] == 3, "type"].tolist() == ["Path"]
+        assert df.loc[df["id"] == 11, "component"].tolist() == ["U1"]
+        assert df["definition"].isna().sum() == 6
+
+    def test_padstack_placement(self):
+        """Store rotation, definition and component of padstack instances."""
+        snapshot = self.snapshot
+        assert snapshot.definition_names == ["VIA"]
+        assert snapshot.component_names == ["U1"]
+        assert snapshot.component_index.tolist() == [-1] * 7 + [0]
+        assert snapshot.definition_index[snapshot.is_padstack_instance].tolist() == [0, 0]
+        assert snapshot.rotation[snapshot.row(10)] == 0.0
+        assert np.isnan(snapshot.rotation[snapshot.row(1)])
+
+    def test_component_transform(self):
+        """Transform pin positions once per component."""
+        pedb = MagicMock()
+        pedb.point_data.side_effect = _mock_point
+        component = MagicMock()
+        component.GetName.return_value = "U2"
+        # Rotation of 90 degrees followed by an offset of (1, 2).
+        transform = component.GetTransform.return_value
+        transform.TransformPoint.side_effect = lambda p: _mock_point(1.0 - p.Y.ToDouble(), 2.0 + p.X.ToDouble())
+        layout = MagicMock()
+        layout.Primitives = []
+        layout.PadstackInstances = [
+            _mock_padstack_instance(i, "SIG", (float(i), 0.5), "TOP", "BOTTOM", component=component) for i in range(5)
+        ]
+        snapshot = LayoutSnapshot(pedb, layout)
+        assert np.allclose(snapshot.position, [[0.5, 2.0 + i] for i in range(5)])
+        assert component.GetTransform.call_count == 1
+        assert transform.TransformPoint.call_count == 3
+
+    def test_pad_bbox(self):
+        """Read the pad bounding box once per definition, layer range, component and rotation."""
+        layout = MagicMock()
+        layout.Primitives = []
+        layout.PadstackInstances = [
+            _mock_padstack_instance(1, "SIG", (0.0, 0.0), "TOP", "BOTTOM"),
+            _mock_padstack_instance(2, "SIG", (5.0, 1.0), "TOP", "BOTTOM"),
+            _mock_padstack_instance(3, "SIG", (9.0, 9.0), "TOP", "BOTTOM", rotation=0.5),
+            _mock_padstack_instance(4, "SIG", (7.0, 7.0), "TOP", "BOTTOM", definition="BGA"),
+        ]
+        pads = [(0, 0, 1, 2), (5, 1, 1, 2), (9, 9, 2, 2), (7, 7, 3, 3)]
+        for inst, (x, y, dx, dy) in zip(layout.PadstackInstances, pads):
+            obj_instance = inst.GetLayout.return_value.GetLayoutInstance.return_value.GetLayoutObjInstance.return_value
+            obj_instance.IsNull.return_value = False
+            obj_instance.GetBBox.return_value.Item1 = _mock_point(x - dx, y - dy)
+            obj_instance.GetBBox.return_value.Item2 = _mock_point(x + dx, y + dy)
+        snapshot = LayoutSnapshot(MagicMock(), layout)
+        assert np.allclose(snapshot.pad_bbox, [[-1, -2, 1, 2], [4, -1, 6, 3], [7, 7, 11, 11], [4, 4, 10, 10]])
+        reads = [inst.GetLayout.return_value.GetLayoutInstance.call_count for inst in layout.PadstackInstances]
+        assert reads == [1, 0, 1, 1]
+        assert np.isnan(self.snapshot.pad_bbox[self.snapshot.row(1)]).all()
+
+    def test_empty(self):
+        """Create an empty snapshot."""
+        snapshot = LayoutSnapshot(MagicMock())
+        assert len(snapshot) == 0
+        assert not snapshot.mask(nets="GND").any()
+        assert len(snapshot.to_dataframe()) == 0
@@ -101,3 +101,51 @@ def test_materials_read_materials(mock_file_open, mock_materials_property):
     }
     mats = materials.read_materials("some path")
     assert mats == expected_res
+
+
+def _mock_material_def(name, value=1.0):
+    material_def = MagicMock()
+    material_def.GetName.return_value = name
+    material_def.GetDielectricMaterialModel.return_value = None
+    material_def.GetProperty.return_value = (True, value)
+    return material_def
+
+
+def test_materials_registry_cache():
+    """Build the materials registry once and reset it on material creation and deletion."""
+    edb = MagicMock()
+    material_defs = [_mock_material_def("copper"), _mock_material_def("FR4_epoxy")]
+    edb.active_db.MaterialDefs = material_defs
+    materials = Materials(edb)
+    assert "copper" in materials
+    assert materials["FR4_epoxy"].name == "FR4_epoxy"
+    assert set(materials.materials) == {"copper", "FR4_epoxy"}
+    assert material_defs[0].GetName.call_count == 1
+
+    new_def = _mock_material_def("air")
+    edb.edb_api.definition.MaterialDef.Create.return_value = new_def
+    material_defs.append(new_def)
+    materials.add_material("air", permittivity=1.0)
+    assert "air" in materials
+
+    edb.edb_api.definition.MaterialDef.FindByName.return_value.IsNull.return_value = False
+    material_defs.remove(new_def)
+    materials.delete_material("air")
+    assert "air" not in materials
+
+
+def test_materials_to_dict():
+    """Read the properties of all materials."""
+    edb = MagicMock()
+    edb.active_db.MaterialDefs = [_mock_material_def("copper", 5.8e7), _mock_material_def("FR4_epoxy", 4.4)]
+    materials = Materials(edb)
+    res = materials.to_dict()
+    assert list(res) == ["copper", "FR4_epoxy"]
+    assert res["copper"]["name"] == "copper"
+    assert res["copper"]["conductivity"] == 5.8e7
+    assert res["FR4_epoxy"]["permittivity"] == 4.4
+    assert res["FR4_epoxy"]["dc_conductivity"] is None
+    assert res["copper"] == materials["copper"].to_dict()
+    df = materials.to_dataframe()
+    assert df.loc["FR4_epoxy", "permittivity"] == 4.4
+    assert "dc_permittivity" in df.columns
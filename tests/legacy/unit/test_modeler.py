@@ -0,0 +1,83 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from mock import MagicMock
+import pytest
+
+from pyedb.dotnet.edb_core.cell.layout import Layout
+from pyedb.dotnet.edb_core.modeler import Modeler
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self, mock_edb_layout):
+        self.pedb = MagicMock()
+        self.pedb.layout = Layout(self.pedb, mock_edb_layout)
+        self.pedb.stackup.layers = {"TOP": None, "BOTTOM": None}
+        self.pedb.stackup.non_stackup_layers = {"Outline": None}
+        self.pedb.nets.nets = {"GND": None, "SIG": None, "VCC": None}
+        self.modeler = Modeler(self.pedb)
+
+    @staticmethod
+    def _ids(primitives):
+        return sorted(i.id for i in primitives)
+
+    def test_primitives_by_layer(self):
+        """Group primitives by layer."""
+        by_layer = self.modeler.primitives_by_layer
+        assert list(by_layer) == ["TOP", "BOTTOM", "Outline"]
+        assert self._ids(by_layer["TOP"]) == [1, 2, 3, 5]
+        assert self._ids(by_layer["BOTTOM"]) == [4]
+        assert self._ids(by_layer["Outline"]) == [6]
+
+    def test_primitives_by_net(self):
+        """Group primitives by net."""
+        by_net = self.modeler.primitives_by_net
+        assert self._ids(by_net["GND"]) == [1, 2]
+        assert self._ids(by_net["SIG"]) == [3, 4, 5]
+        assert by_net["VCC"] == []
+
+    def test_polygons_by_layer(self):
+        """Group polygons by layer and filter them by net."""
+        assert self._ids(self.modeler.polygons_by_layer["TOP"]) == [1, 2]
+        assert self._ids(self.modeler.get_polygons_by_layer("TOP", net_list=["SIG"])) == []
+        assert self._ids(self.modeler.get_polygons_by_layer("TOP", net_list=["GND"])) == [1, 2]
+
+    def test_other_groups(self):
+        """Group primitives by type and by layer and net."""
+        assert self._ids(self.modeler.paths) == [3]
+        assert self._ids(self.modeler.rectangles) == [4]
+        assert self._ids(self.modeler.primitives_by_type["Bondwire"]) == [5]
+        assert self._ids(self.modeler.primitives_by_layer_and_net[("TOP", "SIG")]) == [3, 5]
+        assert self._ids(self.modeler.get_primitives(net_name="GND")) == [1]
+        assert self._ids(self.modeler.get_primitives(layer_name="TOP", is_void=True)) == [2]
+
+    def test_cache(self):
+        """Wrap primitives once until the layout changes."""
+        first = self.modeler.primitives_by_layer["TOP"][0]
+        assert self.modeler.primitives_by_net["GND"][0] is first
+        self.modeler.primitives_by_layer["TOP"].clear()
+        assert len(self.modeler.primitives_by_layer["TOP"]) == 4
+        self.pedb.layout._notify_change()
+        assert self.modeler.primitives_by_layer["TOP"][0] is not first
@@ -0,0 +1,193 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from mock import MagicMock
+import numpy as np
+import pytest
+
+from pyedb.dotnet.edb_core.net_graph import ComponentNetGraph, PowerTreeGraph
+from pyedb.dotnet.edb_core.nets import EdbNets
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+COMPONENTS = {
+    # refdes: (type, enabled, rlc values, nets)
+    "U1": (4, False, None, ["VDD", "SIG_A", "GND"]),
+    "R1": (1, True, [0.0, 0.0, 0.0], ["SIG_A", "SIG_B"]),
+    "R2": (1, True, [1000.0, 0.0, 0.0], ["SIG_B", "SIG_C"]),
+    "L1": (2, True, [0.0, 1e-9, 0.0], ["VDD", "VDD_F"]),
+    "C1": (3, True, [0.0, 0.0, 10.0], ["VDD_F", "GND"]),
+    "R3": (1, False, [0.0, 0.0, 0.0], ["SIG_C", "SIG_D"]),
+}
+NETS = ["VDD", "VDD_F", "GND", "SIG_A", "SIG_B", "SIG_C", "SIG_D"]
+
+
+def mock_component(refdes, component_type, enabled, rlc_values):
+    component = MagicMock()
+    component.refdes = refdes
+    component.partname = "PART_{}".format(refdes[0])
+    component.edbcomponent.GetComponentType.return_value = component_type
+    component.component_property.IsEnabled.return_value = enabled
+    component.rlc_values = rlc_values
+    return component
+
+
+def mock_pins(refdes):
+    pins = []
+    for i, net in enumerate(COMPONENTS[refdes][3]):
+        pin = MagicMock()
+        pin.GetName.return_value = str(i + 1)
+        pin.GetNet.return_value.GetName.return_value = net
+        pins.append(pin)
+    return pins
+
+
+@pytest.fixture
+def pedb():
+    pedb = MagicMock()
+    pedb.nets.nets = {name: MagicMock() for name in NETS}
+    pedb.components.instances = {refdes: mock_component(refdes, *values[:3]) for refdes, values in COMPONENTS.items()}
+    pedb.components.get_pin_from_component.side_effect = mock_pins
+    pedb.nets.component_net_graph = ComponentNetGraph(pedb)
+    pedb.nets.power = {"VDD": None, "VDD_F": None, "GND": None}
+    vrm = MagicMock()
+    vrm.component = pedb.components.instances["U1"]
+    pedb.voltage_regulator_modules = {"VRM_1": vrm}
+    pedb.layout.version = 0
+    pedb.layout._component_model_version = 0
+    return pedb
+
+
+def test_incidence(pedb):
+    """Query the component-net incidence."""
+    graph = pedb.nets.component_net_graph
+    assert graph.indptr.tolist() == [0, 3, 5, 7, 9, 11, 13]
+    assert graph.components_on_net("GND") == ["U1", "C1"]
+    assert graph.components_on_nets(["GND", "SIG_A", "NONE"]) == ["U1", "R1", "C1"]
+    assert graph.nets_of_component("U1") == ["VDD", "GND", "SIG_A"]
+    assert graph.shared_nets("U1", "R1") == ["SIG_A"]
+    assert graph.shared_nets("U1", "R2") == []
+    assert graph.net_degrees.tolist() == [2, 2, 2, 2, 2, 2, 1]
+    assert graph.degree("SIG_D") == 1
+    assert graph.degree("NONE") == 0
+
+
+def test_component_values(pedb):
+    """Read the component values once, on first access."""
+    graph = ComponentNetGraph(pedb)
+    assert graph._component_types is None
+    assert graph.component_types.tolist() == [4, 1, 1, 2, 3, 1]
+    assert graph.enabled.tolist() == [False, True, True, True, True, False]
+    assert graph.rlc_values[2].tolist() == [1000.0, 0.0, 0.0]
+    assert np.isnan(graph.rlc_values[0]).all()
+    assert graph.component_nets[0].tolist() == [0, 2, 3]
+
+
+def test_extended_nets(pedb):
+    """Merge nets across the components selected by the thresholds."""
+    graph = ComponentNetGraph(pedb)
+    assert graph.extended_nets() == [["VDD", "VDD_F", "GND"], ["SIG_A", "SIG_B"], ["SIG_C"], ["SIG_D"]]
+    assert graph.extended_nets(resistor_below=1e4, capacitor_above=100) == [
+        ["VDD", "VDD_F"],
+        ["GND"],
+        ["SIG_A", "SIG_B", "SIG_C"],
+        ["SIG_D"],
+    ]
+    # Disabled components never merge nets, even when listed as exceptions.
+    assert graph.extended_nets(exception_list=["R2", "R3", "U1"])[1] == ["SIG_A", "SIG_B", "SIG_C"]
+    assert graph.extended_nets(exception_list=["R2", "R3", "U1"])[2] == ["SIG_D"]
+
+
+def test_threshold_sweep(pedb):
+    """Reuse the groups when the thresholds select the same components."""
+    graph = pedb.nets.component_net_graph
+    groups = graph.extended_nets(resistor_below=10)
+    last_groups = graph._last_groups
+    assert graph.extended_nets(resistor_below=100) == groups
+    assert graph._last_groups is last_groups
+    graph.extended_nets(resistor_below=1e4)
+    assert graph._last_groups is not last_groups
+    for component in pedb.components.instances.values():
+        assert component.edbcomponent.GetComponentType.call_count == 1
+
+
+def test_component_net_graph_cache(pedb):
+    """Rebuild the graph on layout changes and read the values again on model changes."""
+    nets = EdbNets(pedb)
+    nets._nets, nets._nets_version = pedb.nets.nets, 0
+    pedb.nets = nets
+    graph = nets.component_net_graph
+    assert nets.component_net_graph is graph
+    pedb.components.instances["R2"].rlc_values = [1.0, 0.0, 0.0]
+    pedb.layout._component_model_version = 1
+    assert nets.component_net_graph is graph
+    assert graph.rlc_values[2, 0] == 1.0
+    pedb.layout.version = nets._nets_version = 1
+    assert nets.component_net_graph is not graph
+
+
+def test_power_tree_rails(pedb):
+    """Join rails through series inductors and low value resistors."""
+    power_trees = PowerTreeGraph(pedb, ["GND"])
+    assert power_trees.rails == [{"VDD", "VDD_F"}, {"SIG_A", "SIG_B"}, {"SIG_C", "SIG_D"}]
+    assert power_trees.rail_of("VDD_F") == ["VDD", "VDD_F"]
+    assert power_trees.rail_of("GND") == ["GND"]
+    assert power_trees.vrms == {"U1": "VRM_1"}
+    assert [power_trees.role(refdes) for refdes in ["U1", "L1", "C1"]] == ["vrm", "series", "load"]
+
+
+def test_power_trees(pedb):
+    """Return the power trees of all the rails from a single pin scan."""
+    power_trees = PowerTreeGraph(pedb, ["GND"])
+    component_list, columns, net_group = power_trees.power_tree("VDD")
+    assert columns == ["refdes", "pin_name", "net_name", "component_type", "component_partname", "pin_list"]
+    assert net_group == ["VDD", "VDD_F"]
+    assert component_list == [
+        ["U1", "1", "VDD", "IC", "PART_U", "1"],
+        ["L1", "1", "VDD", "Inductor", "PART_L", "1"],
+        ["L1", "2", "VDD_F", "Inductor", "PART_L", "2"],
+        ["C1", "1", "VDD_F", "Capacitor", "PART_C", "1"],
+    ]
+    assert list(power_trees.power_trees()) == ["VDD"]
+    assert power_trees.to_adjacency()["VDD"] == {
+        "VDD": ["U1", "L1"],
+        "VDD_F": ["L1", "C1"],
+        "U1": ["VDD"],
+        "L1": ["VDD", "VDD_F"],
+        "C1": ["VDD_F"],
+    }
+    df = power_trees.to_dataframe(["VDD", "SIG_B"])
+    assert df["rail"].unique().tolist() == ["VDD", "SIG_B"]
+    assert df[df["rail"] == "VDD"]["role"].tolist() == ["vrm", "series", "series", "load"]
+    assert pedb.components.get_pin_from_component.call_count == len(COMPONENTS)
+
+
+def test_nets_by_components(pedb):
+    """Derive the component and net maps from the incidence."""
+    nets = EdbNets(pedb)
+    nets._nets, nets._nets_version = pedb.nets.nets, 0
+    nets._component_net_graph = pedb.nets.component_net_graph
+    nets._component_net_graph_version = (0, 0)
+    assert nets.nets_by_components["R1"] == ["SIG_A", "SIG_B"]
+    assert nets.components_by_nets["VDD_F"] == ["L1", "C1"]
+    # Accessing the maps again does not duplicate their entries.
+    assert nets.components_by_nets["VDD_F"] == ["L1", "C1"]
@@ -0,0 +1,93 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from collections import OrderedDict
+
+from mock import MagicMock
+import numpy as np
+import pytest
+
+from pyedb.dotnet.edb_core.cell.layout_snapshot import LayoutSnapshot
+from pyedb.dotnet.edb_core.nets import EdbNets
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self, mock_edb_layout):
+        self.pedb = MagicMock()
+        self.pedb.layout.version = 0
+        self.pedb.layout.snapshot = LayoutSnapshot(self.pedb, mock_edb_layout)
+        self.pedb.stackup.signal_layers = OrderedDict((name, MagicMock()) for name in ["TOP", "MID", "BOTTOM"])
+        self.nets = EdbNets(self.pedb)
+        self.nets._nets = {"GND": MagicMock(), "SIG": MagicMock(), "PWR": MagicMock()}
+        self.nets._nets_version = 0
+
+    def test_path_geometry(self):
+        """Read the path geometry on first access."""
+        snapshot = self.pedb.layout.snapshot
+        assert snapshot._width is None
+        row = snapshot.row(3)
+        assert snapshot.width[row] == 1.0
+        assert snapshot.length[row] == 10.0
+        assert np.isnan(snapshot.length[snapshot.row(1)])
+
+    def test_metrics(self):
+        """Aggregate the net metrics in one table."""
+        df = self.nets.metrics()
+        assert df.index.tolist() == ["GND", "SIG", "PWR"]
+        assert df.loc["SIG", "length"] == 10.0
+        assert df.loc["SIG", "length_TOP"] == 10.0
+        assert df.loc["SIG", "length_BOTTOM"] == 0.0
+        assert df.loc["SIG", "min_width"] == df.loc["SIG", "max_width"] == 1.0
+        assert np.isnan(df.loc["GND", "min_width"])
+        assert df.loc["GND", "area"] == 96.0
+        assert df.loc["SIG", "area"] == 35.0
+        assert df["via_count"].tolist() == [1, 1, 0]
+        assert df["layer_transitions"].tolist() == [2, 2, 0]
+        assert df["component_count"].tolist() == [0, 1, 0]
+        assert self.nets.metrics("GND").index.tolist() == ["GND"]
+
+    def test_delete_many(self):
+        """Delete the nets with their primitives and padstack instances in bulk."""
+        self.pedb.modeler.delete_many.return_value = {"count": 3}
+        self.pedb.padstacks.delete_many.return_value = {"count": 1}
+        self.nets._nets["SIG"].name = "SIG"
+        report = self.nets.delete_many(["SIG", "NONE", self.nets.nets["SIG"]])
+        assert report["count"] == 1
+        assert report["primitives"] == 3
+        assert report["padstack_instances"] == 1
+        assert report["not_found"] == ["NONE"]
+        assert self.pedb.modeler.delete_many.call_args.args[0] == [3, 4, 5]
+        assert self.pedb.padstacks.delete_many.call_args.args[0] == [11]
+        self.nets._nets["SIG"].net_object.Delete.assert_called_once()
+        self.nets._nets["GND"].net_object.Delete.assert_not_called()
+        self.pedb.layout._notify_change.assert_called_once_with(created=[], deleted=[])
+
+    def test_delete_many_keep_objects(self):
+        """Rebuild the layout indexes when the objects of the deleted nets are kept."""
+        self.nets._nets["SIG"].name = "SIG"
+        report = self.nets.delete_many(["SIG"], delete_objects=False)
+        assert report["count"] == 1
+        self.pedb.modeler.delete_many.assert_not_called()
+        self.pedb.layout._notify_change.assert_called_once_with()
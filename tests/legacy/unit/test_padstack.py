@@ -23,6 +23,7 @@
 from mock import MagicMock, PropertyMock, patch
 import pytest
 
+from pyedb.dotnet.edb_core.cell.layout_snapshot import LayoutSnapshot
 from pyedb.dotnet.edb_core.padstack import EdbPadstacks
 
 pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
@@ -54,3 +55,22 @@ class TestClass:
         self.padstacks.check_and_fix_via_plating()
         assert self.padstacks["definition_0"].hole_plating_ratio == 0.2
         assert self.padstacks["definition_1"].hole_plating_ratio == 0.3
+
+    def test_get_instance_arrays(self, mock_edb_layout):
+        """Get padstack instance placement arrays."""
+        pedb = MagicMock()
+        pedb.layout.snapshot = LayoutSnapshot(pedb, mock_edb_layout)
+        pedb.stackup.layers = {"TOP": MagicMock(), "MID": MagicMock(), "BOTTOM": MagicMock()}
+        padstacks = EdbPadstacks(pedb)
+        arrays = padstacks.get_instance_arrays()
+        assert arrays["id"].tolist() == [10, 11]
+        assert arrays["x"].tolist() == [1.0, 6.0]
+        assert arrays["y"].tolist() == [1.0, 21.0]
+        assert arrays["start_layer_index"].tolist() == [0, 0]
+        assert arrays["stop_layer_index"].tolist() == [2, 2]
+        assert arrays["component_id"].tolist() == [-1, 0]
+        assert arrays["component_names"] == ["U1"]
+        assert [arrays["net_names"][i] for i in arrays["net_id"]] == ["GND", "SIG"]
+        assert padstacks.get_instance_arrays(nets="SIG")["id"].tolist() == [11]
+        assert padstacks.get_instance_arrays(layers="MID")["id"].tolist() == [10, 11]
+        assert padstacks.get_instance_arrays(nets="GND", layers="Outline")["id"].tolist() == []
@@ -0,0 +1,99 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from mock import MagicMock, PropertyMock, patch
+import numpy as np
+import pytest
+
+from pyedb.dotnet.edb_core.cell.layout_snapshot import LayoutSnapshot
+from pyedb.dotnet.edb_core.cell.pin_locator import PinLocator
+from pyedb.dotnet.edb_core.padstack import EdbPadstacks
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+# Four pins at the same distance of the origin, and a farther one.
+IDS = [7, 3, 5, 1, 9]
+POSITIONS = [[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0], [3.0, 0.0]]
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self):
+        self.locator = PinLocator(IDS, POSITIONS)
+
+    def test_nearest(self):
+        """Break distance ties by ID."""
+        ids, distances = self.locator.query([[0.0, 0.0], [2.9, 0.0]], k=2)
+        assert ids[0].tolist() == [1, 3]
+        assert distances[0].tolist() == [1.0, 1.0]
+        assert ids[1].tolist() == [9, 7]
+        assert np.allclose(distances[1], [0.1, 1.9])
+
+    def test_radius(self):
+        """Return all the pins within a radius, by distance then ID."""
+        ids, _ = self.locator.query_radius([[0.0, 0.0]], 1.0)
+        assert ids[0].tolist() == [1, 3, 5, 7]
+        ids, _ = self.locator.query([[2.0, 0.0]], k=1, radius=0.5)
+        assert ids[0].tolist() == []
+        ids, _ = self.locator.query([[2.0, 0.0]], k=3, radius=1.0)
+        assert ids[0].tolist() == [7, 9]
+
+    def test_matches_brute_force(self):
+        """Match a brute force search on random pins."""
+        rng = np.random.default_rng(0)
+        positions = rng.integers(0, 20, size=(500, 2)).astype(float) * 1e-4
+        locator = PinLocator(np.arange(500), positions)
+        points = rng.random((50, 2)) * 2e-3
+        ids, _ = locator.query(points, k=5, radius=5e-4)
+        for point, point_ids in zip(points, ids):
+            distances = np.hypot(*(positions - point).T)
+            expected = np.lexsort((np.arange(500), distances))
+            expected = expected[distances[expected] <= 5e-4][:5]
+            assert point_ids.tolist() == expected.tolist()
+
+    def test_empty(self):
+        """Query a locator without pins."""
+        ids, distances = PinLocator([], []).query([[0.0, 0.0]], k=1)
+        assert ids[0].tolist() == []
+        with pytest.raises(ValueError):
+            self.locator.query([[0.0, 0.0]], k=0)
+
+    @patch("pyedb.dotnet.edb_core.padstack.EdbPadstacks.instances", new_callable=PropertyMock)
+    def test_get_reference_pins(self, mock_instances, mock_edb_layout):
+        """Search reference pins with a locator cached per net and component."""
+        pedb = MagicMock()
+        pedb.layout.version = 0
+        pedb.layout.snapshot = LayoutSnapshot(pedb, mock_edb_layout)
+        pedb.value_to_float.side_effect = float
+        mock_instances.return_value = {10: "pin_10", 11: "pin_11"}
+        padstacks = EdbPadstacks(pedb)
+        positive_pin = MagicMock(id=11)
+        positive_pin.component.refdes = "U1"
+        assert padstacks.get_reference_pins(positive_pin, "GND", 25.0, component_only=False) == ["pin_10"]
+        assert padstacks.get_reference_pins(positive_pin, "GND", 5.0, component_only=False) == []
+        assert padstacks.get_reference_pins(positive_pin, "GND", "25.0", component_only=True) == []
+        assert len(padstacks._pin_locators) == 2
+        assert padstacks.get_pin_locator("GND") is padstacks.get_pin_locator(["GND"])
+        assert len(padstacks.get_pin_locator("SIG", component="U1")) == 1
+        pedb.layout.version = 1
+        assert len(padstacks.get_pin_locator("SIG")) == 1
+        assert len(padstacks._pin_locators) == 1
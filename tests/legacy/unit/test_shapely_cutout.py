@@ -0,0 +1,195 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from types import SimpleNamespace
+
+from mock import MagicMock
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import Polygon, box
+
+from pyedb.dotnet.edb_core.shapely_cutout import (
+    INSIDE,
+    OUTSIDE,
+    PARTIAL,
+    ShapelyCutout,
+    arc_point_count,
+    classify_padstack_instances,
+    polygon_data_to_shapely,
+    shapely_to_point_lists,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+
+def mock_point(x, y, arc_height=None):
+    point = MagicMock()
+    point.X.ToDouble.return_value = x
+    point.Y.ToDouble.return_value = y
+    point.IsArc.return_value = arc_height is not None
+    point.GetArcHeight.return_value.ToDouble.return_value = arc_height or 0.0
+    return point
+
+
+def mock_polygon_data(points, holes=()):
+    polygon_data = MagicMock()
+    polygon_data.Points = [mock_point(*point) for point in points]
+    polygon_data.Holes = [mock_polygon_data(hole) for hole in holes]
+    return polygon_data
+
+
+def mock_primitive(obj_id, outline, voids=()):
+    prim = MagicMock()
+    prim.id = obj_id
+    prim.layer_name = "TOP"
+    prim.net_name = "GND"
+    prim._edb_object.GetPolygonData.return_value = mock_polygon_data(outline)
+    edb_voids = []
+    for void in voids:
+        edb_void = MagicMock()
+        edb_void.GetPolygonData.return_value = mock_polygon_data(void)
+        edb_voids.append(edb_void)
+    prim._edb_object.Voids = edb_voids
+    return prim
+
+
+def square(x0, y0, x1, y1):
+    return [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self):
+        self.prims = [
+            mock_primitive(1, square(1, 1, 2, 2)),
+            mock_primitive(2, square(20, 20, 30, 30)),
+            mock_primitive(3, square(5, 5, 15, 15), voids=[square(6, 6, 7, 7)]),
+            # Triangle whose bounding box crosses the extent but the outline does not.
+            mock_primitive(4, [(11, 0), (20, 0), (20, 9)]),
+        ]
+        bboxes = {}
+        for prim in self.prims:
+            bboxes[prim.id] = shapely.bounds(polygon_data_to_shapely(prim._edb_object.GetPolygonData()))
+            prim._edb_object.GetPolygonData.reset_mock()
+        bboxes[10] = [3.0, 3.0, 3.0, 3.0]
+        bboxes[11] = [12.0, 3.0, 12.0, 3.0]
+        pad_bboxes = {10: [2.0, 2.0, 4.0, 4.0], 11: [11.0, 2.0, 13.0, 4.0], 12: [9.0, 2.0, 11.0, 4.0]}
+        bboxes[12] = [10.0, 3.0, 10.0, 3.0]
+        ids = sorted(bboxes)
+        snapshot = SimpleNamespace(
+            bbox=np.array([bboxes[i] for i in ids], dtype=float),
+            position=np.array([bboxes[i][:2] for i in ids], dtype=float),
+            pad_bbox=np.array([pad_bboxes.get(i, [np.nan] * 4) for i in ids], dtype=float),
+            row=lambda obj_id: ids.index(obj_id) if obj_id in ids else -1,
+        )
+        self.pedb = MagicMock()
+        self.pedb.layout.snapshot = snapshot
+        self.cutout = ShapelyCutout(self.pedb, box(0, 0, 10, 10), number_of_threads=2)
+
+    def test_polygon_data_to_shapely(self):
+        """Convert an EDB polygon with arcs and holes."""
+        polygon_data = mock_polygon_data(square(0, 0, 2, 2), holes=[square(0.5, 0.5, 1, 1)])
+        polygon = polygon_data_to_shapely(polygon_data)
+        assert polygon.area == pytest.approx(3.75)
+        polygon_data.Points.insert(2, mock_point(2.5, 1, arc_height=-0.5))
+        polygon_data.Holes = []
+        assert polygon_data_to_shapely(polygon_data).area > 4.0
+        assert polygon_data_to_shapely(mock_polygon_data([(0, 0), (1, 1)])).is_empty
+
+    def test_classify_bounding_boxes(self):
+        """Classify boxes inside, outside and crossing the extent, boxes without geometry being kept."""
+        inside, outside, crossing = self.cutout.classify_bounding_boxes(
+            [[1, 1, 2, 2], [20, 20, 30, 30], [5, 5, 15, 15], [np.nan] * 4]
+        )
+        assert inside.tolist() == [True, False, False, True]
+        assert outside.tolist() == [False, True, False, False]
+        assert crossing.tolist() == [False, False, True, False]
+
+    def test_padstack_instances_to_delete(self):
+        """Delete the padstack instances positioned outside of the extent, or with a partial pad."""
+        pins = [SimpleNamespace(id=i) for i in (10, 11, 12)] + [SimpleNamespace(id=13, position=[1.0, 1.0])]
+        assert [pin.id for pin in self.cutout.padstack_instances_to_delete(pins)] == [11]
+        to_delete = self.cutout.padstack_instances_to_delete(pins, simple_check=False)
+        assert [pin.id for pin in to_delete] == [11, 12]
+        to_delete = self.cutout.padstack_instances_to_delete(pins, include_partial=True, simple_check=False)
+        assert [pin.id for pin in to_delete] == [11]
+
+    def test_classify_padstack_instances(self):
+        """Classify positions and pads against an extent with a hole, matching a per-instance check."""
+        extent = box(0, 0, 10, 10).difference(box(4, 4, 6, 6))
+        rng = np.random.default_rng(1)
+        positions = rng.random((300, 2)) * 12 - 1
+        pad_bboxes = np.hstack([positions - 0.3, positions + 0.3])
+        flags = classify_padstack_instances(extent, positions, pad_bboxes)
+        for position, pad_bbox, flag in zip(positions, pad_bboxes, flags):
+            if not extent.intersects(shapely.Point(position)):
+                assert flag == OUTSIDE
+            elif extent.contains_properly(box(*pad_bbox)):
+                assert flag == INSIDE
+            else:
+                assert flag == PARTIAL
+        assert (flags == PARTIAL).any()
+        simple = classify_padstack_instances(extent, positions)
+        assert ((simple == INSIDE) == (flags != OUTSIDE)).all()
+        assert classify_padstack_instances(extent, [[5.0, 1.0]], [[np.nan] * 4]).tolist() == [INSIDE]
+
+    def test_arc_point_count(self):
+        """Discretize arcs within a tolerance."""
+        # Half circle of radius 1.
+        n = arc_point_count([-1.0, 0.0], [1.0, 0.0], 1.0, 1e-3)
+        assert n + 1 == pytest.approx(np.pi / (2 * np.arccos(1 - 1e-3)), abs=1)
+        assert arc_point_count([-1.0, 0.0], [1.0, 0.0], 1.0, 1e-5) > n
+        assert arc_point_count([-1.0, 0.0], [1.0, 0.0], 1.0, 10.0) == 1
+        polygon_data = mock_polygon_data([(-1, 0), (0, -1), (1, 0)])
+        polygon_data.Points.insert(3, mock_point(0, 0, arc_height=-1.0))
+        assert polygon_data_to_shapely(polygon_data, 1e-6).area == pytest.approx(np.pi / 2 + 1, rel=1e-5)
+
+    def test_plan_primitives(self):
+        """Keep, delete or clip primitives, reading only the ones crossing the extent."""
+        to_delete, to_clip, to_create, paths = self.cutout.plan_primitives(self.prims)
+        assert sorted(prim.id for prim in to_delete) == [2, 4]
+        assert [prim.id for prim in to_clip] == [3]
+        assert paths == []
+        assert not self.prims[0]._edb_object.GetPolygonData.called
+        assert not self.prims[1]._edb_object.GetPolygonData.called
+        assert len(to_create) == 1
+        outline, holes, layer_name, net_name = to_create[0]
+        assert (layer_name, net_name) == ("TOP", "GND")
+        clipped = Polygon(outline, holes)
+        assert clipped.area == pytest.approx(24.0)
+        assert clipped.equals(box(5, 5, 10, 10).difference(box(6, 6, 7, 7)))
+
+    def test_plan_paths(self):
+        """Delete the paths outside of the extent and return the ones crossing it for EDB clipping."""
+        to_delete, to_clip, to_create, paths = self.cutout.plan_primitives([], self.prims[:3])
+        assert [prim.id for prim in to_delete] == [2]
+        assert [prim.id for prim in paths] == [3]
+        assert to_clip == to_create == []
+
+    def test_shapely_to_point_lists(self):
+        """Split multipolygons and drop degenerated parts."""
+        line = shapely.LineString([(0, 0), (1, 1)])
+        geometry = shapely.GeometryCollection([box(0, 0, 1, 1), box(2, 2, 3, 3), line])
+        polygons = shapely_to_point_lists(geometry)
+        assert len(polygons) == 2
+        assert all(len(outline) == 4 and holes == [] for outline, holes in polygons)
@@ -0,0 +1,101 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from mock import MagicMock
+import pytest
+
+from pyedb.dotnet.edb_core.cell.layout import Layout
+from pyedb.dotnet.edb_core.cell.layout_snapshot import LayoutSnapshot
+from pyedb.dotnet.edb_core.cell.spatial_index import LayoutSpatialIndex
+from pyedb.dotnet.edb_core.edb_data.padstacks_data import EDBPadstackInstance
+from pyedb.dotnet.edb_core.padstack import EdbPadstacks
+from tests.legacy.unit.conftest import (
+    _mock_padstack_instance,
+    _mock_point,
+    _mock_primitive,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def init(self, mock_edb_layout):
+        snapshot = LayoutSnapshot(MagicMock(), mock_edb_layout)
+        self.index = LayoutSpatialIndex(snapshot, ["TOP", "INNER", "BOTTOM"])
+
+    def test_bulk_load(self):
+        """Index every object with a bounding box."""
+        assert len(self.index) == 7
+        assert 5 not in self.index
+        assert self.index.bounding_box(11) == [6.0, 21.0, 6.0, 21.0]
+        assert self.index.bounding_box(5) is None
+
+    def test_intersection(self):
+        """Query a bounding box with net, layer and type filters."""
+        assert sorted(self.index.intersection([0.5, 0.5, 1.5, 1.5])) == [1, 4, 6, 10]
+        assert sorted(self.index.intersection([0.5, 0.5, 1.5, 1.5], nets="GND")) == [1, 10]
+        assert sorted(self.index.intersection([0.5, 0.5, 1.5, 1.5], layers="BOTTOM")) == [4, 10]
+        assert self.index.intersection([0.5, 0.5, 1.5, 1.5], layers="INNER") == [10]
+        assert self.index.intersection([0, 0, 10, 30], types="PadstackInstance", nets=["SIG"]) == [11]
+        with pytest.raises(ValueError):
+            self.index.intersection([0, 0, 1])
+
+    def test_update(self):
+        """Insert and delete objects in place."""
+        assert self.index.insert(_mock_primitive(20, "Rectangle", "SIG", "TOP", (100.0, 100.0, 101.0, 101.0), 1.0))
+        assert self.index.intersection([100, 100, 100.5, 100.5]) == [20]
+        assert not self.index.insert(_mock_primitive(21, "Bondwire", "SIG", "TOP"))
+        assert self.index.delete(20)
+        assert not self.index.delete(20)
+        assert self.index.intersection([100, 100, 100.5, 100.5]) == []
+        assert 1 in self.index
+        self.index.delete(1)
+        assert sorted(self.index.intersection([0.5, 0.5, 1.5, 1.5])) == [4, 6, 10]
+
+    def test_insert_component_pin(self, mock_edb_layout):
+        """Insert a component pin at its position in layout coordinates."""
+        component = mock_edb_layout.PadstackInstances[1].GetComponent()
+        assert self.index.insert(_mock_padstack_instance(30, "SIG", (7.0, 20.0), "TOP", "BOTTOM", component=component))
+        assert self.index.bounding_box(30) == [6.0, 21.0, 6.0, 21.0]
+
+    def test_empty(self):
+        """Create an empty index."""
+        index = LayoutSpatialIndex()
+        assert len(index) == 0
+        assert index.intersection([0, 0, 1, 1]) == []
+
+    def test_move_padstack_instance(self, mock_edb_layout):
+        """Query the new position of a padstack instance moved through pyedb."""
+        pedb = MagicMock()
+        pedb.layout = Layout(pedb, mock_edb_layout)
+        pedb.edb_value.side_effect = lambda value: value
+        pedb.edb_api.geometry.point_data.side_effect = _mock_point
+        edb_instance = mock_edb_layout.PadstackInstances[0]
+        edb_instance.SetPositionAndRotation.side_effect = lambda point, rotation: edb_instance.configure_mock(
+            **{"GetPositionAndRotationValue.return_value": (True, point, MagicMock())}
+        )
+        padstacks = EdbPadstacks(pedb)
+        assert padstacks.get_padstack_instances_intersecting_bounding_box([0.5, 0.5, 1.5, 1.5]) == [10]
+        EDBPadstackInstance(edb_instance, pedb).position = [50.0, 50.0]
+        assert padstacks.get_padstack_instances_intersecting_bounding_box([0.5, 0.5, 1.5, 1.5]) == []
+        assert padstacks.get_padstack_instances_intersecting_bounding_box([49.0, 49.0, 51.0, 51.0]) == [10]
@@ -110,3 +110,43 @@ class TestClass:
         assert self.stackup.get_layout_thickness() == 42
         mock_stackup_layers.return_value = {"layer": MagicMock(upper_elevation=0, lower_elevation=0)}
         assert self.stackup.get_layout_thickness() == 0
+
+    @patch("pyedb.dotnet.edb_core.stackup.layer_cast")
+    def test_layers_cache(self, mock_layer_cast):
+        """Evaluate the layer cache and its invalidation on layer collection changes."""
+        pedb = MagicMock()
+        pedb.layout._layer_collection_version = 0
+        signal, dielectric = pedb.edb_api.cell.layer_type.SignalLayer, pedb.edb_api.cell.layer_type.DielectricLayer
+
+        def edb_layer(name, layer_type, is_stackup=True):
+            layer = MagicMock()
+            layer.GetName.return_value = name
+            layer.GetLayerType.return_value = layer_type
+            layer.IsStackupLayer.return_value = is_stackup
+            return layer
+
+        layers = [edb_layer("TOP", signal), edb_layer("DE1", dielectric), edb_layer("BOTTOM", signal)]
+        layers.append(edb_layer("Outline", MagicMock(), is_stackup=False))
+        pedb.edb_api.cell._cell.LayerCollection.return_value.Layers.return_value = layers
+        mock_layer_cast.side_effect = lambda _, i: self._layer_wrapper(i)
+        stackup = Stackup(pedb)
+        assert list(stackup.all_layers) == ["TOP", "DE1", "BOTTOM", "Outline"]
+        assert list(stackup.layers) == ["TOP", "DE1", "BOTTOM"]
+        assert list(stackup.signal_layers) == ["TOP", "BOTTOM"]
+        assert list(stackup.dielectric_layers) == ["DE1"]
+        assert list(stackup.non_stackup_layers) == ["Outline"]
+        assert stackup.layer_table["TOP"]["material"] == "copper"
+        assert stackup.layer_table["Outline"]["thickness"] is None
+        assert mock_layer_cast.call_count == 4
+
+        stackup.layers.pop("TOP")
+        assert "TOP" in stackup.layers
+        pedb.layout._layer_collection_version += 1
+        assert list(stackup.layers) == ["TOP", "DE1", "BOTTOM"]
+        assert mock_layer_cast.call_count == 8
+
+    @staticmethod
+    def _layer_wrapper(edb_layer):
+        layer = MagicMock(type="signal", lower_elevation=0.0, upper_elevation=1.0, thickness=1.0, material="copper")
+        layer.name = edb_layer.GetName()
+        return layer
@@ -0,0 +1,90 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from mock import MagicMock
+import pytest
+
+from pyedb.dotnet.edb import Edb
+from pyedb.dotnet.edb_core.components import resistor_value_parser
+from pyedb.generic.data_handlers import from_rkm
+from pyedb.generic.value_parser import parse_value, parse_value_string
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_licence, pytest.mark.legacy]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("0.1mm", 1e-4),
+        ("3.3V", 3.3),
+        ("10nH", 1e-8),
+        ("2.2uF", 2.2e-6),
+        ("1.5GHz", 1.5e9),
+        ("10mil", 2.54e-4),
+        ("4.7kOhm", 4700.0),
+        (" -.5 um ", -5e-7),
+        ("1e-3", 1e-3),
+        (25, 25.0),
+        (0.5, 0.5),
+    ],
+)
+def test_parse_value(value, expected):
+    """Parse numbers and value strings with units."""
+    assert parse_value(value) == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("value", ["$width", "2*3mm", "width+1mm", "1m", "5unknown", "", True, None])
+def test_parse_value_needs_edb(value):
+    """Leave expressions, variables and ambiguous units to EDB."""
+    assert parse_value(value) is None
+
+
+def test_parse_value_cache():
+    """Cache parsed value strings."""
+    parse_value_string.cache_clear()
+    parse_value("12.5mil")
+    parse_value("12.5mil")
+    assert parse_value_string.cache_info().hits == 1
+
+
+def test_number_with_units_round_trip():
+    """Parse values formatted by ``Edb.number_with_units``."""
+    for value, units, scale in [(0.25, "mm", 1e-3), (3, "mil", 2.54e-5), (1.2, "GHz", 1e9)]:
+        assert parse_value(Edb.number_with_units(None, value, units)) == pytest.approx(value * scale)
+
+
+def test_value_to_float():
+    """Evaluate with EDB only values which cannot be parsed."""
+    edb = MagicMock()
+    edb.edb_value.return_value.ToDouble.return_value = 42.0
+    assert Edb.value_to_float(edb, "1mm") == pytest.approx(1e-3)
+    assert not edb.edb_value.called
+    assert Edb.value_to_float(edb, "$width") == 42.0
+    edb.edb_value.assert_called_once_with("$width")
+
+
+def test_resistor_value_parser():
+    """Parse resistor values, including RKM codes."""
+    assert resistor_value_parser("4.7kOhm") == 4700.0
+    assert resistor_value_parser("10") == 10.0
+    assert resistor_value_parser(from_rkm("4K7")) == pytest.approx(4700.0)
+    assert resistor_value_parser(from_rkm("R47")) == 0.47